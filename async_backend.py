@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+비동기 브라우저 백엔드 (Playwright asyncio, 선택 설치)
+
+Selenium 호출은 동기식이라 V4를 늘리려면 프로세스(--workers)를 늘리는 수밖에 없었음.
+이 백엔드는 프로세스 하나에서 브라우저 하나 + 페이지 여러 개를 동시에 처리:
+- extract_photos_from_url과 같은 단계: 페이지 로드 → 사진 탭 찾기 → '업체' 카테고리 → 스크롤 → 수집
+- 페이지 안 스크립트(DOM 수집 / 선택자 탐색 / 대기 조건)는 Selenium 경로와 같은 것을 사용
+- 원본 크기 변환(canonical_urls), 폴더 구조 / 파일명(create_folder_structure, download_photos)도 공유
+  → --backend selenium / playwright를 바꿔도 결과 폴더는 같음
+- 실패 분류(FailureTracker) / 체크포인트 기록 / 매장 제한 시간 초과 재시도도 Selenium 경로와 같은 규칙
+- 동시 페이지 수: --async-pages N
+
+설치 (선택):
+    pip install playwright
+    playwright install chromium
+"""
+
+import asyncio
+import time
+
+import pandas as pd
+
+try:
+    from playwright.async_api import async_playwright
+except ImportError:
+    async_playwright = None
+
+from browser_options import CHROME_USER_AGENT
+from checkpoint_ledger import row_key, PHASE_LINK_FILE
+from click_probe import PROBE_SCRIPT, PHOTO_TAB_STRATEGIES, COMPANY_CATEGORY_STRATEGIES
+from dom_harvester import CDN_DOMAINS, HARVEST_SCRIPT, canonical_urls
+from failure_classes import FailureTracker, LABELS, DEAD_LINK, NAVIGATION_TIMEOUT, SELECTOR_MISS
+from rate_limiter import PAGE_STATE_SCRIPT, PAGE_MARKERS, page_state
+from store_watchdog import store_label
+from wait_engine import PAGE_IFRAME_READY_SCRIPT, GRID_SIGNATURE_SCRIPT
+
+BACKENDS = ['selenium', 'playwright']
+DEFAULT_ASYNC_PAGES = 4
+
+SCROLL_HEIGHT_SCRIPT = "return document.body ? document.body.scrollHeight : 0;"
+SCROLL_TO_BOTTOM_SCRIPT = "window.scrollTo(0, document.body.scrollHeight);"
+
+
+def add_backend_arguments(parser):
+    """브라우저 백엔드 관련 CLI 옵션 추가"""
+    parser.add_argument('--backend', choices=BACKENDS, default='selenium',
+                        help='브라우저 백엔드: selenium / playwright (비동기, 선택 설치) (기본: selenium)')
+    parser.add_argument('--async-pages', type=int, default=DEFAULT_ASYNC_PAGES,
+                        help=f'playwright 백엔드에서 동시에 처리할 페이지 수 (기본: {DEFAULT_ASYNC_PAGES})')
+
+
+# 도구 생성자 옵션 기본값 (backend_options_from_args와 같은 키)
+BACKEND_DEFAULTS = {'backend': 'selenium', 'async_pages': DEFAULT_ASYNC_PAGES}
+
+
+def backend_options_from_args(args):
+    """CLI 인자에서 도구 생성자용 백엔드 옵션 추출"""
+    return {
+        'backend': args.backend,
+        'async_pages': args.async_pages
+    }
+
+
+def playwright_available():
+    """playwright 패키지 설치 여부"""
+    return async_playwright is not None
+
+
+def _wrap(script):
+    """Selenium execute_script용 스크립트(arguments[n] / return)를 Playwright evaluate용 함수로 변환"""
+    return "(args) => (function() {\n" + script + "\n}).apply(null, args)"
+
+
+async def evaluate(frame, script, *args):
+    """프레임에서 Selenium 형식 스크립트 실행"""
+    return await frame.evaluate(_wrap(script), list(args))
+
+
+async def poll(frame, script, args=(), timeout=10, interval=0.2, changed_from=None):
+    """스크립트 결과가 참(또는 changed_from과 다른 참 값)이 될 때까지 대기 - 결과 또는 None"""
+    deadline = time.time() + timeout
+    while True:
+        try:
+            result = await evaluate(frame, script, *args)
+            if result and result != changed_from:
+                return result
+        except Exception:
+            pass
+        if time.time() >= deadline:
+            return None
+        await asyncio.sleep(interval)
+
+
+class AsyncPhotoBackend:
+    """V4 도구 인스턴스의 설정 / 통계 / 저장 메서드를 그대로 쓰는 비동기 추출기"""
+
+    def __init__(self, tool, photo_page_url, pages=DEFAULT_ASYNC_PAGES):
+        self.tool = tool
+        # 장소 ID로 바로 여는 사진 탭 페이지 주소 형식 ({place_id})
+        self.photo_page_url = photo_page_url
+        self.pages = max(1, pages)
+        self.done = 0
+        # 매장 제한 시간을 넘긴 (행 번호, 행) - 본 처리 후 tool.watchdog.retries번까지 재시도
+        self.retry_queue = []
+
+    def run(self, rows):
+        """(행 번호, 행) 목록 처리"""
+        if not playwright_available():
+            print("❌ playwright 백엔드를 쓰려면 설치가 필요합니다: pip install playwright && playwright install chromium")
+            return
+        asyncio.run(self._run(list(rows)))
+
+    async def _run(self, rows):
+        tool = self.tool
+        print(f"⚡ 비동기 백엔드 (playwright): 동시 페이지 {self.pages}개\n")
+
+        async with async_playwright() as playwright:
+            if tool.attach:
+                browser = await playwright.chromium.connect_over_cdp(f"http://{tool.attach}")
+            else:
+                browser = await playwright.chromium.launch(headless=tool.headless)
+            context = await browser.new_context(user_agent=CHROME_USER_AGENT, locale='ko-KR',
+                                                viewport={'width': 1920, 'height': 1080})
+            await context.route('**/*', self._route)
+
+            semaphore = asyncio.Semaphore(self.pages)
+
+            async def guarded(idx, row):
+                async with semaphore:
+                    await self.process_store(context, idx, row)
+
+            try:
+                await asyncio.gather(*(guarded(idx, row) for idx, row in rows))
+                await self._run_retries(guarded)
+            finally:
+                await context.close()
+                if not tool.attach:
+                    await browser.close()
+
+    async def _run_retries(self, guarded):
+        """시간 초과 매장 재시도 (StoreWatchdog.run_retries와 같은 규칙)"""
+        tool = self.tool
+        for attempt in range(1, tool.watchdog.retries + 1):
+            if not self.retry_queue:
+                break
+            queue, self.retry_queue = self.retry_queue, []
+            print(f"\n🔁 시간 초과 매장 재시도 ({attempt}/{tool.watchdog.retries}): {len(queue)}개")
+            await asyncio.gather(*(guarded(idx, row) for idx, row in queue))
+
+        for idx, row in self.retry_queue:
+            tool.stats['timed_out'] += 1
+            tool.stats['timed_out_stores'].append(store_label(row))
+        self.retry_queue = []
+
+    async def _route(self, route):
+        """요청 차단 프리셋 / 이미지 차단 적용 (Selenium 경로의 RequestBlocker와 같은 패턴)"""
+        tool = self.tool
+        request = route.request
+        if tool.block_images and request.resource_type == 'image':
+            await route.abort()
+            return
+        blocker = tool.request_blocker
+        category = blocker.category_of(request.url) if blocker.enabled else None
+        if category:
+            entry = blocker.stats['categories'].setdefault(category, {'requests': 0, 'bytes': 0})
+            entry['requests'] += 1
+            blocker.stats['requests'] += 1
+            await route.abort()
+            return
+        await route.continue_()
+
+    async def process_store(self, context, idx, row):
+        """개별 매장 처리 (process_single_store와 같은 실패 분류 / 집계 / 체크포인트 기록)"""
+        tool = self.tool
+        region = row.get('지역', 'unknown')
+        region_detail = row.get('지역상세', 'unknown')
+        store_name = row.get('매장명', 'unknown')
+        naver_url = row.get('네이버지도링크', None)
+        label = f"[{idx + 1}/{tool.stats['total']}] {store_name}"
+        started = time.time()
+        tool.stats['processed_keys'].append(row_key(row))
+        # 페이지 여러 개를 동시에 처리하므로 매장마다 따로 (분류별 집계는 도구 통계에 합쳐짐)
+        failures = FailureTracker(tool.stats['failure_classes'])
+
+        if pd.isna(naver_url) or not naver_url:
+            print(f"{label} ⚠️  네이버 지도 링크가 없습니다. 건너뜁니다.")
+            tool.stats['no_url'] += 1
+            tool.checkpoint.record(row, 'no_url')
+            self._progress()
+            return
+
+        try:
+            folder_path = tool.create_folder_structure(region, region_detail, store_name)
+            tool.save_link_file(folder_path, store_name, naver_url)
+            tool.checkpoint.record_phase(row, PHASE_LINK_FILE, 'done')
+
+            if tool.link_resolver.is_dead(naver_url):
+                failures.note(DEAD_LINK)
+            fetch = self.fetch_store(context, row, naver_url, folder_path, label, failures)
+            if tool.watchdog.timeout:
+                # 추출 + 다운로드 전체에 제한 시간 적용 (Selenium 경로의 StoreWatchdog과 같은 범위)
+                photos, downloaded = await asyncio.wait_for(fetch, timeout=tool.watchdog.timeout)
+            else:
+                photos, downloaded = await fetch
+
+            if not photos and failures.current:
+                # 사진 탭을 못 찾은 원인이 있으면 '사진 없음'이 아니라 실패로 분류
+                with tool.stats_lock:
+                    failure_class = failures.finish()
+                print(f"{label} ❌ 사진 추출 실패 ({LABELS[failure_class]})")
+                tool.record_failure(row, failure_class, 'PhotoExtractFailed', started)
+                self._progress()
+                return
+
+            if photos:
+                with tool.stats_lock:
+                    tool.stats['total_photos'] += downloaded
+            else:
+                print(f"{label} ℹ️  사진을 찾을 수 없습니다.")
+            with tool.stats_lock:
+                tool.stats['success'] += 1
+            tool.checkpoint.record(row, 'done' if downloaded == len(photos) else 'partial', downloaded)
+
+        except asyncio.TimeoutError:
+            # StoreWatchdog과 같이 본 처리가 끝난 뒤 재시도 (끝까지 초과하면 stats['timed_out'])
+            print(f"{label} ⏰ 매장 제한 시간 {tool.watchdog.timeout}초 초과 - 재시도 대기열에 추가")
+            tool.checkpoint.record(row, 'failed', detail='매장 제한 시간 초과', failure_class=NAVIGATION_TIMEOUT)
+            self.retry_queue.append((idx, row))
+            return
+        except Exception as e:
+            print(f"{label} ❌ 처리 실패: {str(e)[:100]}")
+            with tool.stats_lock:
+                failure_class = failures.finish(e)
+            tool.record_failure(row, failure_class, e, started)
+
+        self._progress()
+
+    async def fetch_store(self, context, row, naver_url, folder_path, label, failures):
+        """사진 URL 추출 + 다운로드 - (사진 목록, 받은 수)
+
+        시간 초과로 취소되면 다운로드 스레드는 멈추지 않고 끝까지 받지만 결과는 집계하지 않음 (재시도에서 다시 집계)
+        """
+        tool = self.tool
+        page = await context.new_page()
+        try:
+            photos = await self.extract_photos(page, tool.link_resolver.lookup(naver_url),
+                                               tool.link_resolver.place_id(naver_url), failures)
+        finally:
+            await page.close()
+
+        if not photos and failures.current:
+            return photos, 0
+
+        tool.checkpoint.record_urls(row, photos)
+        if not photos:
+            return photos, 0
+
+        print(f"{label} ✅ {len(photos)}개 사진 URL 추출")
+        # 동시에 여러 매장을 받으므로 사진별 진행 로그는 생략
+        downloaded = await asyncio.to_thread(tool.download_photos, photos, {'업체': photos},
+                                             folder_path, row.get('매장명', 'unknown'), 0, row)
+        return photos, downloaded
+
+    def _progress(self):
+        self.done += 1
+        total = self.tool.stats['total']
+        print(f"📊 진행률: {self.done / total * 100:.1f}% ({self.done}/{total})")
+
+    async def extract_photos(self, page, url, place_id=None, failures=None):
+        """extract_photos_from_url과 같은 단계 - 원본 크기 사진 URL 목록 (사진 탭을 못 찾으면 failures에 기록)"""
+        tool = self.tool
+
+        # 빠른 경로: 장소 사진 페이지 직접 열기
+        if place_id and tool.direct_photo_page:
+            await self.goto(page, self.photo_page_url.format(place_id=place_id))
+            if await poll(page.main_frame, GRID_SIGNATURE_SCRIPT, [CDN_DOMAINS], timeout=6):
+                tool.stats['direct_hits'] += 1
+                return await self.harvest(page.main_frame)
+            tool.stats['direct_fallbacks'] += 1
+
+        await self.goto(page, url)
+        await poll(page.main_frame, PAGE_IFRAME_READY_SCRIPT, timeout=10)
+
+        frame = await self.click_photo_tab(page)
+        if not frame:
+            if failures is not None:
+                failures.note(SELECTOR_MISS)
+            return []
+        await poll(frame, GRID_SIGNATURE_SCRIPT, [CDN_DOMAINS], timeout=8)
+        return await self.harvest(frame)
+
+    async def goto(self, page, url):
+        """요청 속도 제한(tool.rate_limiter)을 거쳐 이동 → 로드 시간 / 응답 상태로 속도 조절"""
+        limiter = self.tool.rate_limiter
+        await asyncio.sleep(limiter.reserve())
+        started = time.time()
+        await page.goto(url, wait_until='domcontentloaded')
+        if limiter.enabled:
+            try:
+                result = await evaluate(page.main_frame, PAGE_STATE_SCRIPT, PAGE_MARKERS)
+            except Exception:
+                result = None
+            limiter.observe(*page_state(result, time.time() - started))
+
+    async def click_photo_tab(self, page):
+        """메인 문서 → 장소 iframe(entryIframe) → 나머지 iframe 순서로 사진 탭 클릭 - 클릭한 프레임 반환"""
+        frames = [page.main_frame]
+        frames += sorted((frame for frame in page.frames if frame is not page.main_frame),
+                         key=lambda frame: frame.name != 'entryIframe')
+        for frame in frames:
+            try:
+                result = await evaluate(frame, PROBE_SCRIPT, PHOTO_TAB_STRATEGIES)
+            except Exception:
+                result = None
+            if result:
+                self.tool.click_probe.record('사진 탭', result)
+                return frame
+        self.tool.click_probe.record('사진 탭', None)
+        return None
+
+    async def harvest(self, frame):
+        """'업체' 카테고리 선택 → 스크롤 → DOM 수집 → 원본 크기 변환"""
+        before = await evaluate(frame, GRID_SIGNATURE_SCRIPT, CDN_DOMAINS)
+        result = await evaluate(frame, PROBE_SCRIPT, COMPANY_CATEGORY_STRATEGIES)
+        self.tool.click_probe.record('업체 버튼', result)
+        if result:
+            await poll(frame, GRID_SIGNATURE_SCRIPT, [CDN_DOMAINS], timeout=4, changed_from=before)
+
+        # 스크롤하여 모든 이미지 로드 (높이가 더 안 바뀌면 끝)
+        for _ in range(10):
+            height = await evaluate(frame, SCROLL_HEIGHT_SCRIPT)
+            await evaluate(frame, SCROLL_TO_BOTTOM_SCRIPT)
+            if not await poll(frame, SCROLL_HEIGHT_SCRIPT, timeout=1.5, changed_from=height):
+                break
+
+        return canonical_urls(await evaluate(frame, HARVEST_SCRIPT, CDN_DOMAINS) or [])
+
+
+def format_backend_summary(backend, pages):
+    """최종 통계용 백엔드 한 줄"""
+    if backend != 'playwright':
+        return []
+    return [f"⚡ 브라우저 백엔드: playwright (비동기, 동시 페이지 {pages}개)"]
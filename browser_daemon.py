@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+상주 브라우저 데몬 (원격 디버깅 주소로 연결)
+
+실행_V4.bat / 가격표추출.bat / 캡처_플레이스.bat을 실행할 때마다
+Chrome + chromedriver를 새로 띄우고 HTTP 캐시도 빈 상태로 시작했음. 이 모듈은:
+- Chrome 하나를 원격 디버깅 포트 + 고정 프로필 폴더로 띄워 두고 (디스크 캐시 유지)
+- 각 도구가 --attach로 그 브라우저에 연결 (매 실행 / 도구끼리 같은 브라우저 공유)
+- 연결한 세션은 자기 탭을 새로 열어 쓰고, 끝나면 그 탭만 닫음 (브라우저는 계속 실행)
+- 드라이버 시작 시간을 도구별로 기록 → 새로 실행할 때와 비교해서 절감 시간 출력
+
+사용법:
+    python browser_daemon.py start [--port 9222] [--headless] [--block-images]
+    python browser_daemon.py status
+    python browser_daemon.py stop
+
+    python naver_map_bulk_downloader_v4.py list.xlsx --attach          (데몬 자동 연결)
+    python naver_map_bulk_downloader_v4.py list.xlsx --attach 127.0.0.1:9222
+
+주의:
+- 연결 모드에서는 Chrome 실행 옵션(헤드리스 / 이미지 차단 등)을 데몬 시작 시 정함
+- 드라이버 재시작(--recycle-stores 등)은 연결만 다시 하므로 브라우저 메모리는 줄지 않음
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import signal
+import argparse
+import subprocess
+from datetime import datetime
+
+import requests
+from selenium import webdriver
+
+from browser_options import CHROME_USER_AGENT
+
+DEFAULT_DEBUG_PORT = 9222
+
+# 데몬 상태 / 프로필 (스크립트 폴더 - 도구들이 같이 사용)
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DAEMON_STATE_FILE = os.path.join(SCRIPT_DIR, 'browser_daemon.json')
+DEFAULT_PROFILE_DIR = os.path.join(SCRIPT_DIR, 'browser_profile')
+
+# 도구별 드라이버 시작 시간 기록 (새로 실행 / 연결, 스크립트 폴더)
+STARTUP_BENCHMARK_FILE = os.path.join(SCRIPT_DIR, 'driver_startup.json')
+
+CHROME_CANDIDATES = [
+    'google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome',
+    os.path.join(os.environ.get('PROGRAMFILES', r'C:\Program Files'), r'Google\Chrome\Application\chrome.exe'),
+    os.path.join(os.environ.get('PROGRAMFILES(X86)', r'C:\Program Files (x86)'), r'Google\Chrome\Application\chrome.exe'),
+    os.path.join(os.environ.get('LOCALAPPDATA', ''), r'Google\Chrome\Application\chrome.exe'),
+    '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+]
+
+
+# ---------------------------------------------------------------------------
+# 도구 쪽: 연결 옵션 / 드라이버 생성 / 시작 시간 비교
+# ---------------------------------------------------------------------------
+
+def add_attach_arguments(parser):
+    """상주 브라우저 연결 관련 CLI 옵션 추가"""
+    parser.add_argument('--attach', nargs='?', const='auto', default=None, metavar='HOST:PORT',
+                        help='상주 브라우저 데몬에 연결 (주소 생략 시 browser_daemon.py start로 띄운 데몬)')
+
+
+# 도구 생성자 옵션 기본값 (attach_options_from_args와 같은 키)
+ATTACH_DEFAULTS = {'attach': None}
+
+
+def attach_options_from_args(args, need_images=False):
+    """CLI 인자에서 도구 생성자용 연결 옵션 추출 (연결할 데몬이 없으면 attach=None)"""
+    return {'attach': resolve_attach_address(args.attach, need_images=need_images)}
+
+
+def load_daemon_state(path=DAEMON_STATE_FILE):
+    """실행 중인 데몬 정보 (없으면 None)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def daemon_alive(address, timeout=2):
+    """원격 디버깅 주소가 응답하는지 확인"""
+    try:
+        return requests.get(f"http://{address}/json/version", timeout=timeout).ok
+    except requests.RequestException:
+        return False
+
+
+def resolve_attach_address(value, need_images=False):
+    """--attach 값 → 연결할 주소 ('auto'는 데몬 상태 파일에서 읽음, 연결할 수 없으면 None)"""
+    if not value:
+        return None
+
+    state = load_daemon_state()
+    address = value
+    if value == 'auto':
+        if not state:
+            print("⚠️  실행 중인 브라우저 데몬이 없습니다 - Chrome을 새로 실행합니다 "
+                  "(python browser_daemon.py start)")
+            return None
+        address = state['address']
+
+    if not daemon_alive(address):
+        print(f"⚠️  브라우저 데몬({address})에 연결할 수 없습니다 - Chrome을 새로 실행합니다")
+        return None
+
+    if need_images and state and state.get('address') == address and state.get('block_images'):
+        print("⚠️  이미지 차단 모드로 시작한 데몬에는 캡처용으로 연결하지 않습니다 - Chrome을 새로 실행합니다")
+        return None
+
+    return address
+
+
+class AttachedChrome(webdriver.Chrome):
+    """상주 브라우저에 연결한 드라이버 - 자기 탭을 열어 쓰고 quit 시 그 탭들만 닫음"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 다른 도구 / 워커와 같은 탭을 조작하지 않도록 새 탭 사용 (탭 풀이 연 탭도 여기에 추가됨)
+        self.switch_to.new_window('tab')
+        self.own_handles = [self.current_window_handle]
+
+    def quit(self):
+        try:
+            open_handles = self.window_handles
+            for handle in self.own_handles:
+                if handle in open_handles:
+                    self.switch_to.window(handle)
+                    self.close()
+        except Exception:
+            pass
+        # debuggerAddress로 연결한 세션은 quit해도 브라우저를 종료하지 않음
+        super().quit()
+
+
+def new_startup_stats():
+    """stats['startup']에 들어갈 빈 측정값"""
+    return {'launch': {'count': 0, 'seconds': 0.0}, 'attach': {'count': 0, 'seconds': 0.0}}
+
+
+def start_driver(chrome_options, attach, stats):
+    """드라이버 생성 (연결 / 새로 실행) + 시작 시간 기록"""
+    start = time.time()
+    if attach:
+        driver = AttachedChrome(options=chrome_options)
+    else:
+        driver = webdriver.Chrome(options=chrome_options)
+
+    entry = stats['attach' if attach else 'launch']
+    entry['count'] += 1
+    entry['seconds'] += time.time() - start
+    return driver
+
+
+def format_startup_summary(tool_name, stats, path=STARTUP_BENCHMARK_FILE):
+    """최종 통계용 드라이버 시작 시간 - 이번 결과를 누적 저장하고 새로 실행 대비 절감 시간 출력"""
+    data = {}
+    if os.path.exists(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+
+    history = data.setdefault(tool_name, new_startup_stats())
+    for mode in ['launch', 'attach']:
+        history[mode]['count'] += stats[mode]['count']
+        history[mode]['seconds'] += stats[mode]['seconds']
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+    except OSError:
+        pass
+
+    attached = stats['attach']
+    if not attached['count']:
+        launched = stats['launch']
+        if not launched['count']:
+            return []
+        return [f"🔥 드라이버 시작: 새로 실행 {launched['count']}회, 평균 {launched['seconds'] / launched['count']:.2f}초"]
+
+    attach_avg = attached['seconds'] / attached['count']
+    line = f"🔥 드라이버 시작: 데몬 연결 {attached['count']}회, 평균 {attach_avg:.2f}초"
+    baseline = history['launch']
+    if not baseline['count']:
+        return [line, "   - 비교 기준 없음 (--attach 없이 한 번 실행하면 새로 실행 시간이 기록됩니다)"]
+
+    launch_avg = baseline['seconds'] / baseline['count']
+    saved = (launch_avg - attach_avg) * attached['count']
+    return [line, f"   - 새로 실행 대비 절감: 약 {saved:.1f}초 (회당 {launch_avg:.2f}초 → {attach_avg:.2f}초)"]
+
+
+# ---------------------------------------------------------------------------
+# 데몬 쪽: start / status / stop
+# ---------------------------------------------------------------------------
+
+def find_chrome(explicit=None):
+    """Chrome 실행 파일 경로 (없으면 None)"""
+    for candidate in [explicit, os.environ.get('CHROME_PATH')] + CHROME_CANDIDATES:
+        if not candidate:
+            continue
+        if os.path.isfile(candidate):
+            return candidate
+        found = shutil.which(candidate)
+        if found:
+            return found
+    return None
+
+
+def start_daemon(port=DEFAULT_DEBUG_PORT, profile=DEFAULT_PROFILE_DIR, headless=False, block_images=False,
+                 chrome_path=None, timeout=20):
+    """Chrome을 원격 디버깅 모드로 띄우고 상태 파일 기록"""
+    address = f"127.0.0.1:{port}"
+    if daemon_alive(address):
+        print(f"✅ 브라우저 데몬이 이미 실행 중입니다 ({address})")
+        return True
+
+    chrome = find_chrome(chrome_path)
+    if not chrome:
+        print("❌ Chrome 실행 파일을 찾을 수 없습니다 (--chrome-path 또는 CHROME_PATH로 지정)")
+        return False
+
+    os.makedirs(profile, exist_ok=True)
+    command = [
+        chrome,
+        f'--remote-debugging-port={port}',
+        f'--user-data-dir={profile}',
+        '--no-first-run',
+        '--no-default-browser-check',
+        '--disable-dev-shm-usage',
+        '--window-size=1920,1080',
+        '--lang=ko-KR',
+        f'--user-agent={CHROME_USER_AGENT}',
+    ]
+    if headless:
+        command.append('--headless=new')
+    if block_images:
+        command.append('--blink-settings=imagesEnabled=false')
+    command.append('about:blank')
+
+    # 이 스크립트가 끝나도 계속 실행되도록 분리해서 시작
+    if os.name == 'nt':
+        flags = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+        process = subprocess.Popen(command, creationflags=flags, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    else:
+        process = subprocess.Popen(command, start_new_session=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    print(f"🚀 브라우저 데몬 시작 중... ({address})")
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if daemon_alive(address):
+            state = {
+                'address': address,
+                'pid': process.pid,
+                'profile': profile,
+                'headless': headless,
+                'block_images': block_images,
+                'started_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            }
+            with open(DAEMON_STATE_FILE, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False, indent=2)
+            print(f"✅ 브라우저 데몬 실행 완료 (PID {process.pid}, 프로필: {profile})")
+            print("   도구 실행 시 --attach 옵션으로 연결하세요")
+            return True
+        if process.poll() is not None:
+            break
+        time.sleep(0.5)
+
+    print("❌ 브라우저 데몬 시작 실패 (원격 디버깅 포트가 응답하지 않음)")
+    return False
+
+
+def daemon_status():
+    """데몬 상태 출력 - 실행 중이면 True"""
+    state = load_daemon_state()
+    if not state or not daemon_alive(state['address']):
+        print("⏹️  브라우저 데몬이 실행 중이 아닙니다")
+        return False
+    print(f"✅ 브라우저 데몬 실행 중: {state['address']} (PID {state['pid']}, 시작: {state['started_at']})")
+    print(f"   프로필: {state['profile']}")
+    return True
+
+
+def stop_daemon():
+    """데몬 종료 + 상태 파일 삭제"""
+    state = load_daemon_state()
+    if not state:
+        print("⏹️  브라우저 데몬이 실행 중이 아닙니다")
+        return
+    try:
+        if os.name == 'nt':
+            subprocess.run(['taskkill', '/F', '/T', '/PID', str(state['pid'])], capture_output=True)
+        else:
+            os.killpg(state['pid'], signal.SIGTERM)
+    except OSError as e:
+        print(f"⚠️  종료 신호 실패: {e}")
+    try:
+        os.remove(DAEMON_STATE_FILE)
+    except OSError:
+        pass
+    print("✅ 브라우저 데몬 종료")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="상주 브라우저 데몬")
+    parser.add_argument('command', choices=['start', 'status', 'stop'], help='start / status / stop')
+    parser.add_argument('--port', type=int, default=DEFAULT_DEBUG_PORT,
+                        help=f'원격 디버깅 포트 (기본: {DEFAULT_DEBUG_PORT})')
+    parser.add_argument('--profile', default=DEFAULT_PROFILE_DIR,
+                        help='Chrome 프로필 폴더 - 디스크 캐시가 실행 간 유지됨 (기본: 스크립트 폴더의 browser_profile)')
+    parser.add_argument('--headless', action='store_true', help='화면 없이 Chrome 실행')
+    parser.add_argument('--block-images', action='store_true',
+                        help='브라우저 이미지 로드 차단 (캡처 도구는 이 데몬에 연결하지 않음)')
+    parser.add_argument('--chrome-path', help='Chrome 실행 파일 경로')
+    args = parser.parse_args()
+
+    if args.command == 'start':
+        ok = start_daemon(args.port, args.profile, args.headless, args.block_images, args.chrome_path)
+    elif args.command == 'status':
+        ok = daemon_status()
+    else:
+        stop_daemon()
+        ok = True
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
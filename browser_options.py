@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Chrome 옵션 / 브라우저 모드 공통 설정
+
+기능:
+- 모든 도구의 setup_driver가 같은 Chrome 옵션을 사용하도록 한 곳에서 생성
+- --headless: 화면 없이 실행
+- --block-images: 브라우저 안에서 이미지 로드/디코딩 차단
+  (사진 URL은 DOM 속성에서 읽으므로 추출에는 영향 없음 - 원본은 requests로 따로 받음)
+- --fast: 운영용 추출 모드 (--headless + --block-images)
+- 문서별 로드 시간 / 전송량 측정 → 기본 모드(화면 + 이미지 로드) 실행 기록과 비교해서 절감량 출력
+- --page-load normal|eager|none: driver.get이 기다리는 범위 (eager/none은 도구별 준비 조건으로 대기)
+- 매장별 첫 사진 URL까지 걸린 시간 측정 → 전략별 결과를 page_load_benchmark.json에 모아 비교
+
+- --attach: 상주 브라우저 데몬(browser_daemon.py)에 연결 - 실행 옵션은 데몬 쪽에서 정함
+
+캡처 도구(capture_naver_place.py)는 실제 렌더링이 필요하므로 이미지 차단을 사용하지 않음
+"""
+
+import os
+import json
+import time
+
+from selenium.webdriver.chrome.options import Options
+
+from download_engine import format_bytes
+
+CHROME_USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                     '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+
+# 기본 모드 실행의 측정값 저장 파일 (도구 이름별, 스크립트 폴더 - 실행 위치와 무관)
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'browser_baseline.json')
+
+# 페이지 로드 전략: normal=모든 리소스 로드까지, eager=DOM 준비까지, none=기다리지 않음
+PAGE_LOAD_STRATEGIES = ['normal', 'eager', 'none']
+
+# 전략별 첫 사진 URL까지 걸린 시간 저장 파일 (도구 이름 → 전략별, 스크립트 폴더)
+PAGE_LOAD_BENCHMARK_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'page_load_benchmark.json')
+
+PAGE_METRICS_SCRIPT = """
+var metrics = {load_ms: 0, bytes: 0, image_bytes: 0, image_requests: 0, images_skipped: 0};
+
+var nav = performance.getEntriesByType('navigation')[0];
+if (nav) {
+    var end = nav.loadEventEnd || nav.domContentLoadedEventEnd || 0;
+    metrics.load_ms = Math.max(0, end - nav.startTime);
+    metrics.bytes += nav.transferSize || 0;
+}
+
+var resources = performance.getEntriesByType('resource');
+for (var i = 0; i < resources.length; i++) {
+    var r = resources[i];
+    var size = r.transferSize || r.encodedBodySize || 0;
+    metrics.bytes += size;
+    if (r.initiatorType === 'img' || /\\.(jpe?g|png|gif|webp)(\\?|$)/i.test(r.name)) {
+        metrics.image_bytes += size;
+        metrics.image_requests += 1;
+    }
+}
+
+// 이미지 차단 모드에서 로드되지 않은 이미지 수 (절감 추정용)
+var imgs = document.images;
+for (var i = 0; i < imgs.length; i++) {
+    if (imgs[i].src && imgs[i].naturalWidth === 0) metrics.images_skipped += 1;
+}
+
+return metrics;
+"""
+
+
+def add_browser_arguments(parser, allow_headless=True, allow_block_images=True, allow_page_load=True):
+    """브라우저 모드 관련 CLI 옵션 추가 (이미 헤드리스인 도구는 allow_headless=False)"""
+    if allow_headless:
+        parser.add_argument('--headless', action='store_true',
+                            help='화면 없이 Chrome 실행')
+    if allow_block_images:
+        parser.add_argument('--block-images', action='store_true',
+                            help='브라우저 이미지 로드 차단 (URL은 DOM에서 추출)')
+        parser.add_argument('--fast', action='store_true',
+                            help='운영용 추출 모드 (--headless + --block-images)')
+    if allow_page_load:
+        parser.add_argument('--page-load', choices=PAGE_LOAD_STRATEGIES, default='normal',
+                            help='페이지 로드 전략 - eager/none은 필요한 요소만 확인하고 진행 (기본: normal)')
+
+
+# 도구 생성자 옵션 기본값 (browser_options_from_args와 같은 키)
+BROWSER_DEFAULTS = {'headless': False, 'block_images': False, 'page_load': 'normal'}
+
+
+def browser_options_from_args(args):
+    """CLI 인자에서 도구 생성자용 브라우저 옵션 추출"""
+    fast = getattr(args, 'fast', False)
+    options = {}
+    if hasattr(args, 'headless'):
+        options['headless'] = args.headless or fast
+    if hasattr(args, 'block_images'):
+        options['block_images'] = args.block_images or fast
+    if hasattr(args, 'page_load'):
+        options['page_load'] = args.page_load
+    return options
+
+
+def build_chrome_options(headless=False, block_images=False, maximize=True, lang=True, page_load='normal',
+                         debugger_address=None):
+    """공통 Chrome 옵션 생성 (debugger_address: 상주 브라우저 데몬에 연결)"""
+    chrome_options = Options()
+    chrome_options.page_load_strategy = page_load
+    if debugger_address:
+        # Chrome 실행 옵션은 데몬 시작 시 정해지므로 연결 주소만 지정
+        chrome_options.debugger_address = debugger_address
+        return chrome_options
+    if headless:
+        chrome_options.add_argument('--headless=new')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--window-size=1920,1080')
+    if maximize and not headless:
+        chrome_options.add_argument('--start-maximized')
+    if lang:
+        chrome_options.add_argument('--lang=ko-KR')
+    chrome_options.add_argument(f'user-agent={CHROME_USER_AGENT}')
+
+    # 이미지: 1=허용, 2=차단 (차단해도 img 요소의 src/srcset 속성은 그대로 남음)
+    prefs = {
+        "profile.managed_default_content_settings.images": 2 if block_images else 1,
+        "profile.default_content_setting_values.notifications": 2
+    }
+    chrome_options.add_experimental_option("prefs", prefs)
+    if block_images:
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+
+    return chrome_options
+
+
+def describe_mode(headless, block_images, page_load='normal', attach=None):
+    """브라우저 모드 한 줄 설명 (데몬 연결이면 헤드리스 / 이미지 옵션은 데몬이 정하므로 연결 주소로 표시)"""
+    if attach:
+        parts = [f'데몬 연결 {attach}']
+    else:
+        parts = ['헤드리스' if headless else '화면 표시']
+        parts.append('이미지 차단' if block_images else '이미지 로드')
+    if page_load != 'normal':
+        parts.append(f'로드 전략 {page_load}')
+    return ' + '.join(parts)
+
+
+def new_page_metrics():
+    """stats['browser']에 들어갈 빈 측정값"""
+    return {'documents': 0, 'load_ms': 0, 'bytes': 0, 'image_bytes': 0, 'image_requests': 0, 'images_skipped': 0}
+
+
+def record_page_metrics(driver, metrics):
+    """현재 문서(프레임)의 로드 시간 / 전송량을 metrics에 누적"""
+    try:
+        result = driver.execute_script(PAGE_METRICS_SCRIPT)
+    except Exception:
+        return
+    if not result:
+        return
+    metrics['documents'] += 1
+    for key in ['load_ms', 'bytes', 'image_bytes', 'image_requests', 'images_skipped']:
+        metrics[key] += int(result.get(key) or 0)
+
+
+def load_baseline(tool_name, path=BASELINE_FILE):
+    """기본 모드 실행 측정값 읽기 (없으면 None)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f).get(tool_name)
+    except (OSError, ValueError):
+        return None
+
+
+def save_baseline(tool_name, metrics, path=BASELINE_FILE):
+    """기본 모드 실행 측정값 저장 (다음 --fast 실행과 비교용)"""
+    if not metrics.get('documents'):
+        return
+    data = {}
+    if os.path.exists(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+    data[tool_name] = dict(metrics)
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+    except OSError:
+        pass
+
+
+def format_browser_summary(tool_name, metrics, headless, block_images, default_headless=False, attach=None):
+    """최종 통계용 브라우저 측정 요약 - 도구의 기본 모드면 기준값 저장, 아니면 기준값과 비교
+
+    데몬 연결(attach)이면 CLI 플래그와 실제 Chrome 모드가 다를 수 있으므로 기준값 저장 / 비교 안 함
+    """
+    lines = [f"🖥️  브라우저 모드: {describe_mode(headless, block_images, attach=attach)}"]
+    documents = metrics.get('documents', 0)
+    if not documents:
+        return lines
+
+    avg_load = metrics['load_ms'] / documents / 1000
+    lines.append(f"   - 문서 {documents}개, 평균 로드 {avg_load:.2f}초, "
+                 f"브라우저 전송량 {format_bytes(metrics['bytes'])} (이미지 {format_bytes(metrics['image_bytes'])})")
+
+    if attach:
+        lines.append("   - 데몬 연결 실행은 기본 모드 기준값 저장 / 비교에서 제외")
+        return lines
+
+    if headless == default_headless and not block_images:
+        save_baseline(tool_name, metrics)
+        return lines
+
+    baseline = load_baseline(tool_name)
+    if not baseline or not baseline.get('documents'):
+        lines.append("   - 비교 기준 없음 (옵션 없이 한 번 실행하면 기준값이 기록됩니다)")
+        return lines
+
+    base_load = baseline['load_ms'] / baseline['documents'] / 1000
+    base_bytes = baseline['bytes'] / baseline['documents']
+    saved_time = (base_load - avg_load) * documents
+    saved_bytes = base_bytes * documents - metrics['bytes']
+
+    # 차단된 이미지 수 × 기본 모드의 이미지당 평균 크기 (리소스 타이밍에 안 잡힌 이미지 보정)
+    if block_images and baseline.get('image_requests'):
+        per_image = baseline['image_bytes'] / baseline['image_requests']
+        saved_bytes = max(saved_bytes, metrics['images_skipped'] * per_image)
+
+    lines.append(f"   - 기본 모드 대비 절감: 로드 시간 {saved_time:.1f}초 "
+                 f"(문서당 {base_load:.2f}초 → {avg_load:.2f}초), 전송량 약 {format_bytes(max(0, int(saved_bytes)))}")
+    return lines
+
+
+def new_first_url_stats():
+    """stats['first_url']에 들어갈 빈 측정값"""
+    return {'stores': 0, 'seconds': 0.0}
+
+
+class FirstUrlTimer:
+    """매장별 '첫 사진 URL까지 걸린 시간' 측정 (페이지 로드 전략 비교용)"""
+
+    def __init__(self, stats):
+        self.stats = stats
+        self.started = None
+
+    def begin(self):
+        """매장 이동 직전에 호출"""
+        self.started = time.time()
+
+    def mark(self):
+        """첫 사진 URL을 확인한 시점에 호출 (매장당 한 번만 기록)"""
+        if self.started is None:
+            return
+        self.stats['stores'] += 1
+        self.stats['seconds'] += time.time() - self.started
+        self.started = None
+
+
+def format_page_load_summary(tool_name, page_load, stats, path=PAGE_LOAD_BENCHMARK_FILE, attach=None):
+    """최종 통계용 전략별 첫 사진 URL 시간 - 이번 결과를 저장하고 이전 실행의 다른 전략과 같이 출력
+
+    데몬 연결(attach)이면 캐시가 데워진 다른 Chrome이므로 전략별 기록에 저장하지 않고 따로 출력
+    """
+    data = {}
+    if os.path.exists(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+
+    results = data.setdefault(tool_name, {})
+    saved = bool(stats.get('stores')) and not attach
+    if saved:
+        results[page_load] = {'stores': stats['stores'], 'seconds': stats['seconds']}
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+        except OSError:
+            pass
+
+    attached = bool(stats.get('stores')) and attach
+    if not results and not attached:
+        return []
+
+    lines = ["🚦 첫 사진 URL까지 걸린 시간 (페이지 로드 전략별):"]
+    for strategy in PAGE_LOAD_STRATEGIES:
+        entry = results.get(strategy)
+        if not entry or not entry.get('stores'):
+            continue
+        marker = " ← 이번 실행" if strategy == page_load and saved else ""
+        lines.append(f"   - {strategy}: 평균 {entry['seconds'] / entry['stores']:.2f}초 "
+                     f"({entry['stores']}개 매장){marker}")
+    if attached:
+        lines.append(f"   - {page_load} (데몬 연결, 기록 안 함): 평균 {stats['seconds'] / stats['stores']:.2f}초 "
+                     f"({stats['stores']}개 매장) ← 이번 실행")
+    return lines
@@ -1,35 +1,65 @@
 #!/usr/bin/env python3
 """
 네이버 플레이스 캡처 도구 (엑셀 기반)
-사용법: python capture_naver_place.py <엑셀파일경로>
+사용법: python capture_naver_place.py <엑셀파일경로> [--workers N]
 
 기능:
 - 네이버 검색으로 매장 찾기
 - 플레이스 카드 영역 캡처
 - 각 매장의 업체 폴더에 저장
+- 매장별 결과 체크포인트 (checkpoint.db - V4 / 가격표 추출과 공유) + 이어서 실행 (--resume)
+- 실패 목록 JSONL (캡처_실패_목록.jsonl) + 실패 매장만 다시 처리 (--retry-failed)
+- 실패 원인 분류 (시간 초과 / 선택자 / 크래시) - 일시적 실패만 자동 재시도
+- 요청 속도 자동 조절 (--rate): 워커 공유 토큰 버킷 - 느린 응답 / 캡차 / 오류 화면이면 감속
 """
 
 import os
 import sys
 import time
+import argparse
 import pandas as pd
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from PIL import Image
 import traceback
 from datetime import datetime
 from urllib.parse import quote
+from browser_daemon import (add_attach_arguments, attach_options_from_args, start_driver, new_startup_stats,
+                            format_startup_summary, ATTACH_DEFAULTS)
+from browser_options import build_chrome_options, add_browser_arguments, browser_options_from_args
+from checkpoint_ledger import (CheckpointLedger, add_checkpoint_arguments, checkpoint_options_from_args,
+                               new_checkpoint_stats, format_checkpoint_summary, row_key, CHECKPOINT_DEFAULTS,
+                               PHASE_CAPTURE)
+from failure_classes import FailureTracker, format_failure_summary, SELECTOR_MISS
+from failure_ledger import (add_retry_arguments, retry_options_from_args, failure_entry, merge_failure_ledger,
+                            failed_rows, RETRY_DEFAULTS)
+from network_capture import enable_performance_log, PerformanceLog
+from rate_limiter import (RateLimiter, add_rate_arguments, rate_options_from_args, new_rate_stats, format_rate_summary,
+                          RATE_DEFAULTS)
+from request_blocker import (RequestBlocker, add_blocker_arguments, blocker_options_from_args, new_block_stats,
+                             BLOCKER_DEFAULTS)
+from tool_options import ToolOptions, merge_defaults
+from worker_pool import run_parallel, add_worker_arguments
+from wait_engine import WaitEngine, format_wait_summary, document_ready, url_changed, images_loaded
+
+PLACE_ROOT_SELECTOR = "#loc-main-section-root"
+SUGGESTION_SELECTOR = ".suggest_wrap .dsc_area a.link"
+
+# 생성자 옵션 기본값 (기능 모듈별 기본값 + 캡처 전용 - 브라우저 옵션은 --headless만 지원)
+CAPTURE_OPTIONS = merge_defaults(
+    BLOCKER_DEFAULTS, ATTACH_DEFAULTS, CHECKPOINT_DEFAULTS, RETRY_DEFAULTS, RATE_DEFAULTS,
+    {'base_folder': 'downloads', 'headless': False, 'block_preset': 'capture'}
+)
 
 class NaverPlaceCapturer:
-    def __init__(self, excel_path, base_folder="downloads"):
+    def __init__(self, excel_path, **options):
+        options = ToolOptions(CAPTURE_OPTIONS, options)
         self.excel_path = excel_path
         # 현재 스크립트 위치에서 downloads 폴더
         script_dir = os.path.dirname(os.path.abspath(__file__))
-        self.base_folder = os.path.join(script_dir, base_folder)
+        self.base_folder = os.path.join(script_dir, options.base_folder)
         self.driver = None
+        self.headless = options.headless
         self.stats = {
             'total': 0,
             'success': 0,
@@ -40,21 +70,48 @@ class NaverPlaceCapturer:
         # 실패한 매장 기록
         self.failed_stores = []
         
+        # 조건 기반 대기 (조건별 대기 시간은 stats['waits']에 기록)
+        self.waits = WaitEngine(self.stats.setdefault('waits', {}))
+        
+        # 통계 / 광고 요청 차단 (화면에 보이는 지도 타일 / 폰트는 유지) + 매장별 차단 수 집계
+        self.stats['blocked'] = new_block_stats()
+        self.request_blocker = RequestBlocker(options.block_preset, options.block_patterns,
+                                              enabled=options.block_requests, stats=self.stats['blocked'])
+        self.perf_log = PerformanceLog()
+        
+        # 상주 브라우저 데몬 연결 (없으면 Chrome 새로 실행) + 드라이버 시작 시간
+        self.attach = options.attach
+        self.stats['startup'] = new_startup_stats()
+        
+        # 매장별 처리 결과 체크포인트 (--resume이면 완료된 매장 건너뜀)
+        self.resume = options.resume
+        self.stats['checkpoint'] = new_checkpoint_stats()
+        self.checkpoint = CheckpointLedger('capture', options.checkpoint, stats=self.stats['checkpoint'])
+        
+        # 실패 목록(JSONL)에 있는 매장만 다시 처리 (기본은 일시적 실패만)
+        self.retry_failed = options.retry_failed
+        self.retry_permanent = options.retry_permanent
+        # 이번 실행에서 처리한 매장 키 - 실패 목록을 병합할 때 이 매장들의 이전 줄만 교체 (워커 결과는 merge_stats로 합쳐짐)
+        self.stats['processed_keys'] = []
+        
+        # 실패 원인 분류 (분류별 실패 매장 수는 stats['failure_classes'])
+        self.failures = FailureTracker(self.stats.setdefault('failure_classes', {}))
+        
+        # 페이지 이동 속도 제한 (워커 모드에서는 rate_shared로 워커 전체가 같은 버킷 사용)
+        self.stats['rate_limit'] = new_rate_stats()
+        self.rate_limiter = RateLimiter(options.rate, options.min_rate, options.max_rate, options.target_load,
+                                        shared=options.rate_shared, stats=self.stats['rate_limit'])
+        
     def setup_driver(self):
         """Chrome 드라이버 설정"""
-        chrome_options = Options()
-        # headless 모드 비활성화 (캡처 확인용)
-        # chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--start-maximized')
-        chrome_options.add_argument('--lang=ko-KR')
-        chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        # 스크린샷에는 실제 렌더링이 필요하므로 이미지 차단은 사용하지 않음
+        chrome_options = build_chrome_options(headless=self.headless, block_images=False, debugger_address=self.attach)
+        enable_performance_log(chrome_options)  # 차단 요청 집계용
         
-        self.driver = webdriver.Chrome(options=chrome_options)
+        self.driver = start_driver(chrome_options, self.attach, self.stats['startup'])
         self.driver.implicitly_wait(10)
+        self.waits.attach(self.driver)
+        self.request_blocker.apply(self.driver)
         print("✅ Chrome 드라이버 초기화 완료\n")
         
     def read_excel(self):
@@ -124,20 +181,24 @@ class NaverPlaceCapturer:
                     else:
                         print(f"   🔍 재검색 ({idx+1}번째 시도): {search_query}")
                     
-                    self.driver.get(search_url)
-                    time.sleep(2)
+                    self.rate_limiter.navigate(self.driver, search_url)
+                    self.waits.wait_for('검색 결과 로드', document_ready(), timeout=5, fallback=2)
                     
                     # 검색어 제안이 있는지 확인 (네이버가 검색어를 바꾼 경우)
+                    # (querySelector 사용 - 제안이 없을 때 implicitly_wait 10초를 기다리지 않도록)
                     try:
                         # suggest_wrap 영역 내의 a.link 찾기
-                        suggestion_button = self.driver.find_element(By.CSS_SELECTOR, ".suggest_wrap .dsc_area a.link")
-                        suggestion_text = suggestion_button.text.strip()
+                        suggestion_button = self.driver.execute_script(
+                            "return document.querySelector(arguments[0]);", SUGGESTION_SELECTOR)
+                        suggestion_text = suggestion_button.text.strip() if suggestion_button else ""
                         if suggestion_text:
                             print(f"   🔄 원래 검색어로 재검색: '{suggestion_text}'")
+                            previous_url = self.driver.current_url
                             suggestion_button.click()
-                            time.sleep(2)
-                    except:
-                        pass  # 제안 없음 - 정상
+                            self.waits.wait_for('재검색 이동', url_changed(previous_url), timeout=5, fallback=2)
+                            self.waits.wait_for('검색 결과 로드', document_ready(), timeout=5)
+                    except Exception as e:
+                        self.failures.note(e)  # 제안 없음 - 정상 (크래시 / 시간 초과만 의미 있음)
                     
                     # #loc-main-section-root 요소가 나타날 때까지 대기
                     wait = WebDriverWait(self.driver, 10)
@@ -147,11 +208,11 @@ class NaverPlaceCapturer:
                         EC.presence_of_element_located((By.CSS_SELECTOR, "#loc-main-section-root .api_subject_bx"))
                     )
                     
-                    # 플레이스 내용이 로드될 때까지 추가 대기
-                    time.sleep(3)
+                    # 플레이스 카드 이미지가 모두 로드될 때까지 대기 (스크린샷용)
+                    self.waits.wait_for('플레이스 이미지 로드', images_loaded(PLACE_ROOT_SELECTOR), timeout=6, fallback=3)
                     
                     # 부모 요소 (#loc-main-section-root) 찾기
-                    place_root = self.driver.find_element(By.CSS_SELECTOR, "#loc-main-section-root")
+                    place_root = self.driver.find_element(By.CSS_SELECTOR, PLACE_ROOT_SELECTOR)
                     
                     # 플레이스인지 확인
                     if "api_subject_bx" not in place_root.get_attribute("innerHTML"):
@@ -173,6 +234,7 @@ class NaverPlaceCapturer:
                             continue
                     
                 except Exception as e:
+                    self.failures.note(e)
                     if idx < len(search_queries) - 1:
                         print(f"   ⚠️  시도 실패 - 다음 검색어 시도")
                         continue
@@ -181,6 +243,7 @@ class NaverPlaceCapturer:
                         return False
             
             print(f"   ❌ 플레이스를 찾을 수 없음")
+            self.failures.note(SELECTOR_MISS)
             return False
                 
         except Exception as e:
@@ -193,6 +256,9 @@ class NaverPlaceCapturer:
         region = row.get('지역', 'unknown')
         region_detail = row.get('지역상세', 'unknown')
         store_name = row.get('매장명', 'unknown')
+        started = time.time()
+        self.failures.begin()
+        self.stats['processed_keys'].append(row_key(row))
         
         print(f"\n{'='*60}")
         print(f"[{row_idx + 1}/{self.stats['total']}] 처리 중: {region} > {region_detail} > {store_name}")
@@ -206,6 +272,7 @@ class NaverPlaceCapturer:
                 print(f"   ⚠️  매장 폴더를 찾을 수 없음")
                 print(f"   💡 먼저 V4 다운로더를 실행하여 폴더를 생성하세요")
                 self.stats['no_folder'] += 1
+                self.checkpoint.record(row, 'no_folder')
                 return
             
             print(f"   📁 저장 위치: {company_folder}")
@@ -216,24 +283,35 @@ class NaverPlaceCapturer:
                 print(f"   ℹ️  이미 캡처 파일이 존재함 - 덮어쓰기")
             
             # 네이버 플레이스 캡처
-            if self.capture_naver_place(region, region_detail, store_name, company_folder):
+            self.perf_log.reset(self.driver)
+            captured = self.capture_naver_place(region, region_detail, store_name, company_folder)
+            self.request_blocker.record_store(self.perf_log.read(self.driver))
+            
+            if captured:
                 self.stats['success'] += 1
+                self.checkpoint.record_phase(row, PHASE_CAPTURE, 'done')
+                self.checkpoint.record(row, 'done', 1)
             else:
                 self.stats['failed'] += 1
                 # 실패한 매장 기록
-                self.failed_stores.append({
-                    '지역': region,
-                    '지역상세': region_detail,
-                    '매장명': store_name,
-                    '검색어': f"{store_name} {region} {region_detail} 에스테틱"
-                })
+                failure_class = self.failures.finish()
+                self.failed_stores.append({**failure_entry(row, PHASE_CAPTURE, 'CaptureFailed', time.time() - started,
+                                                           failure_class),
+                                           '검색어': f"{store_name} {region} {region_detail} 에스테틱"})
+                self.checkpoint.record_phase(row, PHASE_CAPTURE, 'failed', {'class': failure_class})
+                self.checkpoint.record(row, 'failed', failure_class=failure_class)
                 
         except Exception as e:
             print(f"   ❌ 처리 실패: {e}")
             traceback.print_exc()
             self.stats['failed'] += 1
+            failure_class = self.failures.finish(e)
+            self.failed_stores.append({**failure_entry(row, PHASE_CAPTURE, e, time.time() - started, failure_class),
+                                       '검색어': f"{store_name} {region} {region_detail} 에스테틱"})
+            self.checkpoint.record_phase(row, PHASE_CAPTURE, 'failed', {'class': failure_class, 'error': str(e)[:200]})
+            self.checkpoint.record(row, 'failed', detail=e, failure_class=failure_class)
     
-    def run(self):
+    def run(self, workers=1, worker_options=None):
         """전체 프로세스 실행"""
         start_time = time.time()
         
@@ -244,19 +322,37 @@ class NaverPlaceCapturer:
         df = self.read_excel()
         self.stats['total'] = len(df)
         
+        # 이어서 실행: 체크포인트에 완료로 기록된 매장 제외
+        rows = self.checkpoint.pending(df.iterrows()) if self.resume else df.iterrows()
+        if self.retry_failed:
+            rows = failed_rows(rows, self.retry_failed, self.retry_permanent)
+        
+        if workers > 1:
+            # 멀티 브라우저 모드: 워커마다 독립된 Chrome
+            run_parallel(self, rows, workers, worker_options or {})
+        else:
+            self.process_rows(rows)
+                
+        elapsed_time = time.time() - start_time
+        self.print_final_stats(elapsed_time)
+        
+        # 실패한 매장 목록 저장 (JSONL은 실패가 없어도 써서 --retry-failed 목록을 최신으로 유지,
+        # 이번에 처리하지 않은 매장의 이전 줄은 유지)
+        if self.failed_stores:
+            self.save_failed_stores()
+        merge_failure_ledger(os.path.join(os.path.dirname(os.path.abspath(__file__)), "캡처_실패_목록.jsonl"),
+                             self.failed_stores, self.stats['processed_keys'])
+    
+    def process_rows(self, rows):
+        """(행 번호, 행) 목록 처리 - 드라이버 준비/정리 포함"""
         self.setup_driver()
         
         try:
-            for idx, row in df.iterrows():
+            for idx, row in rows:
                 self.process_single_store(idx, row)
                 
-                progress = (idx + 1) / len(df) * 100
-                print(f"\n📊 진행률: {progress:.1f}% ({idx + 1}/{len(df)})")
-                
-                # 3개마다 잠깐 대기 (네이버 서버 부담 줄이기)
-                if (idx + 1) % 3 == 0:
-                    print("   ⏳ 3개 처리마다 2초 대기 중...")
-                    time.sleep(2)
+                progress = (idx + 1) / self.stats['total'] * 100
+                print(f"\n📊 진행률: {progress:.1f}% ({idx + 1}/{self.stats['total']})")
                     
         except KeyboardInterrupt:
             print("\n\n⚠️  사용자에 의해 중단되었습니다.")
@@ -264,13 +360,7 @@ class NaverPlaceCapturer:
         finally:
             if self.driver:
                 self.driver.quit()
-                
-        elapsed_time = time.time() - start_time
-        self.print_final_stats(elapsed_time)
-        
-        # 실패한 매장 목록 저장
-        if self.failed_stores:
-            self.save_failed_stores()
+            self.checkpoint.close()
     
     def print_final_stats(self, elapsed_time):
         """최종 통계 출력"""
@@ -281,6 +371,18 @@ class NaverPlaceCapturer:
         print(f"✅ 성공: {self.stats['success']}개")
         print(f"❌ 실패: {self.stats['failed']}개")
         print(f"⚠️  폴더 없음: {self.stats['no_folder']}개")
+        for line in format_failure_summary(self.stats['failure_classes']):
+            print(line)
+        for line in self.request_blocker.summary_lines():
+            print(line)
+        for line in format_wait_summary(self.stats['waits']):
+            print(line)
+        for line in format_startup_summary(type(self).__name__, self.stats['startup']):
+            print(line)
+        for line in format_checkpoint_summary(self.stats['checkpoint']):
+            print(line)
+        for line in format_rate_summary(self.rate_limiter.current_rate(), self.stats['rate_limit']):
+            print(line)
         print(f"⏱️  소요 시간: {elapsed_time/60:.1f}분")
         print(f"📁 저장 위치: {os.path.abspath(self.base_folder)}")
         print("="*60 + "\n")
@@ -325,18 +427,36 @@ class NaverPlaceCapturer:
             print(f"⚠️  실패 목록 저장 오류: {e}")
 
 def main():
-    if len(sys.argv) < 2:
-        print("사용법: python capture_naver_place.py <엑셀파일경로>")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description="네이버 플레이스 캡처 도구")
+    parser.add_argument('excel_path', help='엑셀 파일 경로')
+    add_worker_arguments(parser)
+    add_browser_arguments(parser, allow_block_images=False)
+    add_blocker_arguments(parser, 'capture')
+    add_attach_arguments(parser)
+    add_checkpoint_arguments(parser)
+    add_retry_arguments(parser)
+    add_rate_arguments(parser)
+    args = parser.parse_args()
     
-    excel_path = sys.argv[1]
+    excel_path = args.excel_path
     
     if not os.path.exists(excel_path):
         print(f"❌ 파일을 찾을 수 없습니다: {excel_path}")
         sys.exit(1)
     
-    capturer = NaverPlaceCapturer(excel_path)
-    capturer.run()
+    if args.retry_failed and not os.path.exists(args.retry_failed):
+        print(f"❌ 실패 목록을 찾을 수 없습니다: {args.retry_failed}")
+        sys.exit(1)
+    
+    options = browser_options_from_args(args)
+    options.update(blocker_options_from_args(args))
+    options.update(attach_options_from_args(args, need_images=True))
+    options.update(checkpoint_options_from_args(args))
+    options.update(retry_options_from_args(args))
+    options.update(rate_options_from_args(args))
+    
+    capturer = NaverPlaceCapturer(excel_path, **options)
+    capturer.run(workers=args.workers, worker_options=options)
 
 if __name__ == "__main__":
     main()
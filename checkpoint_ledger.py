@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+매장별 처리 결과 체크포인트 (SQLite) + 이어서 실행 (--resume)
+
+실행 중 중단(Ctrl+C / 크래시)되면 다음 실행이 처음 행부터 다시 시작해서
+이미 끝난 매장도 페이지를 다시 열고, 사진을 다시 받고, 링크 파일을 다시 썼음.
+- 매장 하나가 끝날 때마다 결과(상태 / 사진 수 / 시각)를 checkpoint.db에 기록
+- --resume이면 시작할 때 완료 매장 키를 한 번에 읽어 집합으로 두고 행마다 O(1)로 건너뜀
+- 실패 매장은 실패 분류(failure_classes)도 기록 - 영구 실패(선택자 못 찾음 / 죽은 링크 등)는 --resume에서도 건너뜀
+- 도구별(tool 열)로 구분하므로 V4 / 가격표 추출 / 플레이스 캡처가 같은 파일을 공유
+- 멀티 브라우저 모드(--workers)의 워커 프로세스는 각자 연결 (WAL 모드 + 잠금 대기)
+
+단계별 체크포인트 (phases 테이블):
+- 매장 작업을 단계(링크 파일 / 사진 URL 추출 / 사진 다운로드 / 가격표 / 플레이스 캡처)로 나눠 각각 기록
+- stores와 같이 도구별(tool 열)로 구분 - 다른 도구가 같은 매장의 단계 기록을 덮어쓰지 않음
+- 추출한 사진 URL 목록과 다운로드에 실패한 사진 목록도 JSON으로 보관
+  → 다시 실행할 때 실패한 단계만 재시도 (예: 못 받은 사진 3개만 Chrome 없이 다시 다운로드)
+- URL 목록을 새로 기록하면 다운로드 단계는 'pending'으로 되돌림 (지난 실행의 실패 목록을 쓰지 않도록)
+
+매장 키: 지역 / 지역상세 / 매장명 (결과 폴더 위치와 같은 기준)
+"""
+
+import os
+import json
+import sqlite3
+import threading
+from datetime import datetime
+
+from failure_classes import TRANSIENT_CLASSES
+
+DEFAULT_CHECKPOINT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'checkpoint.db')
+
+# --resume에서 건너뛸 상태 (링크 없음 / 폴더 없음은 엑셀 수정이나 V4 실행 후 달라질 수 있으므로 다시 처리)
+DONE_STATUSES = ('done', 'no_price')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS stores (
+    tool TEXT NOT NULL,
+    row_key TEXT NOT NULL,
+    status TEXT NOT NULL,
+    photos INTEGER NOT NULL DEFAULT 0,
+    detail TEXT,
+    failure_class TEXT,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (tool, row_key)
+);
+"""
+
+PHASES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS phases (
+    tool TEXT NOT NULL,
+    row_key TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    status TEXT NOT NULL,
+    data TEXT,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (tool, row_key, phase)
+)
+"""
+
+# 매장 작업 단계
+PHASE_LINK_FILE = 'link_file'
+PHASE_URLS = 'urls'
+PHASE_PHOTOS = 'photos'
+PHASE_PRICE = 'price'
+PHASE_CAPTURE = 'capture'
+
+# 새 URL 목록을 기록한 뒤 다운로드 결과가 아직 없는 상태
+PHASE_PENDING = 'pending'
+
+# tool 열이 없던 이전 phases 테이블을 옮길 때 단계별 도구 (당시 단계 이름은 도구마다 달랐음)
+LEGACY_PHASE_TOOLS = {PHASE_LINK_FILE: 'v4', PHASE_URLS: 'v4', PHASE_PHOTOS: 'v4',
+                      PHASE_PRICE: 'price', PHASE_CAPTURE: 'capture'}
+
+
+def add_checkpoint_arguments(parser):
+    """체크포인트 / 이어서 실행 관련 CLI 옵션 추가"""
+    parser.add_argument('--resume', action='store_true',
+                        help='체크포인트에 완료로 기록된 매장은 건너뛰고 이어서 실행')
+    parser.add_argument('--checkpoint', default=DEFAULT_CHECKPOINT_PATH,
+                        help='매장별 처리 결과 체크포인트 파일 (기본: 스크립트 폴더의 checkpoint.db)')
+
+
+# 도구 생성자 옵션 기본값 (checkpoint_options_from_args와 같은 키)
+CHECKPOINT_DEFAULTS = {'resume': False, 'checkpoint': DEFAULT_CHECKPOINT_PATH}
+
+
+def checkpoint_options_from_args(args):
+    """CLI 인자에서 도구 생성자용 체크포인트 옵션 추출"""
+    return {
+        'resume': args.resume,
+        'checkpoint': args.checkpoint
+    }
+
+
+def row_key(row):
+    """체크포인트용 매장 키"""
+    return '|'.join(str(row.get(column, 'unknown')) for column in ('지역', '지역상세', '매장명'))
+
+
+def new_checkpoint_stats():
+    """stats['checkpoint']에 들어갈 빈 통계"""
+    return {'skipped': 0, 'recorded': 0, 'download_only': 0}
+
+
+class CheckpointLedger:
+    def __init__(self, tool_name, path=DEFAULT_CHECKPOINT_PATH, stats=None):
+        self.tool_name = tool_name
+        self.path = path
+        self.stats = stats if stats is not None else new_checkpoint_stats()
+
+        # 연결은 처음 쓸 때 (워커 프로세스마다 따로) 열고, 파이프라인 다운로드 스레드와 공유
+        self.conn = None
+        self.lock = threading.Lock()
+
+    def _connect(self):
+        if self.conn is None:
+            folder = os.path.dirname(self.path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            self.conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.executescript(SCHEMA)
+            self.conn.execute(PHASES_SCHEMA)
+            # 분류 열이 없던 이전 체크포인트 파일
+            columns = [info[1] for info in self.conn.execute("PRAGMA table_info(stores)")]
+            if 'failure_class' not in columns:
+                self.conn.execute("ALTER TABLE stores ADD COLUMN failure_class TEXT")
+            self.conn.commit()
+            self._migrate_phases()
+        return self.conn
+
+    def _migrate_phases(self):
+        """tool 열이 없던 이전 phases 테이블 → 도구별 키로 옮기기 (단계 이름으로 도구 판단)"""
+        conn = self.conn
+        # 워커 프로세스가 동시에 열어도 한 번만 옮기도록 쓰기 잠금을 잡고 다시 확인
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            columns = [info[1] for info in conn.execute("PRAGMA table_info(phases)")]
+            if 'tool' not in columns:
+                conn.execute("ALTER TABLE phases RENAME TO phases_legacy")
+                conn.execute(PHASES_SCHEMA)
+                legacy = conn.execute("SELECT row_key, phase, status, data, updated_at FROM phases_legacy").fetchall()
+                conn.executemany(
+                    "INSERT OR REPLACE INTO phases (tool, row_key, phase, status, data, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [(LEGACY_PHASE_TOOLS.get(item[1], self.tool_name),) + tuple(item) for item in legacy])
+                conn.execute("DROP TABLE phases_legacy")
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+
+    def completed(self):
+        """완료로 기록되었거나 영구 실패로 분류된 매장 키 집합"""
+        done = ', '.join('?' for _ in DONE_STATUSES)
+        transient = ', '.join('?' for _ in TRANSIENT_CLASSES)
+        with self.lock:
+            cursor = self._connect().execute(
+                f"SELECT row_key FROM stores WHERE tool = ? AND (status IN ({done}) "
+                f"OR (failure_class IS NOT NULL AND failure_class NOT IN ({transient})))",
+                (self.tool_name,) + DONE_STATUSES + TRANSIENT_CLASSES)
+            return {key for (key,) in cursor}
+
+    def pending(self, rows):
+        """(행 번호, 행) 목록에서 완료된 매장을 뺀 목록"""
+        done = self.completed()
+        remaining = []
+        for idx, row in rows:
+            if row_key(row) in done:
+                self.stats['skipped'] += 1
+            else:
+                remaining.append((idx, row))
+        if self.stats['skipped']:
+            print(f"⏭️  이어서 실행: 완료 / 영구 실패 매장 {self.stats['skipped']}개 건너뜀, 남은 매장 {len(remaining)}개\n")
+        return remaining
+
+    def record(self, row, status, photos=0, detail=None, failure_class=None):
+        """매장 처리 결과 기록 (같은 매장은 마지막 결과로 덮어씀)"""
+        try:
+            with self.lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO stores (tool, row_key, status, photos, detail, failure_class, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (self.tool_name, row_key(row), status, photos, str(detail)[:500] if detail else None,
+                     failure_class, datetime.now().isoformat(timespec='seconds')))
+                conn.commit()
+                self.stats['recorded'] += 1
+        except sqlite3.Error as e:
+            print(f"   ⚠️  체크포인트 기록 실패: {e}")
+
+    def record_phase(self, row, phase, status, data=None):
+        """매장의 단계 하나 결과 기록 (data는 JSON으로 저장 - URL 목록, 실패한 사진 등)"""
+        try:
+            with self.lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO phases (tool, row_key, phase, status, data, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (self.tool_name, row_key(row), phase, status,
+                     json.dumps(data, ensure_ascii=False) if data is not None else None,
+                     datetime.now().isoformat(timespec='seconds')))
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"   ⚠️  단계 체크포인트 기록 실패: {e}")
+
+    def record_urls(self, row, urls):
+        """추출한 사진 URL 목록 기록 + 다운로드 단계 초기화 (지난 실행의 실패 목록은 새 URL 목록과 맞지 않음)"""
+        now = datetime.now().isoformat(timespec='seconds')
+        try:
+            with self.lock:
+                conn = self._connect()
+                conn.executemany(
+                    "INSERT OR REPLACE INTO phases (tool, row_key, phase, status, data, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [(self.tool_name, row_key(row), PHASE_URLS, 'done', json.dumps(urls, ensure_ascii=False), now),
+                     (self.tool_name, row_key(row), PHASE_PHOTOS, PHASE_PENDING, None, now)])
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"   ⚠️  단계 체크포인트 기록 실패: {e}")
+
+    def load_phases(self, phases):
+        """이 도구의 지정한 단계들 기록을 한 번에 읽기 - {매장 키: {단계: {'status', 'data'}}}"""
+        placeholders = ', '.join('?' for _ in phases)
+        with self.lock:
+            cursor = self._connect().execute(
+                f"SELECT row_key, phase, status, data FROM phases WHERE tool = ? AND phase IN ({placeholders})",
+                (self.tool_name,) + tuple(phases))
+            result = {}
+            for key, phase, status, data in cursor:
+                result.setdefault(key, {})[phase] = {'status': status,
+                                                     'data': json.loads(data) if data else None}
+            return result
+
+    def close(self):
+        with self.lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+
+
+def format_checkpoint_summary(stats):
+    """최종 통계용 체크포인트 요약"""
+    if not stats or not (stats.get('skipped') or stats.get('recorded')):
+        return []
+    line = f"⏭️  체크포인트: 이어서 실행으로 건너뜀 {stats['skipped']}개, 결과 기록 {stats['recorded']}개"
+    if stats.get('download_only'):
+        line += f", 브라우저 없이 사진만 다시 받은 매장 {stats['download_only']}개"
+    return [line]
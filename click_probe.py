@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+여러 선택자를 한 번의 JavaScript 호출로 시도하는 클릭 탐색기
+
+기존 탭/버튼 클릭은 XPath 방법을 하나씩 find_elements로 시도해서
+빗나갈 때마다 implicitly_wait(10초)를 기다리고, 요소마다 is_displayed / is_enabled
+왕복 호출이 추가로 들었음. 이 모듈은:
+- 후보 선택자 목록(전략)을 한 번의 execute_script로 전달
+- 페이지 안에서 순서대로 찾고 보이는지 / 텍스트 조건을 확인
+- 처음 맞는 요소를 클릭하고 어떤 전략이 맞았는지 반환
+- 대상(사진 탭, 업체 버튼 등)별 전략 적중 횟수 기록 → 최종 통계 출력
+
+전략 형식 (dict):
+    name: 통계에 표시할 전략 이름
+    xpath 또는 css: 후보 요소 선택자 (css는 목록 가능)
+    text_equals / text_prefix / text_contains: 요소 텍스트(trim) 조건 (선택)
+    enabled: True면 disabled 요소 제외 (선택)
+    parent: True면 부모 요소 클릭 (선택)
+
+사용 예:
+    self.click_probe = ClickProbe(self.stats.setdefault('click_probe', {}))
+    if self.click_probe.click(self.driver, '사진 탭', PHOTO_TAB_STRATEGIES):
+        ...
+"""
+
+# 실패(어느 전략도 맞지 않음) 집계 키
+MISS_KEY = '실패'
+
+PROBE_SCRIPT = """
+var strategies = arguments[0];
+
+function visible(el) {
+    if (!el.getClientRects || !el.getClientRects().length) return false;
+    var style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none';
+}
+
+function candidates(st) {
+    var nodes = [];
+    if (st.xpath) {
+        var result = document.evaluate(st.xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (var k = 0; k < result.snapshotLength; k++) nodes.push(result.snapshotItem(k));
+    } else {
+        var selectors = [].concat(st.css || []);
+        for (var s = 0; s < selectors.length; s++) {
+            var found = document.querySelectorAll(selectors[s]);
+            for (var k = 0; k < found.length; k++) nodes.push(found[k]);
+        }
+    }
+    return nodes;
+}
+
+for (var i = 0; i < strategies.length; i++) {
+    var st = strategies[i];
+    var nodes;
+    try {
+        nodes = candidates(st);
+    } catch (e) {
+        continue;
+    }
+
+    for (var j = 0; j < nodes.length; j++) {
+        var el = nodes[j];
+        if (el.nodeType !== 1 || !visible(el)) continue;
+        if (st.enabled && el.disabled) continue;
+
+        var text = (el.innerText || el.textContent || '').trim();
+        if (st.text_equals && text !== st.text_equals) continue;
+        if (st.text_prefix && text.indexOf(st.text_prefix) !== 0) continue;
+        if (st.text_contains && text.indexOf(st.text_contains) === -1) continue;
+
+        var target = st.parent ? el.parentElement : el;
+        if (!target) continue;
+        target.click();
+        return {strategy: st.name, tag: target.tagName.toLowerCase(), text: text.slice(0, 30)};
+    }
+}
+return null;
+"""
+
+# V4 사진 탭: 정확한 텍스트 → 포함 검색 후 텍스트 일치
+PHOTO_TAB_STRATEGIES = [
+    {'name': '텍스트 일치', 'xpath': "//*[text()='사진']", 'enabled': True},
+    {'name': '포함 검색', 'xpath': "//*[contains(text(), '사진')]", 'text_equals': '사진'},
+]
+
+# V3 사진 탭: 기존 방법 1~5를 같은 순서로
+PHOTO_TAB_FULL_STRATEGIES = [
+    {'name': '텍스트', 'xpath': "//*[contains(text(), '사진')]", 'enabled': True, 'text_prefix': '사진'},
+    {'name': 'a 태그', 'xpath': "//a[contains(., '사진')]"},
+    {'name': 'span 부모', 'xpath': "//span[contains(., '사진')]", 'parent': True},
+    {'name': '탭 클래스', 'css': ["[class*='tab']", "[class*='Tab']", "[role='tab']",
+                             "[class*='menu'] a", "[class*='nav'] a"], 'text_contains': '사진'},
+    {'name': '클릭 가능 요소', 'xpath': "//*[@onclick or @href or @role='button' or self::a or self::button]",
+     'text_contains': '사진'},
+]
+
+# 사진 카테고리 '업체' 버튼
+COMPANY_CATEGORY_STRATEGIES = [
+    {'name': '텍스트 일치', 'xpath': "//*[text()='업체']"},
+]
+
+
+class ClickProbe:
+    def __init__(self, stats=None):
+        # 대상 이름 -> {전략 이름: 적중 횟수}
+        self.stats = stats if stats is not None else {}
+        # 마지막 스크립트 오류 (드라이버 크래시 / 시간 초과 분류용, 정상 실행이면 None)
+        self.last_error = None
+
+    def click(self, driver, target, strategies):
+        """전략 목록을 한 번에 시도해서 첫 번째로 맞는 요소 클릭
+
+        반환: {'strategy', 'tag', 'text'} 또는 None (맞는 요소 없음 / 스크립트 오류)
+        """
+        self.last_error = None
+        try:
+            result = driver.execute_script(PROBE_SCRIPT, strategies)
+        except Exception as e:
+            self.last_error = e
+            result = None
+        return self.record(target, result)
+
+    def record(self, target, result):
+        """탐색 결과 집계 (비동기 백엔드처럼 스크립트를 직접 실행한 경우에도 사용)"""
+        hits = self.stats.setdefault(target, {})
+        key = result['strategy'] if result else MISS_KEY
+        hits[key] = hits.get(key, 0) + 1
+        return result
+
+
+def format_probe_summary(stats):
+    """최종 통계용 대상별 전략 적중 횟수"""
+    if not stats:
+        return []
+
+    lines = ["🎯 클릭 선택자 적중:"]
+    for target, hits in stats.items():
+        detail = ', '.join(f"{name} {count}회" for name, count in
+                           sorted(hits.items(), key=lambda item: (item[0] == MISS_KEY, -item[1])))
+        lines.append(f"   - {target}: {detail}")
+    return lines
@@ -8,6 +8,8 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 
+from frame_locator import frame_keys, load_frame_cache, MAIN_FRAME
+
 def analyze_naver_map(url):
     chrome_options = Options()
     # headless 모드 끄기 - 화면 보면서 디버깅
@@ -66,14 +68,26 @@ def analyze_naver_map(url):
         iframes = driver.find_elements(By.TAG_NAME, "iframe")
         print(f"   발견된 iframe: {len(iframes)}개")
         
+        # 프레임 키 (frame_cache.json과 같은 형식) + 다른 도구가 캐시해 둔 위치 표시
+        keys = frame_keys(driver)
+        cached = load_frame_cache()
         for idx, iframe in enumerate(iframes):
             try:
                 src = iframe.get_attribute('src')
                 id_attr = iframe.get_attribute('id')
                 print(f"   [{idx}] src: {src[:50]}... id: {id_attr}")
+                if idx < len(keys):
+                    purposes = [purpose for purpose, entry in cached.items() if entry.get('key') == keys[idx]]
+                    mark = f" ← 캐시: {', '.join(purposes)}" if purposes else ""
+                    print(f"        key: {keys[idx]}{mark}")
             except:
                 pass
         
+        for purpose, entry in cached.items():
+            key = entry.get('key')
+            if key != MAIN_FRAME and key not in keys:
+                print(f"   ⚠️  캐시된 {purpose} 프레임({key})이 이 페이지에 없음")
+        
         # 4. 사진 관련 요소 찾기
         print("\n4️⃣ '사진' 텍스트 포함 요소:")
         photo_elements = driver.find_elements(By.XPATH, "//*[contains(., '사진')]")
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+DOM 이미지 URL 수집기 (execute_script 한 번으로 수집)
+
+기존 방식은 img 요소마다 get_attribute('src')를 호출해서
+사진 그리드 하나에 chromedriver HTTP 요청이 수백 번 발생했음.
+이 모듈은 브라우저 안에서 한 번에 모아서 배열로 돌려줌:
+- img src / currentSrc
+- data-src
+- srcset (img, source)
+- CSS background-image (인라인 + 계산된 스타일)
+
+네이버 CDN 도메인으로 필터링된 URL만 반환
+원본 크기 변환(canonical_urls)은 Selenium / 비동기 백엔드가 같이 사용
+"""
+
+import re
+
+# 네이버 CDN 도메인 (V3/V4 기준)
+CDN_DOMAINS = ['phinf.pstatic.net', 'blogpfthumb', 'postfiles']
+
+HARVEST_SCRIPT = """
+var domains = arguments[0];
+var urls = [];
+var seen = {};
+
+function add(url) {
+    if (!url) return;
+    url = url.trim();
+    if (url.indexOf('//') === 0) url = 'https:' + url;
+    if (url.indexOf('http') !== 0) return;
+    var matched = false;
+    for (var i = 0; i < domains.length; i++) {
+        if (url.indexOf(domains[i]) !== -1) { matched = true; break; }
+    }
+    if (matched && !seen[url]) {
+        seen[url] = true;
+        urls.push(url);
+    }
+}
+
+function addSrcset(srcset) {
+    if (!srcset) return;
+    var parts = srcset.split(',');
+    for (var i = 0; i < parts.length; i++) {
+        add(parts[i].trim().split(/\\s+/)[0]);
+    }
+}
+
+function addBackground(value) {
+    if (!value || value === 'none') return;
+    var re = /url\\((['"]?)(.*?)\\1\\)/g;
+    var m;
+    while ((m = re.exec(value)) !== null) add(m[2]);
+}
+
+var imgs = document.images;
+for (var i = 0; i < imgs.length; i++) {
+    add(imgs[i].getAttribute('src'));
+    add(imgs[i].currentSrc);
+    add(imgs[i].getAttribute('data-src'));
+    addSrcset(imgs[i].getAttribute('srcset'));
+}
+
+var dataSrc = document.querySelectorAll('[data-src]');
+for (var i = 0; i < dataSrc.length; i++) add(dataSrc[i].getAttribute('data-src'));
+
+var sources = document.querySelectorAll('source[srcset]');
+for (var i = 0; i < sources.length; i++) addSrcset(sources[i].getAttribute('srcset'));
+
+var all = document.body ? document.body.getElementsByTagName('*') : [];
+for (var i = 0; i < all.length; i++) {
+    var el = all[i];
+    if (el.style && el.style.backgroundImage) addBackground(el.style.backgroundImage);
+    addBackground(window.getComputedStyle(el).backgroundImage);
+}
+
+return urls;
+"""
+
+
+def harvest_image_urls(driver, domains=None):
+    """현재 문서(프레임)의 이미지 후보 URL을 한 번의 execute_script로 수집"""
+    return driver.execute_script(HARVEST_SCRIPT, domains or CDN_DOMAINS) or []
+
+
+# 썸네일 크기 파라미터 → 원본(w1200) 크기
+ORIGINAL_SIZE_PATTERNS = [
+    (r'\?type=w\d+', '?type=w1200'),
+    (r'\?type=m\d+', '?type=w1200'),
+    (r'\?type=a\d+', '?type=w1200'),
+    (r'/type=w\d+/', '/type=w1200/'),
+]
+
+
+def to_original_size(url):
+    """썸네일 URL을 원본 크기로 변환"""
+    for pattern, replacement in ORIGINAL_SIZE_PATTERNS:
+        url = re.sub(pattern, replacement, url)
+
+    # 썸네일 크기 제거
+    return re.sub(r'_[0-9]+x[0-9]+', '', url)
+
+
+def canonical_urls(sources):
+    """원본 크기로 변환 + 중복 제거 (순서 유지)"""
+    photos = []
+    for src in sources:
+        original_src = to_original_size(src)
+        if original_src not in photos:
+            photos.append(original_src)
+    return photos
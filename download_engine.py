@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+사진 다운로드 엔진 (동시 다운로드)
+
+기능:
+- 워커 수를 제한한 동시 다운로드 (ThreadPoolExecutor)
+- 호스트별 동시 접속 수 제한 (phinf.pstatic.net, blogpfthumb)
+  (멀티 브라우저 모드에서는 워커 프로세스 수로 나눠서 실행 전체 합계가 제한을 넘지 않도록 - split_host_limits)
+- 파일명 번호는 호출 측에서 지정 (예: 업체_001) - 확장자만 Content-Type으로 결정
+- 공유 HTTP 세션 풀 사용 (keep-alive 연결 재사용)
+- 청크 단위 스트리밍 저장: 같은 폴더의 임시 파일(.part)에 쓴 뒤 완료 시 원자적 rename
+  (중단된 실행이 완전한 파일처럼 보이는 잘린 업체_NNN.jpg를 남기지 않음)
+
+사용 예:
+    engine = PhotoDownloadEngine(max_workers=8)
+    tasks = [{'url': url, 'folder': folder, 'name': f"업체_{idx:03d}"}
+             for idx, url in enumerate(photos, 1)]
+    results = engine.download(tasks)
+"""
+
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
+
+from http_session import get_shared_session, DEFAULT_POOL_SIZE
+
+DEFAULT_WORKERS = 8
+DEFAULT_CHUNK_KB = 64
+
+# 호스트별 동시 접속 제한 (앞에서부터 매칭 - blogpfthumb-phinf.pstatic.net 때문에 blogpfthumb가 먼저)
+DEFAULT_HOST_LIMITS = {
+    'blogpfthumb': 2,
+    'phinf.pstatic.net': 4,
+}
+
+
+def guess_extension(content_type):
+    """Content-Type으로 확장자 결정"""
+    content_type = content_type or ''
+    if 'png' in content_type:
+        return '.png'
+    if 'webp' in content_type:
+        return '.webp'
+    return '.jpg'
+
+
+def format_bytes(size):
+    """바이트 수를 읽기 쉬운 단위로 변환"""
+    if size < 1024:
+        return f"{size}B"
+    for unit in ['KB', 'MB', 'GB']:
+        size /= 1024
+        if size < 1024 or unit == 'GB':
+            return f"{size:.1f}{unit}"
+
+
+def add_download_arguments(parser):
+    """다운로드 엔진 관련 CLI 옵션 추가"""
+    parser.add_argument('--download-workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'동시 다운로드 워커 수 (기본: {DEFAULT_WORKERS})')
+    parser.add_argument('--host-limit', type=int, default=None,
+                        help='호스트별 동시 접속 수 - --workers면 워커끼리 나눔 (기본: phinf 4, blogpfthumb 2)')
+    parser.add_argument('--http-pool-size', type=int, default=DEFAULT_POOL_SIZE,
+                        help=f'HTTP 연결 풀 크기 (기본: {DEFAULT_POOL_SIZE})')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_KB,
+                        help=f'스트리밍 다운로드 청크 크기 KB (기본: {DEFAULT_CHUNK_KB})')
+
+
+# 도구 생성자 옵션 기본값 (download_options_from_args와 같은 키)
+DOWNLOAD_DEFAULTS = {
+    'download_workers': DEFAULT_WORKERS,
+    'host_limit': None,
+    'http_pool_size': DEFAULT_POOL_SIZE,
+    'chunk_kb': DEFAULT_CHUNK_KB
+}
+
+
+def download_options_from_args(args):
+    """CLI 인자에서 도구 생성자용 다운로드 옵션 추출"""
+    return {
+        'download_workers': args.download_workers,
+        'host_limit': args.host_limit,
+        'http_pool_size': args.http_pool_size,
+        'chunk_kb': args.chunk_size
+    }
+
+
+def host_limits_from_arg(host_limit):
+    """--host-limit 값으로 호스트별 제한 딕셔너리 생성"""
+    if not host_limit:
+        return dict(DEFAULT_HOST_LIMITS)
+    return {host: host_limit for host in DEFAULT_HOST_LIMITS}
+
+
+class PhotoDownloadEngine:
+    def __init__(self, max_workers=DEFAULT_WORKERS, host_limits=None, timeout=15, session=None,
+                 chunk_kb=DEFAULT_CHUNK_KB):
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.chunk_size = max(1, chunk_kb) * 1024
+        self.session = session or get_shared_session()
+        self.host_limits = host_limits if host_limits is not None else dict(DEFAULT_HOST_LIMITS)
+        # 호스트 키별 세마포어 (엔진 인스턴스 전체에서 공유)
+        self.host_semaphores = self._make_semaphores(self.host_limits)
+
+        # 누적 저장 바이트 수
+        self.bytes_written = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _make_semaphores(host_limits):
+        return {host: threading.BoundedSemaphore(max(1, limit)) for host, limit in host_limits.items()}
+
+    def split_host_limits(self, parts):
+        """호스트별 제한을 프로세스 parts개가 나눠 쓰도록 줄임 (프로세스마다 최소 1)
+
+        세마포어는 프로세스 안에서만 공유되므로 --workers N이면 제한이 N배가 되는 것을 막음.
+        다운로드 시작 전에 호출해야 함.
+        """
+        if parts <= 1:
+            return
+        self.host_limits = {host: max(1, limit // parts) for host, limit in self.host_limits.items()}
+        self.host_semaphores = self._make_semaphores(self.host_limits)
+
+    def _host_semaphore(self, url):
+        """URL 호스트에 해당하는 세마포어 (제한 없는 호스트면 None)"""
+        netloc = urlparse(url).netloc
+        for host, semaphore in self.host_semaphores.items():
+            if host in netloc:
+                return semaphore
+        return None
+
+    def _fetch(self, task):
+        """단일 파일 다운로드 (스트리밍 → 임시 파일 → rename)"""
+        result = {'task': task, 'ok': False, 'filepath': None, 'size': 0, 'error': None, 'status': None}
+        semaphore = self._host_semaphore(task['url'])
+        temp_path = None
+
+        try:
+            if semaphore:
+                semaphore.acquire()
+            try:
+                with self.session.get(task['url'], timeout=self.timeout, stream=True) as response:
+                    if response.status_code != 200:
+                        result['error'] = f"HTTP {response.status_code}"
+                        result['status'] = response.status_code
+                        return result
+
+                    ext = guess_extension(response.headers.get('Content-Type', ''))
+                    filepath = os.path.join(task['folder'], f"{task['name']}{ext}")
+
+                    # 같은 폴더에 임시 파일 생성 (rename이 같은 파일시스템 안에서 원자적으로 동작)
+                    fd, temp_path = tempfile.mkstemp(dir=task['folder'], prefix=f".{task['name']}.", suffix='.part')
+                    size = 0
+                    with os.fdopen(fd, 'wb') as f:
+                        for chunk in response.iter_content(chunk_size=self.chunk_size):
+                            if chunk:
+                                f.write(chunk)
+                                size += len(chunk)
+            finally:
+                if semaphore:
+                    semaphore.release()
+
+            os.replace(temp_path, filepath)
+            temp_path = None
+
+            with self.lock:
+                self.bytes_written += size
+
+            result['ok'] = True
+            result['filepath'] = filepath
+            result['size'] = size
+
+        except Exception as e:
+            result['error'] = str(e)
+
+        finally:
+            # 실패한 임시 파일 정리
+            if temp_path and os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+
+        return result
+
+    def download(self, tasks, progress_every=5):
+        """작업 목록 동시 다운로드 - 결과는 작업 순서대로 반환"""
+        if not tasks:
+            return []
+
+        for folder in {task['folder'] for task in tasks}:
+            os.makedirs(folder, exist_ok=True)
+
+        results = [None] * len(tasks)
+        done = 0
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(tasks))) as executor:
+            futures = {executor.submit(self._fetch, task): i for i, task in enumerate(tasks)}
+
+            for future in as_completed(futures):
+                i = futures[future]
+                result = future.result()
+                results[i] = result
+                done += 1
+
+                if not result['ok']:
+                    print(f"   ⚠️  다운로드 실패 [{result['task']['name']}]: {result['error'][:50]}")
+
+                if progress_every and (done % progress_every == 0 or done == len(tasks)):
+                    print(f"      [{done}/{len(tasks)}] 완료")
+
+        return results
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Chrome 드라이버 상태 감시 + 주기적 재시작 (장시간 실행용)
+
+setup_driver에서 만든 드라이버 하나로 수천 개 매장을 처리하면
+렌더러 메모리가 계속 늘고 페이지 로드도 점점 느려짐. 이 모듈은 매장 사이마다:
+- 드라이버가 죽었는지(크래시) 확인 → 재시작 후 방금 매장을 한 번 더 처리
+- 재시작 후 처리한 매장 수가 기준(--recycle-stores)을 넘으면 재시작
+- chromedriver + Chrome 프로세스 메모리(RSS)가 기준(--max-memory-mb)을 넘으면 재시작
+- 최근 페이지 로드 시간 평균이 기준(--max-load-seconds)을 넘으면 재시작
+- 재시작마다 사유를 로그로 남기고 사유별 횟수 집계
+
+재시작은 매장 사이에만 일어나므로 처리 중인 행은 잃지 않음.
+프레임 위치 캐시(frame_cache.json) / 링크 캐시 등은 도구 객체에 있으므로 그대로 유지.
+상주 브라우저 데몬에 연결(--attach)했으면 Chrome은 데몬 소유라 재시작해도 같은 브라우저에
+다시 붙으므로 매장 수 / 메모리 기준은 건너뜀 (크래시 / 로드 시간 기준만 적용).
+매장 수 / 로드 시간은 재시작 경로(이 모듈 / 매장 제한 시간 감시)와 관계없이 새 드라이버부터 다시 셈.
+
+도구 규약: driver, setup_driver(), attach(데몬 주소 또는 None), stats 딕셔너리
+"""
+
+import os
+
+from store_watchdog import child_pids, snapshot_outcome, restore_outcome
+
+DEFAULT_RECYCLE_STORES = 100
+DEFAULT_MAX_MEMORY_MB = 1500
+DEFAULT_MAX_LOAD_SECONDS = 15
+
+# 로드 시간 평균을 낼 최근 매장 수 (재시작 직후 몇 개 매장으로 판단하지 않도록 최소 개수 적용)
+LOAD_WINDOW = 10
+MIN_LOAD_SAMPLES = 5
+
+LOAD_TIME_SCRIPT = """
+var nav = performance.getEntriesByType('navigation')[0];
+if (!nav) return null;
+var end = nav.loadEventEnd || nav.domContentLoadedEventEnd || nav.responseEnd;
+return end ? end - nav.startTime : null;
+"""
+
+# /proc 없는 환경(Windows)에서는 렌더러 JS 힙으로 대신 확인
+JS_HEAP_SCRIPT = "return performance.memory ? performance.memory.usedJSHeapSize : null;"
+
+
+def add_health_arguments(parser):
+    """드라이버 재시작 기준 관련 CLI 옵션 추가"""
+    parser.add_argument('--recycle-stores', type=int, default=DEFAULT_RECYCLE_STORES,
+                        help=f'매장 N개마다 드라이버 재시작, 0이면 끔 (기본: {DEFAULT_RECYCLE_STORES})')
+    parser.add_argument('--max-memory-mb', type=int, default=DEFAULT_MAX_MEMORY_MB,
+                        help=f'Chrome 메모리가 넘으면 재시작(MB), 0이면 끔 (기본: {DEFAULT_MAX_MEMORY_MB})')
+    parser.add_argument('--max-load-seconds', type=float, default=DEFAULT_MAX_LOAD_SECONDS,
+                        help=f'최근 평균 페이지 로드 시간이 넘으면 재시작(초), 0이면 끔 (기본: {DEFAULT_MAX_LOAD_SECONDS})')
+
+
+# 도구 생성자 옵션 기본값 (health_options_from_args와 같은 키)
+HEALTH_DEFAULTS = {
+    'recycle_stores': DEFAULT_RECYCLE_STORES,
+    'max_memory_mb': DEFAULT_MAX_MEMORY_MB,
+    'max_load_seconds': DEFAULT_MAX_LOAD_SECONDS
+}
+
+
+def health_options_from_args(args):
+    """CLI 인자에서 도구 생성자용 재시작 기준 옵션 추출"""
+    return {
+        'recycle_stores': args.recycle_stores,
+        'max_memory_mb': args.max_memory_mb,
+        'max_load_seconds': args.max_load_seconds
+    }
+
+
+def driver_memory_mb(driver):
+    """chromedriver와 하위 Chrome 프로세스의 메모리 합계(MB) - 확인할 수 없으면 None"""
+    process = getattr(getattr(driver, 'service', None), 'process', None)
+    if process and os.path.isdir('/proc'):
+        page_size = os.sysconf('SC_PAGE_SIZE')
+        total = 0
+        for pid in [process.pid] + child_pids(process.pid):
+            try:
+                with open(f'/proc/{pid}/statm', 'r') as f:
+                    total += int(f.read().split()[1]) * page_size
+            except (OSError, IndexError, ValueError):
+                continue
+        if total:
+            return total / 1024 / 1024
+
+    try:
+        heap = driver.execute_script(JS_HEAP_SCRIPT)
+        return heap / 1024 / 1024 if heap else None
+    except Exception:
+        return None
+
+
+def driver_alive(driver):
+    """드라이버 / 브라우저가 응답하는지 확인"""
+    if driver is None:
+        return False
+    try:
+        driver.window_handles
+        return True
+    except Exception:
+        return False
+
+
+def new_health_stats():
+    """stats['driver_health']에 들어갈 빈 통계"""
+    return {'restarts': 0, 'reasons': {}, 'crash_retries': 0}
+
+
+class DriverHealth:
+    def __init__(self, recycle_stores=DEFAULT_RECYCLE_STORES, max_memory_mb=DEFAULT_MAX_MEMORY_MB,
+                 max_load_seconds=DEFAULT_MAX_LOAD_SECONDS, stats=None):
+        self.recycle_stores = max(0, recycle_stores or 0)
+        self.max_memory_mb = max(0, max_memory_mb or 0)
+        self.max_load_seconds = max(0, max_load_seconds or 0)
+
+        self.stats = stats if stats is not None else new_health_stats()
+
+        self.stores_since_start = 0
+        self.load_times = []
+
+    def run(self, tool, idx, row, runner):
+        """runner(tool, idx, row)로 매장 처리 → 크래시면 재시작 후 한 번 더, 아니면 재시작 기준 확인"""
+        snapshot = snapshot_outcome(tool)
+        driver = tool.driver
+        result = runner(tool, idx, row)
+
+        if not driver_alive(tool.driver):
+            # 크래시로 실패한 매장은 결과를 되돌리고 새 드라이버로 다시 처리
+            restore_outcome(tool, snapshot)
+            self.restart(tool, '크래시', '드라이버 응답 없음')
+            self.stats['crash_retries'] += 1
+            return runner(tool, idx, row)
+
+        if tool.driver is not driver:
+            # runner 안에서 드라이버가 새로 시작됨 (매장 제한 시간 초과 복구) - 새 드라이버 기준으로 다시 셈
+            self.reset()
+            return result
+
+        self.after_store(tool)
+        return result
+
+    def after_store(self, tool):
+        """매장 하나 처리 후 재시작 기준 확인"""
+        self.stores_since_start += 1
+        self._record_load_time(tool.driver)
+
+        # 데몬 연결 중에는 같은 Chrome에 다시 붙을 뿐이므로 매장 수 / 메모리 기준 건너뜀
+        attached = bool(getattr(tool, 'attach', None))
+
+        if not attached and self.recycle_stores and self.stores_since_start >= self.recycle_stores:
+            self.restart(tool, '매장 수', f'{self.stores_since_start}개 처리')
+            return
+
+        if not attached and self.max_memory_mb:
+            memory = driver_memory_mb(tool.driver)
+            if memory and memory > self.max_memory_mb:
+                self.restart(tool, '메모리', f'{memory:.0f}MB > {self.max_memory_mb}MB')
+                return
+
+        if self.max_load_seconds and len(self.load_times) >= MIN_LOAD_SAMPLES:
+            average = sum(self.load_times) / len(self.load_times)
+            if average > self.max_load_seconds:
+                self.restart(tool, '로드 시간', f'최근 평균 {average:.1f}초 > {self.max_load_seconds}초')
+
+    def _record_load_time(self, driver):
+        """최상위 문서의 로드 시간 기록 (최근 LOAD_WINDOW개만 유지)"""
+        try:
+            driver.switch_to.default_content()
+            load_ms = driver.execute_script(LOAD_TIME_SCRIPT)
+        except Exception:
+            return
+        if load_ms:
+            self.load_times = (self.load_times + [load_ms / 1000])[-LOAD_WINDOW:]
+
+    def restart(self, tool, reason, detail):
+        """드라이버 종료 후 새로 시작 - 사유 로그 + 사유별 집계"""
+        print(f"\n   ♻️  드라이버 재시작 - 사유: {reason} ({detail})")
+        try:
+            tool.driver.quit()
+        except Exception:
+            pass
+        tool.driver = None
+        tool.setup_driver()
+
+        self.stats['restarts'] += 1
+        self.stats['reasons'][reason] = self.stats['reasons'].get(reason, 0) + 1
+        self.reset()
+
+    def reset(self):
+        """새 드라이버 기준으로 매장 수 / 로드 시간 다시 세기"""
+        self.stores_since_start = 0
+        self.load_times = []
+
+
+def format_health_summary(stats):
+    """최종 통계용 드라이버 재시작 요약"""
+    if not stats or not stats.get('restarts'):
+        return []
+    detail = ', '.join(f"{reason} {count}회" for reason, count in
+                       sorted(stats['reasons'].items(), key=lambda item: -item[1]))
+    line = f"♻️  드라이버 재시작: {stats['restarts']}회 ({detail})"
+    if stats.get('crash_retries'):
+        line += f", 크래시 매장 재처리 {stats['crash_retries']}개"
+    return [line]
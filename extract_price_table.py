@@ -1,37 +1,80 @@
 #!/usr/bin/env python3
 """
 네이버 지도 가격표 추출 도구 (네이버지도링크 사용)
-사용법: python extract_price_table.py <엑셀파일경로>
+사용법: python extract_price_table.py <엑셀파일경로> [--workers N] [--download-workers N] [--link-cache 파일]
 
 기능:
 - 엑셀의 네이버지도링크 사용
 - '가격표 이미지로 보기' 자동 클릭
 - 가격표 이미지 다운로드
 - 각 매장의 업체 폴더에 저장
+- naver.me 단축 링크 사전 해석 (link_cache.json - V4와 공유)
+- 가격표 링크가 있는 프레임 위치 캐시 (frame_cache.json)
+- 매장별 결과 체크포인트 (checkpoint.db - V4 / 캡처와 공유) + 이어서 실행 (--resume)
+- 실패 목록 JSONL (가격표추출_실패_목록.jsonl) + 실패 매장만 다시 처리 (--retry-failed)
+- 실패 원인 분류 (가격표 없음 / 시간 초과 / 선택자 / 크래시 / 죽은 링크 / HTTP) - 일시적 실패만 자동 재시도
+- 요청 속도 자동 조절 (--rate): 워커 공유 토큰 버킷 - 느린 응답 / 캡차 / 오류 화면이면 감속
 """
 
 import os
 import sys
 import time
-import requests
+import argparse
 import pandas as pd
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.common.keys import Keys
 import traceback
 from datetime import datetime
-from urllib.parse import quote
+from browser_daemon import (add_attach_arguments, attach_options_from_args, start_driver, new_startup_stats,
+                            format_startup_summary, ATTACH_DEFAULTS)
+from browser_options import (build_chrome_options, add_browser_arguments, browser_options_from_args,
+                             describe_mode, new_page_metrics, record_page_metrics, format_browser_summary,
+                             FirstUrlTimer, new_first_url_stats, format_page_load_summary, BROWSER_DEFAULTS)
+from checkpoint_ledger import (CheckpointLedger, add_checkpoint_arguments, checkpoint_options_from_args,
+                               new_checkpoint_stats, format_checkpoint_summary, row_key, CHECKPOINT_DEFAULTS,
+                               PHASE_PRICE)
+from driver_health import (DriverHealth, add_health_arguments, health_options_from_args, new_health_stats,
+                           format_health_summary, HEALTH_DEFAULTS)
+from download_engine import (PhotoDownloadEngine, add_download_arguments, download_options_from_args,
+                             host_limits_from_arg, format_bytes, DOWNLOAD_DEFAULTS)
+from failure_classes import (FailureTracker, classify_download, format_failure_summary, LABELS,
+                             NO_PRICE_TABLE, SELECTOR_MISS, DEAD_LINK)
+from failure_ledger import (add_retry_arguments, retry_options_from_args, failure_entry, merge_failure_ledger,
+                            failed_rows, RETRY_DEFAULTS)
+from frame_locator import FrameLocator, add_frame_cache_arguments, frame_cache_options_from_args, FRAME_CACHE_DEFAULTS
+from http_session import get_shared_session
+from link_resolver import (ShortLinkResolver, add_resolver_arguments, resolver_options_from_args,
+                           RESOLVER_DEFAULTS)
+from network_capture import enable_performance_log, PerformanceLog
+from rate_limiter import (RateLimiter, add_rate_arguments, rate_options_from_args, new_rate_stats, format_rate_summary,
+                          RATE_DEFAULTS)
+from request_blocker import (RequestBlocker, add_blocker_arguments, blocker_options_from_args, new_block_stats,
+                             BLOCKER_DEFAULTS)
+from store_watchdog import (StoreWatchdog, add_watchdog_arguments, watchdog_options_from_args, format_timeout_summary,
+                            WATCHDOG_DEFAULTS)
+from tool_options import ToolOptions, merge_defaults
+from worker_pool import run_parallel, add_worker_arguments
+from wait_engine import (WaitEngine, format_wait_summary, page_iframe_ready, document_ready, element_present,
+                         image_src_changed)
+
+# 가격표 뷰어 선택자
+VIEWER_IMG_SELECTOR = "body > div.StyledPhotoViewer-sc-138rr41-0.dyujdl > div > div.viewer_content > div > div > img"
+VIEWER_NEXT_SELECTOR = "body > div.StyledPhotoViewer-sc-138rr41-0.dyujdl > div > button.btn_next"
+HOME_TAB_SELECTOR = "a.tpj9w._tab-menu[href*='/home']"
+
+# 생성자 옵션 기본값 (기능 모듈별 기본값 + 가격표 전용)
+PRICE_OPTIONS = merge_defaults(
+    DOWNLOAD_DEFAULTS, BROWSER_DEFAULTS, RESOLVER_DEFAULTS, BLOCKER_DEFAULTS, WATCHDOG_DEFAULTS,
+    FRAME_CACHE_DEFAULTS, HEALTH_DEFAULTS, ATTACH_DEFAULTS, CHECKPOINT_DEFAULTS, RETRY_DEFAULTS, RATE_DEFAULTS,
+    {'base_folder': 'downloads', 'block_preset': 'price'}
+)
 
 class NaverMapPriceExtractor:
-    def __init__(self, excel_path, base_folder="downloads"):
+    def __init__(self, excel_path, **options):
+        options = ToolOptions(PRICE_OPTIONS, options)
         self.excel_path = excel_path
         # 현재 스크립트 위치에서 downloads 폴더
         script_dir = os.path.dirname(os.path.abspath(__file__))
-        self.base_folder = os.path.join(script_dir, base_folder)
+        self.base_folder = os.path.join(script_dir, options.base_folder)
         self.driver = None
         self.stats = {
             'total': 0,
@@ -39,28 +82,93 @@ class NaverMapPriceExtractor:
             'failed': 0,
             'no_folder': 0,
             'no_url': 0,
-            'no_price': 0
+            'no_price': 0,
+            'total_bytes': 0
         }
         
+        # 브라우저 모드 (--headless / --block-images) + 문서별 로드 시간 / 전송량 측정
+        self.headless = options.headless
+        self.block_images = options.block_images
+        self.stats['browser'] = new_page_metrics()
+        
+        # 페이지 로드 전략 + 매장별 첫 사진 URL까지 걸린 시간
+        self.page_load = options.page_load
+        self.stats['first_url'] = new_first_url_stats()
+        self.first_url_timer = FirstUrlTimer(self.stats['first_url'])
+        
         # 실패한 매장 기록
         self.failed_stores = []
         
+        # 조건 기반 대기 (조건별 대기 시간은 stats['waits']에 기록)
+        self.waits = WaitEngine(self.stats.setdefault('waits', {}))
+        
+        # 공유 HTTP 세션 풀 + 동시 다운로드 엔진
+        self.http_pool = get_shared_session(options.http_pool_size)
+        self.download_engine = PhotoDownloadEngine(
+            max_workers=options.download_workers,
+            host_limits=host_limits_from_arg(options.host_limit),
+            session=self.http_pool,
+            chunk_kb=options.chunk_kb
+        )
+        
+        # naver.me 단축 링크 → 최종 URL (도구 간 공유 캐시)
+        self.link_resolver = ShortLinkResolver(cache_path=options.link_cache, session=self.http_pool,
+                                               max_workers=options.resolve_workers)
+        self.stats['links'] = self.link_resolver.stats
+        
+        # 가격표 링크가 있는 프레임 키 (frame_cache.json - 실행 간 공유)
+        self.frame_locator = FrameLocator('price_link', options.frame_cache, self.stats.setdefault('frames', {}))
+        
+        # 추출에 필요 없는 요청 차단 (지도 타일 / 폰트 / 통계 / 광고) + 매장별 차단 수 집계
+        self.stats['blocked'] = new_block_stats()
+        self.request_blocker = RequestBlocker(options.block_preset, options.block_patterns,
+                                              enabled=options.block_requests, stats=self.stats['blocked'])
+        self.perf_log = PerformanceLog()
+        
+        # 상주 브라우저 데몬 연결 (없으면 Chrome 새로 실행) + 드라이버 시작 시간
+        self.attach = options.attach
+        self.stats['startup'] = new_startup_stats()
+        
+        # 매장별 제한 시간 감시 + 시간 초과 매장 재시도
+        self.stats['timed_out'] = 0
+        self.stats['timed_out_stores'] = []
+        self.watchdog = StoreWatchdog(options.store_timeout, options.timeout_retries)
+        
+        # 드라이버 상태 감시: 매장 수 / 메모리 / 로드 시간 기준 초과 또는 크래시 시 재시작
+        self.stats['driver_health'] = new_health_stats()
+        self.driver_health = DriverHealth(options.recycle_stores, options.max_memory_mb,
+                                          options.max_load_seconds, stats=self.stats['driver_health'])
+        
+        # 매장별 처리 결과 체크포인트 (--resume이면 완료된 매장 건너뜀)
+        self.resume = options.resume
+        self.stats['checkpoint'] = new_checkpoint_stats()
+        self.checkpoint = CheckpointLedger('price', options.checkpoint, stats=self.stats['checkpoint'])
+        
+        # 실패 목록(JSONL)에 있는 매장만 다시 처리 (기본은 일시적 실패만)
+        self.retry_failed = options.retry_failed
+        self.retry_permanent = options.retry_permanent
+        # 이번 실행에서 처리한 매장 키 - 실패 목록을 병합할 때 이 매장들의 이전 줄만 교체 (워커 결과는 merge_stats로 합쳐짐)
+        self.stats['processed_keys'] = []
+        
+        # 실패 원인 분류 (분류별 실패 매장 수는 stats['failure_classes'])
+        self.failures = FailureTracker(self.stats.setdefault('failure_classes', {}))
+        
+        # 페이지 이동 속도 제한 (워커 모드에서는 rate_shared로 워커 전체가 같은 버킷 사용)
+        self.stats['rate_limit'] = new_rate_stats()
+        self.rate_limiter = RateLimiter(options.rate, options.min_rate, options.max_rate, options.target_load,
+                                        shared=options.rate_shared, stats=self.stats['rate_limit'])
+        
     def setup_driver(self):
         """Chrome 드라이버 설정"""
-        chrome_options = Options()
-        # headless 모드 비활성화 (디버깅용)
-        # chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--start-maximized')
-        chrome_options.add_argument('--lang=ko-KR')
-        chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-        
-        self.driver = webdriver.Chrome(options=chrome_options)
+        chrome_options = build_chrome_options(headless=self.headless, block_images=self.block_images,
+                                              page_load=self.page_load, debugger_address=self.attach)
+        enable_performance_log(chrome_options)  # 차단 요청 집계용
+        
+        self.driver = start_driver(chrome_options, self.attach, self.stats['startup'])
         self.driver.implicitly_wait(10)
-        print("✅ Chrome 드라이버 초기화 완료\n")
+        self.waits.attach(self.driver)
+        self.request_blocker.apply(self.driver)
+        print(f"✅ Chrome 드라이버 초기화 완료 ({describe_mode(self.headless, self.block_images, self.page_load, self.attach)})\n")
         
     def read_excel(self):
         """엑셀 파일 읽기"""
@@ -103,75 +211,100 @@ class NaverMapPriceExtractor:
             
         return company_folder
         
+    def click_price_link_in_frame(self, frame_label):
+        """현재 프레임에서 홈 탭으로 이동 후 '가격표' 링크 클릭 - 찾으면 True"""
+        self.waits.wait_for('iframe 로드', document_ready(), timeout=2, fallback=0.5)
+        
+        # 1. 먼저 홈 탭 클릭 (혹시 다른 탭에 있을 수 있음)
+        # (querySelector 사용 - 홈 탭이 없는 iframe에서 implicitly_wait 10초를 기다리지 않도록)
+        try:
+            home_tab = self.driver.execute_script("return document.querySelector(arguments[0]);", HOME_TAB_SELECTOR)
+            if home_tab and home_tab.get_attribute('aria-selected') != 'true':
+                self.driver.execute_script("arguments[0].click();", home_tab)
+                self.waits.wait_for('홈 탭 전환', element_present(HOME_TAB_SELECTOR + "[aria-selected='true']"),
+                                    timeout=3, fallback=1)
+                print(f"   ✅ 홈 탭으로 이동")
+        except Exception as e:
+            self.failures.note(e)  # 이미 홈 탭에 있을 수 있음 (크래시 / 시간 초과만 의미 있음)
+        
+        # 2. 가격표 링크 찾기
+        try:
+            # a.place_bluelink.iBUwB 찾기 (가격표 이미지로 보기)
+            price_links = self.driver.find_elements(By.CSS_SELECTOR, "a.place_bluelink.iBUwB")
+            
+            for link in price_links:
+                link_text = link.text.strip()
+                
+                if '가격표' in link_text:
+                    print(f"   ✅ {frame_label}에서 가격표 링크 발견: '{link_text}'")
+                    
+                    # 클릭
+                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", link)
+                    self.driver.execute_script("arguments[0].click();", link)
+                    
+                    print(f"   ✅ 가격표 뷰어 열림")
+                    return True
+                    
+        except Exception as e:
+            self.failures.note(e)
+        
+        return False
+    
     def extract_price_table(self, naver_map_url, save_path):
         """네이버 지도에서 가격표 추출"""
         try:
             print(f"   🗺️  네이버 지도 접속 중...")
-            self.driver.get(naver_map_url)
-            time.sleep(4)
-            
-            # iframe 전환
-            iframes = self.driver.find_elements(By.TAG_NAME, "iframe")
-            print(f"   🔍 {len(iframes)}개 iframe 발견")
+            self.rate_limiter.navigate(self.driver, naver_map_url)
+            self.waits.wait_for('페이지 iframe', page_iframe_ready(), timeout=10, fallback=4)
             
             price_button_found = False
             
-            # 모든 iframe 순회
-            for i in range(len(iframes)-1, -1, -1):
-                try:
-                    self.driver.switch_to.default_content()
-                    self.driver.switch_to.frame(iframes[i])
-                    time.sleep(0.5)
-                    
-                    # 1. 먼저 홈 탭 클릭 (혹시 다른 탭에 있을 수 있음)
-                    try:
-                        home_tab = self.driver.find_element(By.CSS_SELECTOR, "a.tpj9w._tab-menu[href*='/home']")
-                        if home_tab.get_attribute('aria-selected') != 'true':
-                            self.driver.execute_script("arguments[0].click();", home_tab)
-                            time.sleep(1)
-                            print(f"   ✅ 홈 탭으로 이동")
-                    except:
-                        pass  # 이미 홈 탭에 있을 수 있음
-                    
-                    # 2. 가격표 링크 찾기
+            # 캐시된 프레임(frame_cache.json)이 있으면 바로 이동
+            if self.frame_locator.key is not None:
+                if self.frame_locator.enter(self.driver):
+                    price_button_found = self.click_price_link_in_frame(self.frame_locator.key)
+                if not price_button_found:
+                    print(f"   ⚠️  캐시된 프레임에서 가격표 링크 없음 - 전체 검색")
+            
+            if not price_button_found:
+                # iframe 전환
+                iframes = self.frame_locator.frames(self.driver)
+                print(f"   🔍 {len(iframes)}개 iframe 발견")
+                
+                # 모든 iframe 순회
+                for i in range(len(iframes)-1, -1, -1):
+                    key, iframe = iframes[i]
+                    if key == self.frame_locator.key:
+                        continue  # 방금 확인한 캐시 프레임
                     try:
-                        # a.place_bluelink.iBUwB 찾기 (가격표 이미지로 보기)
-                        price_links = self.driver.find_elements(By.CSS_SELECTOR, "a.place_bluelink.iBUwB")
+                        self.driver.switch_to.default_content()
+                        self.driver.switch_to.frame(iframe)
                         
-                        for link in price_links:
-                            link_text = link.text.strip()
-                            
-                            if '가격표' in link_text:
-                                print(f"   ✅ iframe [{i+1}]에서 가격표 링크 발견: '{link_text}'")
-                                
-                                # 클릭
-                                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", link)
-                                time.sleep(0.3)
-                                self.driver.execute_script("arguments[0].click();", link)
-                                time.sleep(3)  # 뷰어 로딩 대기
-                                
-                                price_button_found = True
-                                print(f"   ✅ 가격표 뷰어 열림")
-                                break
-                        
-                        if price_button_found:
+                        if self.click_price_link_in_frame(f"iframe [{i+1}]"):
+                            price_button_found = True
+                            # 다른 프레임에서 찾았으면 캐시 교체
+                            self.frame_locator.invalidate()
+                            self.frame_locator.remember(key)
                             break
                             
-                    except:
-                        pass
-                        
-                except:
-                    self.driver.switch_to.default_content()
-                    continue
+                    except Exception as e:
+                        self.failures.note(e)
+                        self.driver.switch_to.default_content()
+                        continue
             
             if not price_button_found:
-                print("   ⚠️  가격표 링크를 찾을 수 없음")
-                self.stats['no_price'] += 1
+                # 크래시 / 시간 초과 때문에 못 찾은 경우는 '가격표 없음'으로 세지 않음
+                failure_class = self.failures.note(NO_PRICE_TABLE)
+                if failure_class == NO_PRICE_TABLE:
+                    print("   ⚠️  가격표 링크를 찾을 수 없음")
+                    self.stats['no_price'] += 1
+                else:
+                    print(f"   ⚠️  가격표 링크를 확인하지 못함 ({LABELS[failure_class]})")
                 return False
             
             # 이제 메인 페이지로 나와서 뷰어에서 이미지 추출
             self.driver.switch_to.default_content()
-            time.sleep(2)
+            self.waits.wait_for('가격표 뷰어', element_present(VIEWER_IMG_SELECTOR), timeout=8, fallback=5)
             
             print("   📸 가격표 이미지 추출 중...")
             
@@ -183,8 +316,7 @@ class NaverMapPriceExtractor:
             for img_idx in range(max_images):
                 try:
                     # 현재 이미지 추출
-                    img_element = self.driver.find_element(By.CSS_SELECTOR, 
-                        "body > div.StyledPhotoViewer-sc-138rr41-0.dyujdl > div > div.viewer_content > div > div > img")
+                    img_element = self.driver.find_element(By.CSS_SELECTOR, VIEWER_IMG_SELECTOR)
                     
                     img_src = img_element.get_attribute('src')
                     
@@ -192,71 +324,64 @@ class NaverMapPriceExtractor:
                         # 원본 크기로 변환
                         original_src = self.convert_to_original_size(img_src)
                         price_images.append(original_src)
+                        self.first_url_timer.mark()
                         print(f"      ├── {len(price_images)}번째 가격표 이미지 추출")
                     
                     # 다음 버튼 클릭
-                    try:
-                        next_button = self.driver.find_element(By.CSS_SELECTOR, 
-                            "body > div.StyledPhotoViewer-sc-138rr41-0.dyujdl > div > button.btn_next")
-                        
-                        self.driver.execute_script("arguments[0].click();", next_button)
-                        time.sleep(1)  # 다음 이미지 로딩 대기
-                        
-                    except:
+                    next_button = self.driver.execute_script("return document.querySelector(arguments[0]);", VIEWER_NEXT_SELECTOR)
+                    if not next_button:
                         # 다음 버튼이 없으면 마지막 이미지
                         print(f"   ✅ 마지막 가격표 이미지")
                         break
+                    
+                    self.driver.execute_script("arguments[0].click();", next_button)
+                    
+                    # 다음 이미지로 바뀔 때까지 대기 (안 바뀌면 마지막 이미지)
+                    if not self.waits.wait_for('뷰어 다음 이미지', image_src_changed(VIEWER_IMG_SELECTOR, img_src),
+                                               timeout=3, fallback=1):
+                        print(f"   ✅ 마지막 가격표 이미지")
+                        break
                         
                 except Exception as e:
                     print(f"   ⚠️  이미지 추출 중 오류: {str(e)[:50]}")
+                    self.failures.note(e)
                     break
             
+            # 브라우저 로드 시간 / 전송량 측정 (이미지 차단 모드 절감량 비교용)
+            record_page_metrics(self.driver, self.stats['browser'])
+            
             if not price_images:
                 print("   ❌ 가격표 이미지를 찾을 수 없음")
+                self.failures.note(SELECTOR_MISS)
                 return False
             
             print(f"   ✅ {len(price_images)}개 가격표 이미지 발견")
             
             # 이미지 다운로드
             print(f"   💾 다운로드 시작...")
+            tasks = []
             for idx, img_url in enumerate(price_images, 1):
-                try:
-                    response = requests.get(img_url, timeout=15, headers={
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                        'Referer': 'https://map.naver.com/'
-                    })
-                    
-                    if response.status_code == 200:
-                        # 확장자 결정
-                        ext = '.jpg'
-                        content_type = response.headers.get('Content-Type', '')
-                        if 'png' in content_type:
-                            ext = '.png'
-                        elif 'webp' in content_type:
-                            ext = '.webp'
-                        
-                        # 파일명
-                        if len(price_images) == 1:
-                            filename = f"가격표{ext}"
-                        else:
-                            filename = f"가격표_{idx}{ext}"
-                        
-                        filepath = os.path.join(save_path, filename)
-                        
-                        with open(filepath, 'wb') as f:
-                            f.write(response.content)
-                        
-                        file_size = len(response.content)
-                        print(f"   ✅ 저장 완료: {filename} ({file_size // 1024}KB)")
-                        
-                except Exception as e:
-                    print(f"   ⚠️  다운로드 실패 [{idx}]: {str(e)[:50]}")
+                # 파일명
+                if len(price_images) == 1:
+                    name = "가격표"
+                else:
+                    name = f"가격표_{idx}"
+                tasks.append({'url': img_url, 'folder': save_path, 'name': name})
+            
+            for result in self.download_engine.download(tasks, progress_every=0):
+                if result['ok']:
+                    self.stats['total_bytes'] += result['size']
+                    filename = os.path.basename(result['filepath'])
+                    print(f"   ✅ 저장 완료: {filename} ({result['size'] // 1024}KB)")
+                else:
+                    self.failures.note(classify_download(result))
             
             return len(price_images) > 0
                 
         except Exception as e:
             print(f"   ❌ 가격표 추출 실패: {e}")
             traceback.print_exc()
+            self.failures.note(e)
             return False
         finally:
             # iframe에서 나오기
@@ -312,6 +437,9 @@ class NaverMapPriceExtractor:
         region_detail = row.get('지역상세', 'unknown')
         store_name = row.get('매장명', 'unknown')
         naver_url = row.get('네이버지도링크', None)
+        started = time.time()
+        self.failures.begin()
+        self.stats['processed_keys'].append(row_key(row))
         
         print(f"\n{'='*60}")
         print(f"[{row_idx + 1}/{self.stats['total']}] 처리 중: {region} > {region_detail} > {store_name}")
@@ -320,6 +448,7 @@ class NaverMapPriceExtractor:
         if pd.isna(naver_url) or not naver_url:
             print("   ⚠️  네이버 지도 링크가 없습니다. 건너뜁니다.")
             self.stats['no_url'] += 1
+            self.checkpoint.record(row, 'no_url')
             return
         
         try:
@@ -330,6 +459,7 @@ class NaverMapPriceExtractor:
                 print(f"   ⚠️  매장 폴더를 찾을 수 없음")
                 print(f"   💡 먼저 V4 다운로더를 실행하여 폴더를 생성하세요")
                 self.stats['no_folder'] += 1
+                self.checkpoint.record(row, 'no_folder')
                 return
             
             print(f"   📁 저장 위치: {company_folder}")
@@ -339,27 +469,51 @@ class NaverMapPriceExtractor:
             if existing_files:
                 print(f"   ℹ️  이미 가격표 파일이 존재함 - 건너뜀")
                 self.stats['success'] += 1
+                self.checkpoint.record_phase(row, PHASE_PRICE, 'done', {'files': len(existing_files)})
+                self.checkpoint.record(row, 'done', len(existing_files))
                 return
             
             # 가격표 추출
-            if self.extract_price_table(naver_url, company_folder):
+            # 단축 링크는 캐시된 최종 URL로 바로 이동 (리다이렉트 생략)
+            self.perf_log.reset(self.driver)
+            self.first_url_timer.begin()
+            if self.link_resolver.is_dead(naver_url):
+                self.failures.note(DEAD_LINK)
+            extracted = self.extract_price_table(self.link_resolver.lookup(naver_url), company_folder)
+            self.request_blocker.record_store(self.perf_log.read(self.driver))
+            
+            if extracted:
                 self.stats['success'] += 1
+                files = self.count_price_files(company_folder)
+                self.checkpoint.record_phase(row, PHASE_PRICE, 'done', {'files': files})
+                self.checkpoint.record(row, 'done', files)
             else:
                 self.stats['failed'] += 1
+                # 가격표 링크 자체가 없는 매장은 다시 시도해도 같으므로 완료로 기록
+                failure_class = self.failures.finish()
+                status = 'no_price' if failure_class == NO_PRICE_TABLE else 'failed'
                 # 실패한 매장 기록
-                self.failed_stores.append({
-                    '지역': region,
-                    '지역상세': region_detail,
-                    '매장명': store_name,
-                    '네이버지도링크': naver_url
-                })
+                error = 'NoPriceTable' if status == 'no_price' else 'PriceExtractFailed'
+                self.failed_stores.append({**failure_entry(row, PHASE_PRICE, error, time.time() - started, failure_class),
+                                           '네이버지도링크': naver_url})
+                self.checkpoint.record_phase(row, PHASE_PRICE, status, {'class': failure_class})
+                self.checkpoint.record(row, status, failure_class=failure_class)
                 
         except Exception as e:
             print(f"   ❌ 처리 실패: {e}")
             traceback.print_exc()
             self.stats['failed'] += 1
+            failure_class = self.failures.finish(e)
+            self.failed_stores.append({**failure_entry(row, PHASE_PRICE, e, time.time() - started, failure_class),
+                                       '네이버지도링크': naver_url})
+            self.checkpoint.record_phase(row, PHASE_PRICE, 'failed', {'class': failure_class, 'error': str(e)[:200]})
+            self.checkpoint.record(row, 'failed', detail=e, failure_class=failure_class)
     
-    def run(self):
+    def count_price_files(self, company_folder):
+        """업체 폴더의 가격표 이미지 수"""
+        return sum(1 for f in os.listdir(company_folder) if f.startswith('가격표'))
+    
+    def run(self, workers=1, worker_options=None):
         """전체 프로세스 실행"""
         start_time = time.time()
         
@@ -370,19 +524,43 @@ class NaverMapPriceExtractor:
         df = self.read_excel()
         self.stats['total'] = len(df)
         
+        # 단축 링크 사전 해석 (HTTP 리다이렉트만 - 캐시된 링크는 건너뜀)
+        self.link_resolver.resolve_all(df.get('네이버지도링크', []))
+        
+        # 이어서 실행: 체크포인트에 완료로 기록된 매장 제외
+        rows = self.checkpoint.pending(df.iterrows()) if self.resume else df.iterrows()
+        if self.retry_failed:
+            rows = failed_rows(rows, self.retry_failed, self.retry_permanent)
+        
+        if workers > 1:
+            # 멀티 브라우저 모드: 워커마다 독립된 Chrome
+            run_parallel(self, rows, workers, worker_options or {})
+        else:
+            self.process_rows(rows)
+                
+        elapsed_time = time.time() - start_time
+        self.print_final_stats(elapsed_time)
+        
+        # 실패한 매장 목록 저장 (JSONL은 실패가 없어도 써서 --retry-failed 목록을 최신으로 유지,
+        # 이번에 처리하지 않은 매장의 이전 줄은 유지)
+        if self.failed_stores:
+            self.save_failed_stores()
+        merge_failure_ledger(os.path.join(os.path.dirname(os.path.abspath(__file__)), "가격표추출_실패_목록.jsonl"),
+                             self.failed_stores, self.stats['processed_keys'])
+    
+    def process_rows(self, rows):
+        """(행 번호, 행) 목록 처리 - 드라이버 준비/정리 포함"""
         self.setup_driver()
         
         try:
-            for idx, row in df.iterrows():
-                self.process_single_store(idx, row)
+            for idx, row in rows:
+                self.driver_health.run(self, idx, row, self.watchdog.run)
                 
-                progress = (idx + 1) / len(df) * 100
-                print(f"\n📊 진행률: {progress:.1f}% ({idx + 1}/{len(df)})")
-                
-                # 3개마다 잠깐 대기
-                if (idx + 1) % 3 == 0:
-                    print("   ⏳ 3개 처리마다 2초 대기 중...")
-                    time.sleep(2)
+                progress = (idx + 1) / self.stats['total'] * 100
+                print(f"\n📊 진행률: {progress:.1f}% ({idx + 1}/{self.stats['total']})")
+            
+            # 시간 초과 매장은 본 처리가 끝난 뒤 다시 시도
+            self.watchdog.run_retries(self, self.driver_health)
                     
         except KeyboardInterrupt:
             print("\n\n⚠️  사용자에 의해 중단되었습니다.")
@@ -390,13 +568,7 @@ class NaverMapPriceExtractor:
         finally:
             if self.driver:
                 self.driver.quit()
-                
-        elapsed_time = time.time() - start_time
-        self.print_final_stats(elapsed_time)
-        
-        # 실패한 매장 목록 저장
-        if self.failed_stores:
-            self.save_failed_stores()
+            self.checkpoint.close()
     
     def print_final_stats(self, elapsed_time):
         """최종 통계 출력"""
@@ -406,9 +578,35 @@ class NaverMapPriceExtractor:
         print(f"총 처리 대상: {self.stats['total']}개")
         print(f"✅ 성공: {self.stats['success']}개")
         print(f"❌ 실패: {self.stats['failed']}개")
+        for line in format_timeout_summary(self.stats):
+            print(line)
+        for line in format_health_summary(self.stats['driver_health']):
+            print(line)
         print(f"⚠️  폴더 없음: {self.stats['no_folder']}개")
         print(f"⚠️  링크 없음: {self.stats['no_url']}개")
         print(f"💰 가격표 없음: {self.stats['no_price']}개")
+        for line in format_failure_summary(self.stats['failure_classes']):
+            print(line)
+        print(f"💾 다운로드 용량: {format_bytes(self.stats['total_bytes'])}")
+        print(self.http_pool.summary())
+        print(self.link_resolver.summary())
+        print(self.frame_locator.summary())
+        for line in self.request_blocker.summary_lines():
+            print(line)
+        for line in format_browser_summary(type(self).__name__, self.stats['browser'], self.headless, self.block_images,
+                                           attach=self.attach):
+            print(line)
+        for line in format_page_load_summary(type(self).__name__, self.page_load, self.stats['first_url'],
+                                             attach=self.attach):
+            print(line)
+        for line in format_wait_summary(self.stats['waits']):
+            print(line)
+        for line in format_startup_summary(type(self).__name__, self.stats['startup']):
+            print(line)
+        for line in format_checkpoint_summary(self.stats['checkpoint']):
+            print(line)
+        for line in format_rate_summary(self.rate_limiter.current_rate(), self.stats['rate_limit']):
+            print(line)
         print(f"⏱️  소요 시간: {elapsed_time/60:.1f}분")
         print(f"📁 저장 위치: {os.path.abspath(self.base_folder)}")
         print("="*60 + "\n")
@@ -452,18 +650,46 @@ class NaverMapPriceExtractor:
             print(f"⚠️  실패 목록 저장 오류: {e}")
 
 def main():
-    if len(sys.argv) < 2:
-        print("사용법: python extract_price_table.py <엑셀파일경로>")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description="네이버 지도 가격표 추출 도구")
+    parser.add_argument('excel_path', help='엑셀 파일 경로')
+    add_download_arguments(parser)
+    add_browser_arguments(parser)
+    add_resolver_arguments(parser)
+    add_frame_cache_arguments(parser)
+    add_blocker_arguments(parser, 'price')
+    add_watchdog_arguments(parser)
+    add_health_arguments(parser)
+    add_attach_arguments(parser)
+    add_checkpoint_arguments(parser)
+    add_retry_arguments(parser)
+    add_rate_arguments(parser)
+    add_worker_arguments(parser)
+    args = parser.parse_args()
     
-    excel_path = sys.argv[1]
+    excel_path = args.excel_path
     
     if not os.path.exists(excel_path):
         print(f"❌ 파일을 찾을 수 없습니다: {excel_path}")
         sys.exit(1)
     
-    extractor = NaverMapPriceExtractor(excel_path)
-    extractor.run()
+    if args.retry_failed and not os.path.exists(args.retry_failed):
+        print(f"❌ 실패 목록을 찾을 수 없습니다: {args.retry_failed}")
+        sys.exit(1)
+    
+    options = download_options_from_args(args)
+    options.update(browser_options_from_args(args))
+    options.update(resolver_options_from_args(args))
+    options.update(frame_cache_options_from_args(args))
+    options.update(blocker_options_from_args(args))
+    options.update(watchdog_options_from_args(args))
+    options.update(health_options_from_args(args))
+    options.update(attach_options_from_args(args))
+    options.update(checkpoint_options_from_args(args))
+    options.update(retry_options_from_args(args))
+    options.update(rate_options_from_args(args))
+    
+    extractor = NaverMapPriceExtractor(excel_path, **options)
+    extractor.run(workers=args.workers, worker_options=options)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+실패 원인 분류 (일시적 실패 / 영구 실패)
+
+기존에는 try_cached_iframe / 사진 탭 클릭 / 가격표 추출의 넓은 except가
+시간 초과, 요소 없음, 죽은 단축 링크, chromedriver 크래시를 모두 '찾을 수 없음'으로 뭉뚱그려서
+다시 해도 성공할 수 없는 매장까지 재시도하며 시간을 썼음. 이 모듈은:
+- 예외 / 다운로드 결과를 작은 분류 체계로 나눔
+- 매장 하나를 처리하는 동안 본 실패 중 가장 근본적인 원인을 매장 결과로 남김
+  (예: 드라이버가 죽어서 선택자도 못 찾았으면 '드라이버 크래시')
+- 자동 재시도(--resume, --retry-failed, 사진만 다시 받기)는 일시적 분류만 대상으로 함
+
+분류:
+    no_price_table      가격표 없음 (장소에 가격표 자체가 없음)           영구
+    selector_miss       선택자 못 찾음 (레이아웃 차이 / 탭 없음)          영구
+    dead_link           죽은 단축 링크 (장소 ID 없는 주소로 이동 / 4xx)   영구
+    http_4xx            다운로드 HTTP 4xx                                  영구
+    navigation_timeout  페이지 이동 / 대기 시간 초과                       일시적
+    driver_crash        chromedriver / Chrome 응답 없음                    일시적
+    http_5xx            다운로드 HTTP 5xx / 429                            일시적
+    unknown             그 밖의 오류                                       일시적
+"""
+
+import socket
+
+import requests
+from selenium.common.exceptions import (TimeoutException, NoSuchElementException, StaleElementReferenceException,
+                                        ElementNotInteractableException, ElementClickInterceptedException,
+                                        NoSuchFrameException, InvalidSessionIdException, NoSuchWindowException,
+                                        WebDriverException)
+from urllib3.exceptions import MaxRetryError, ProtocolError
+
+NO_PRICE_TABLE = 'no_price_table'
+SELECTOR_MISS = 'selector_miss'
+DEAD_LINK = 'dead_link'
+HTTP_4XX = 'http_4xx'
+NAVIGATION_TIMEOUT = 'navigation_timeout'
+DRIVER_CRASH = 'driver_crash'
+HTTP_5XX = 'http_5xx'
+UNKNOWN = 'unknown'
+
+LABELS = {
+    NO_PRICE_TABLE: '가격표 없음',
+    SELECTOR_MISS: '선택자 못 찾음',
+    DEAD_LINK: '죽은 단축 링크',
+    HTTP_4XX: 'HTTP 4xx',
+    NAVIGATION_TIMEOUT: '시간 초과',
+    DRIVER_CRASH: '드라이버 크래시',
+    HTTP_5XX: 'HTTP 5xx',
+    UNKNOWN: '기타 오류',
+}
+
+# 자동 재시도 대상
+TRANSIENT_CLASSES = (NAVIGATION_TIMEOUT, DRIVER_CRASH, HTTP_5XX, UNKNOWN)
+
+# 한 매장에서 여러 실패를 보면 뒤쪽(더 근본적인 원인)을 남김
+PRIORITY = [UNKNOWN, SELECTOR_MISS, NO_PRICE_TABLE, HTTP_4XX, HTTP_5XX, DEAD_LINK, NAVIGATION_TIMEOUT, DRIVER_CRASH]
+
+# WebDriverException 메시지로 알아보는 드라이버 / 브라우저 종료
+CRASH_MARKERS = ['invalid session id', 'chrome not reachable', 'disconnected', 'session deleted',
+                 'target window already closed', 'tab crashed', 'no such window']
+TIMEOUT_MARKERS = ['timed out', 'timeout']
+
+
+def is_transient(failure_class):
+    """자동 재시도 대상인지"""
+    return failure_class in TRANSIENT_CLASSES
+
+
+def classify_exception(error):
+    """예외 → 실패 분류"""
+    if isinstance(error, (TimeoutException, socket.timeout, requests.exceptions.Timeout, TimeoutError)):
+        return NAVIGATION_TIMEOUT
+    if isinstance(error, (InvalidSessionIdException, NoSuchWindowException, MaxRetryError, ProtocolError,
+                          ConnectionRefusedError, ConnectionResetError)):
+        # 드라이버 HTTP 연결이 끊긴 경우도 포함 (chromedriver 프로세스 종료)
+        return DRIVER_CRASH
+    if isinstance(error, (NoSuchElementException, StaleElementReferenceException, ElementNotInteractableException,
+                          ElementClickInterceptedException, NoSuchFrameException)):
+        return SELECTOR_MISS
+    if isinstance(error, WebDriverException):
+        message = str(error).lower()
+        if any(marker in message for marker in CRASH_MARKERS):
+            return DRIVER_CRASH
+        if any(marker in message for marker in TIMEOUT_MARKERS):
+            return NAVIGATION_TIMEOUT
+    return UNKNOWN
+
+
+def classify_download(result):
+    """다운로드 엔진 결과 → 실패 분류 (성공이면 None)"""
+    if result['ok']:
+        return None
+    status = result.get('status')
+    if status:
+        return HTTP_4XX if 400 <= status < 500 and status != 429 else HTTP_5XX
+    if 'timed out' in (result.get('error') or '').lower():
+        return NAVIGATION_TIMEOUT
+    return UNKNOWN
+
+
+def worst(classes):
+    """여러 분류 중 가장 근본적인 원인 (없으면 None)"""
+    classes = [failure_class for failure_class in classes if failure_class]
+    return max(classes, key=PRIORITY.index) if classes else None
+
+
+class FailureTracker:
+    """매장 하나를 처리하는 동안 본 실패 중 가장 근본적인 원인 기록"""
+
+    def __init__(self, stats=None):
+        # 분류 -> 실패 매장 수
+        self.stats = stats if stats is not None else {}
+        self.current = None
+
+    def begin(self):
+        """매장 처리 시작"""
+        self.current = None
+
+    def note(self, failure):
+        """실패 기록 (예외 또는 분류 문자열) - 지금까지의 매장 분류 반환"""
+        failure_class = failure if isinstance(failure, str) else classify_exception(failure)
+        self.current = worst([self.current, failure_class])
+        return self.current
+
+    def finish(self, failure=None):
+        """매장 실패 확정 - 마지막 예외/분류까지 반영한 최종 분류를 집계하고 반환"""
+        if failure is not None:
+            self.note(failure)
+        failure_class = self.current or UNKNOWN
+        self.stats[failure_class] = self.stats.get(failure_class, 0) + 1
+        self.current = None
+        return failure_class
+
+
+def format_failure_summary(stats):
+    """최종 통계용 실패 원인 요약"""
+    if not stats:
+        return []
+    detail = ', '.join(f"{LABELS.get(name, name)} {count}개" for name, count in
+                       sorted(stats.items(), key=lambda item: -item[1]))
+    transient = sum(count for name, count in stats.items() if is_transient(name))
+    return [f"🧯 실패 원인: {detail} (자동 재시도 대상 {transient}개)"]
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+실패 매장 목록 (JSONL) + 실패 매장만 다시 처리 (--retry-failed)
+
+기존 실패 목록(캡처_실패_목록.txt / 가격표추출_실패_목록.txt)은 사람이 읽는 용도라
+다시 입력으로 쓸 수 없어서, 실패 매장 몇 개를 재시도하려 해도 엑셀 전체를 다시 돌려야 했음.
+- 실패 매장마다 한 줄(JSON): 매장 키 / 지역 / 지역상세 / 매장명 / 단계 / 오류 종류 / 실패 분류 / 소요 시간 / 시각
+- --retry-failed <목록.jsonl>이면 엑셀에서 목록에 있는 매장만 골라서 처리
+  (일시적 실패만 - 가격표 없음 / 선택자 못 찾음 등 영구 실패까지 하려면 --retry-permanent)
+  (--workers 등 나머지 옵션은 그대로 - 멀티 브라우저 모드로 병렬 재시도 가능)
+- 실행이 끝나면 이번에 처리한 매장의 줄만 이번 결과로 바꿈 → 같은 파일로 여러 번 재시도하면 점점 줄어듦
+  (영구 실패라 재시도에서 빠진 매장, --resume / 중단으로 처리하지 않은 매장의 이전 줄은 유지)
+
+한 줄 예:
+    {"key": "서울|강남구|OO에스테틱", "지역": "서울", "지역상세": "강남구", "매장명": "OO에스테틱",
+     "phase": "price", "error": "TimeoutException", "class": "navigation_timeout", "transient": true,
+     "elapsed": 12.3, "time": "2026-10-18T10:00:00"}
+"""
+
+import os
+import json
+import tempfile
+from datetime import datetime
+
+from checkpoint_ledger import row_key
+from failure_classes import is_transient, UNKNOWN
+
+
+def add_retry_arguments(parser):
+    """실패 매장 재시도 관련 CLI 옵션 추가"""
+    parser.add_argument('--retry-failed', metavar='LEDGER',
+                        help='실패 목록(.jsonl)에 있는 매장 중 일시적 실패만 다시 처리')
+    parser.add_argument('--retry-permanent', action='store_true',
+                        help='--retry-failed에서 영구 실패(가격표 없음 / 선택자 못 찾음 등)도 다시 처리')
+
+
+# 도구 생성자 옵션 기본값 (retry_options_from_args와 같은 키)
+RETRY_DEFAULTS = {'retry_failed': None, 'retry_permanent': False}
+
+
+def retry_options_from_args(args):
+    """CLI 인자에서 도구 생성자용 재시도 옵션 추출"""
+    return {
+        'retry_failed': args.retry_failed,
+        'retry_permanent': args.retry_permanent
+    }
+
+
+def failure_entry(row, phase, error, elapsed, failure_class=UNKNOWN):
+    """실패 목록 한 줄 (error는 예외 객체 또는 오류 종류 문자열, failure_class는 failure_classes 분류)"""
+    entry = {
+        'key': row_key(row),
+        '지역': row.get('지역', 'unknown'),
+        '지역상세': row.get('지역상세', 'unknown'),
+        '매장명': row.get('매장명', 'unknown'),
+        'phase': phase,
+        'error': error if isinstance(error, str) else type(error).__name__,
+        'class': failure_class,
+        'transient': is_transient(failure_class),
+        'elapsed': round(elapsed, 1),
+        'time': datetime.now().isoformat(timespec='seconds')
+    }
+    if not isinstance(error, str):
+        entry['message'] = str(error)[:200]
+    return entry
+
+
+def write_failure_ledger(path, entries):
+    """실패 목록을 JSONL로 저장 (임시 파일에 쓴 뒤 rename)"""
+    folder = os.path.dirname(os.path.abspath(path))
+    try:
+        fd, temp_path = tempfile.mkstemp(dir=folder, prefix='.failures.', suffix='.part')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        os.replace(temp_path, path)
+        print(f"🧾 실패 목록(JSONL) 저장: {path} ({len(entries)}개)")
+    except OSError as e:
+        print(f"⚠️  실패 목록(JSONL) 저장 실패: {e}")
+
+
+def merge_failure_ledger(path, entries, processed_keys):
+    """이전 실패 목록에서 이번에 처리한 매장(processed_keys) 줄을 빼고 이번 실패를 더해서 저장"""
+    processed = set(processed_keys)
+    kept = [entry for entry in load_failure_entries(path) if entry_key(entry) not in processed]
+    write_failure_ledger(path, kept + list(entries))
+
+
+def entry_key(entry):
+    """실패 목록 한 줄의 매장 키 (key가 없는 줄은 지역 / 지역상세 / 매장명으로)"""
+    return entry.get('key') or row_key(entry)
+
+
+def load_failure_entries(path):
+    """실패 목록의 줄 목록 (파일이 없으면 빈 목록, 깨진 줄은 건너뜀)"""
+    entries = []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    continue
+    except OSError:
+        return []
+    return entries
+
+
+def load_failure_keys(path, include_permanent=False):
+    """실패 목록의 매장 키 집합 (영구 실패는 include_permanent일 때만)"""
+    return {entry_key(entry) for entry in load_failure_entries(path)
+            if include_permanent or is_transient(entry.get('class', UNKNOWN))}
+
+
+def failed_rows(rows, path, include_permanent=False):
+    """(행 번호, 행) 목록에서 실패 목록에 있는 매장만 (원래 행 번호 유지)"""
+    keys = load_failure_keys(path, include_permanent)
+    selected = [(idx, row) for idx, row in rows if row_key(row) in keys]
+    kind = '실패' if include_permanent else '일시적 실패'
+    print(f"🔁 실패 매장 재시도: {os.path.basename(path)}의 {kind} {len(keys)}개 중 엑셀에서 찾은 {len(selected)}개 처리\n")
+    return selected
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+프레임 위치 캐시 (도구 / 실행 간 공유)
+
+V3 / V4는 사진 탭이 있는 iframe의 '순번'을 객체가 살아 있는 동안만 기억했고,
+가격표 추출 도구는 매장마다 모든 iframe을 역순으로 다시 뒤졌음. 이 모듈은:
+- iframe을 순번 대신 안정적인 키로 식별 (id → name → src 패턴, 숫자는 *로 치환)
+- 용도별(사진 탭 / 가격표 링크) 마지막으로 맞은 프레임 키를 frame_cache.json에 저장
+- 다음 매장 / 다음 실행 / 다른 도구에서 해당 프레임으로 바로 이동
+- 캐시된 프레임이 없거나 그 안에서 찾는 요소가 없으면 캐시 무효화 → 전체 검색
+
+프레임 목록은 execute_script로 읽음 (find_elements의 implicitly_wait에 걸리지 않도록)
+
+사용 예:
+    self.frame_locator = FrameLocator('photo_tab', self.frame_cache, self.stats.setdefault('frames', {}))
+    if self.frame_locator.enter(self.driver) and self.click_photo_tab_simple():
+        ...
+    for key, iframe in self.frame_locator.frames(self.driver):
+        ...
+        self.frame_locator.remember(key)
+"""
+
+import os
+import json
+import tempfile
+from datetime import datetime
+
+# 도구들이 같이 쓰는 캐시 파일 (스크립트 폴더)
+DEFAULT_FRAME_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'frame_cache.json')
+
+# 최상위 문서(iframe 밖)를 나타내는 키
+MAIN_FRAME = 'main'
+
+FRAME_KEYS_SCRIPT = """
+var frames = document.querySelectorAll('iframe');
+var keys = [];
+for (var i = 0; i < frames.length; i++) {
+    var f = frames[i];
+    if (f.id) { keys.push('id:' + f.id); continue; }
+    if (f.name) { keys.push('name:' + f.name); continue; }
+    var src = f.getAttribute('src') || '';
+    try {
+        var u = new URL(src, location.href);
+        src = u.host + u.pathname;
+    } catch (e) {}
+    keys.push('src:' + src.replace(/\\d+/g, '*'));
+}
+return keys;
+"""
+
+
+def add_frame_cache_arguments(parser):
+    """프레임 위치 캐시 관련 CLI 옵션 추가"""
+    parser.add_argument('--frame-cache', default=DEFAULT_FRAME_CACHE_PATH,
+                        help='프레임 위치 캐시 파일 (기본: 스크립트 폴더의 frame_cache.json)')
+
+
+# 도구 생성자 옵션 기본값 (frame_cache_options_from_args와 같은 키)
+FRAME_CACHE_DEFAULTS = {'frame_cache': DEFAULT_FRAME_CACHE_PATH}
+
+
+def frame_cache_options_from_args(args):
+    """CLI 인자에서 도구 생성자용 프레임 캐시 옵션 추출"""
+    return {'frame_cache': args.frame_cache}
+
+
+def load_frame_cache(path=DEFAULT_FRAME_CACHE_PATH):
+    """용도 -> {'key', 'updated_at'} (없으면 빈 딕셔너리)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def frame_keys(driver):
+    """현재 문서의 iframe 키 목록 (문서 순서)"""
+    try:
+        return driver.execute_script(FRAME_KEYS_SCRIPT) or []
+    except Exception:
+        return []
+
+
+def new_frame_stats():
+    """stats['frames']에 들어갈 빈 통계"""
+    return {'hits': 0, 'invalidated': 0, 'searches': 0}
+
+
+class FrameLocator:
+    def __init__(self, purpose, cache_path=DEFAULT_FRAME_CACHE_PATH, stats=None):
+        self.purpose = purpose
+        self.cache_path = cache_path
+
+        self.stats = stats if stats is not None else {}
+        for key, value in new_frame_stats().items():
+            self.stats.setdefault(key, value)
+
+        entry = load_frame_cache(cache_path).get(purpose)
+        self.key = entry.get('key') if entry else None
+
+    def frames(self, driver):
+        """전체 검색용 (키, iframe 요소) 목록 - 최상위 문서 기준"""
+        self.stats['searches'] += 1
+        driver.switch_to.default_content()
+        keys = frame_keys(driver)
+        try:
+            elements = driver.execute_script("return Array.prototype.slice.call(document.querySelectorAll('iframe'));")
+        except Exception:
+            elements = []
+        return list(zip(keys, elements or []))
+
+    def enter(self, driver):
+        """캐시된 프레임으로 이동 - 캐시가 없거나 프레임이 사라졌으면 False (사라진 경우 무효화)"""
+        if self.key is None:
+            return False
+
+        driver.switch_to.default_content()
+        if self.key == MAIN_FRAME:
+            self.stats['hits'] += 1
+            return True
+
+        keys = frame_keys(driver)
+        if self.key not in keys:
+            self.invalidate()
+            return False
+
+        try:
+            iframe = driver.execute_script("return document.querySelectorAll('iframe')[arguments[0]];",
+                                           keys.index(self.key))
+            driver.switch_to.frame(iframe)
+        except Exception:
+            driver.switch_to.default_content()
+            self.invalidate()
+            return False
+
+        self.stats['hits'] += 1
+        return True
+
+    def remember(self, key):
+        """찾은 프레임 키 저장 (같은 키면 파일은 그대로)"""
+        if key == self.key:
+            return
+        self.key = key
+        self._save({'key': key, 'updated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')})
+
+    def invalidate(self):
+        """캐시된 프레임에서 찾지 못함 - 캐시 삭제"""
+        if self.key is None:
+            return
+        self.key = None
+        self.stats['invalidated'] += 1
+        self._save(None)
+
+    def _save(self, entry):
+        """캐시 저장 (다른 용도 항목은 유지, 임시 파일에 쓴 뒤 rename)"""
+        data = load_frame_cache(self.cache_path)
+        if entry is None:
+            data.pop(self.purpose, None)
+        else:
+            data[self.purpose] = entry
+
+        folder = os.path.dirname(os.path.abspath(self.cache_path))
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=folder, prefix='.frame_cache.', suffix='.part')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            print(f"⚠️  프레임 캐시 저장 실패: {e}")
+
+    def summary(self):
+        """최종 통계용 한 줄 요약"""
+        return (f"🧭 프레임 캐시 ({self.purpose}: {self.key or '없음'}): 바로 이동 {self.stats['hits']}회 "
+                f"/ 전체 검색 {self.stats['searches']}회 / 무효화 {self.stats['invalidated']}회")
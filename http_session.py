@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+공유 HTTP 세션 풀 (keep-alive)
+
+기능:
+- 실행 전체에서 하나의 requests.Session 사용 (pstatic CDN 연결 재사용)
+- 연결 풀 크기 조절 (--http-pool-size)
+- 기본 헤더 (User-Agent / Referer) 한 곳에서 관리
+- 연결 재사용 통계 (요청 수 / 새 연결 수)
+"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_SIZE = 16
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Referer': 'https://map.naver.com/'
+}
+
+
+class HttpSessionPool:
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, headers=None):
+        self.pool_size = max(1, pool_size)
+        self.session = requests.Session()
+        self.session.headers.update(headers or DEFAULT_HEADERS)
+
+        # 호스트 수(pool_connections)와 호스트당 연결 수(pool_maxsize)를 같은 값으로 설정
+        self.adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        self.session.mount('http://', self.adapter)
+        self.session.mount('https://', self.adapter)
+
+        self.request_count = 0
+        self.lock = threading.Lock()
+
+        # 다른 프로세스(워커)에서 합산된 통계
+        self.absorbed = {'requests': 0, 'connections': 0}
+
+    def get(self, url, **kwargs):
+        """GET 요청 (세션 기본 헤더 + 연결 재사용)"""
+        with self.lock:
+            self.request_count += 1
+        return self.session.get(url, **kwargs)
+
+    def connection_stats(self):
+        """연결 재사용 통계"""
+        pools = self.adapter.poolmanager.pools
+        connections = 0
+        for key in list(pools.keys()):
+            try:
+                connections += pools[key].num_connections
+            except KeyError:
+                continue
+
+        requests_total = self.request_count + self.absorbed['requests']
+        connections += self.absorbed['connections']
+        return {
+            'requests': requests_total,
+            'connections': connections,
+            'reused': max(0, requests_total - connections)
+        }
+
+    def absorb_stats(self, stats):
+        """워커 프로세스의 연결 통계 합산"""
+        with self.lock:
+            self.absorbed['requests'] += stats.get('requests', 0)
+            self.absorbed['connections'] += stats.get('connections', 0)
+
+    def summary(self):
+        """최종 통계용 한 줄 요약"""
+        stats = self.connection_stats()
+        if not stats['requests']:
+            return "🔌 HTTP 연결: 요청 없음"
+        reuse_rate = stats['reused'] / stats['requests'] * 100
+        return (f"🔌 HTTP 연결: 요청 {stats['requests']}회 / 새 연결 {stats['connections']}개 "
+                f"(재사용률 {reuse_rate:.1f}%)")
+
+    def close(self):
+        self.session.close()
+
+
+# 실행 단위로 공유되는 세션 풀
+_shared_pool = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_session(pool_size=None):
+    """실행 전체에서 공유하는 세션 풀 반환 (최초 호출 시 생성, pool_size=None이면 기본 크기)
+
+    이미 만든 풀과 다른 크기를 요청하면 기존 풀을 그대로 쓰고 경고 출력
+    """
+    global _shared_pool
+    with _shared_lock:
+        if _shared_pool is None:
+            _shared_pool = HttpSessionPool(pool_size=pool_size or DEFAULT_POOL_SIZE)
+        elif pool_size and max(1, pool_size) != _shared_pool.pool_size:
+            print(f"⚠️  HTTP 연결 풀은 이미 크기 {_shared_pool.pool_size}로 생성됨 - 요청한 크기 {pool_size}는 무시합니다")
+        return _shared_pool
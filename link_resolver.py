@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+naver.me 단축 링크 해석기 (영구 캐시)
+
+기존 방식은 단축 링크마다 driver.get으로 지도 화면 전체를 띄운 뒤에야
+장소 iframe이 나타났음. 이 모듈은 처리 전에 한 번:
+- 엑셀의 단축 링크를 일반 HTTP 리다이렉트로 동시에 해석
+- 최종 URL에서 장소 ID 추출
+- 결과를 link_cache.json에 저장 (단축 링크 → 최종 URL / 장소 ID)
+- 장소 ID 없는 주소로 가거나 4xx인 링크는 '죽은 링크'로 표시 (다음 실행 때 다시 확인)
+
+캐시는 V4 다운로더와 가격표 추출 도구가 같이 사용하므로
+재실행이나 다른 도구에서 같은 링크를 다시 해석하지 않음
+
+사용 예:
+    resolver = ShortLinkResolver(session=self.http_pool)
+    resolver.resolve_all(df['네이버지도링크'])
+    self.driver.get(resolver.lookup(naver_url))
+"""
+
+import os
+import re
+import json
+import tempfile
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
+
+from http_session import get_shared_session
+
+DEFAULT_RESOLVE_WORKERS = 8
+
+# 도구들이 같이 쓰는 캐시 파일 (스크립트 폴더)
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'link_cache.json')
+
+SHORT_LINK_HOSTS = ['naver.me']
+
+# 최종 URL에서 장소 ID 찾기 (map.naver.com/p/entry/place/123, m.place.naver.com/restaurant/123/home 등)
+PLACE_ID_PATTERNS = [
+    re.compile(r'/entry/place/(\d+)'),
+    re.compile(r'/(?:place|restaurant|cafe|hairshop|nailshop|hospital|accommodation)/(\d+)'),
+    re.compile(r'[?&](?:placeId|pinId|id)=(\d+)'),
+]
+
+
+def add_resolver_arguments(parser):
+    """단축 링크 해석 관련 CLI 옵션 추가"""
+    parser.add_argument('--link-cache', default=DEFAULT_CACHE_PATH,
+                        help='단축 링크 해석 캐시 파일 (기본: 스크립트 폴더의 link_cache.json)')
+    parser.add_argument('--resolve-workers', type=int, default=DEFAULT_RESOLVE_WORKERS,
+                        help=f'단축 링크 동시 해석 수 (기본: {DEFAULT_RESOLVE_WORKERS})')
+
+
+# 도구 생성자 옵션 기본값 (resolver_options_from_args와 같은 키)
+RESOLVER_DEFAULTS = {'link_cache': DEFAULT_CACHE_PATH, 'resolve_workers': DEFAULT_RESOLVE_WORKERS}
+
+
+def resolver_options_from_args(args):
+    """CLI 인자에서 도구 생성자용 해석기 옵션 추출"""
+    return {
+        'link_cache': args.link_cache,
+        'resolve_workers': args.resolve_workers
+    }
+
+
+def is_short_link(url):
+    """naver.me 단축 링크인지 확인"""
+    host_name = (urlparse(url).hostname or '').lower()
+    return any(host_name == host or host_name.endswith('.' + host) for host in SHORT_LINK_HOSTS)
+
+
+def extract_place_id(url):
+    """URL에서 네이버 장소 ID 추출 (없으면 None)"""
+    for pattern in PLACE_ID_PATTERNS:
+        match = pattern.search(url or '')
+        if match:
+            return match.group(1)
+    return None
+
+
+class ShortLinkResolver:
+    def __init__(self, cache_path=DEFAULT_CACHE_PATH, session=None, max_workers=DEFAULT_RESOLVE_WORKERS, timeout=10):
+        self.cache_path = cache_path
+        self.session = session or get_shared_session()
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.lock = threading.Lock()
+
+        # 단축 링크 -> {'final_url', 'place_id', 'resolved_at'}
+        self.cache = self._load_cache()
+        self.stats = {'cached': 0, 'resolved': 0, 'failed': 0}
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_cache(self):
+        """캐시 저장 (임시 파일에 쓴 뒤 rename - 중간에 끊겨도 기존 캐시 유지)"""
+        folder = os.path.dirname(os.path.abspath(self.cache_path))
+        with self.lock:
+            data = dict(self.cache)
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=folder, prefix='.link_cache.', suffix='.part')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            print(f"⚠️  링크 캐시 저장 실패: {e}")
+
+    def _resolve_one(self, short_url):
+        """HTTP 리다이렉트만 따라가서 최종 URL 확인 (본문은 받지 않음)"""
+        with self.session.get(short_url, timeout=self.timeout, allow_redirects=True, stream=True) as response:
+            final_url = response.url
+            status = response.status_code
+        if 400 <= status < 500:
+            raise ValueError(f"HTTP {status} ({final_url[:60]})")
+        place_id = extract_place_id(final_url)
+        if is_short_link(final_url) or not place_id:
+            raise ValueError(f"장소 ID를 찾을 수 없음 ({final_url[:60]})")
+        return {
+            'final_url': final_url,
+            'place_id': place_id,
+            'resolved_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+
+    def resolve_all(self, urls):
+        """단축 링크 목록을 동시에 해석해서 캐시에 저장 (이미 캐시된 링크는 건너뜀)"""
+        pending = []
+        for url in urls:
+            if not isinstance(url, str) or not url.strip():
+                continue
+            url = url.strip()
+            if not is_short_link(url) or url in pending:
+                continue
+            if url in self.cache and not self.cache[url].get('dead'):
+                self.stats['cached'] += 1
+            else:
+                pending.append(url)
+
+        if not pending:
+            if self.stats['cached']:
+                print(f"🔗 단축 링크 {self.stats['cached']}개 모두 캐시 사용\n")
+            return
+
+        print(f"🔗 단축 링크 {len(pending)}개 해석 중 (캐시 {self.stats['cached']}개)...")
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending))) as executor:
+            futures = {executor.submit(self._resolve_one, url): url for url in pending}
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    entry = future.result()
+                    with self.lock:
+                        self.cache[url] = entry
+                    self.stats['resolved'] += 1
+                except ValueError as e:
+                    # 죽은 링크: 브라우저는 원래 링크로 열되 실패 분류에 사용
+                    with self.lock:
+                        self.cache[url] = {'final_url': url, 'place_id': None, 'dead': True,
+                                           'resolved_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+                    self.stats['failed'] += 1
+                    print(f"   ⚠️  죽은 링크 [{url}]: {str(e)[:60]}")
+                except Exception as e:
+                    self.stats['failed'] += 1
+                    print(f"   ⚠️  링크 해석 실패 [{url}]: {str(e)[:60]}")
+
+        self.save_cache()
+        print(f"✅ {self.summary()}\n")
+
+    def lookup(self, url):
+        """브라우저로 열 URL - 캐시된 최종 URL, 없으면 원래 링크"""
+        entry = self.cache.get((url or '').strip())
+        return entry['final_url'] if entry else url
+
+    def place_id(self, url):
+        """링크의 장소 ID (캐시 또는 URL 자체에서 추출, 없으면 None)"""
+        entry = self.cache.get((url or '').strip())
+        if entry:
+            return entry.get('place_id')
+        return None if is_short_link(url) else extract_place_id(url)
+
+    def is_dead(self, url):
+        """해석 결과 장소 ID가 없거나 4xx였던 단축 링크인지"""
+        entry = self.cache.get((url or '').strip())
+        return bool(entry and entry.get('dead'))
+
+    def summary(self):
+        """최종 통계용 한 줄 요약"""
+        return (f"🔗 단축 링크: 캐시 {self.stats['cached']}개 / 새로 해석 {self.stats['resolved']}개 "
+                f"/ 실패 {self.stats['failed']}개")
@@ -8,19 +8,29 @@
 import os
 import sys
 import time
-import requests
+import argparse
 import pandas as pd
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 from urllib.parse import urlparse
 import traceback
 from datetime import datetime
 
+from browser_options import (build_chrome_options, add_browser_arguments, browser_options_from_args,
+                             describe_mode, new_page_metrics, record_page_metrics, format_browser_summary,
+                             FirstUrlTimer, new_first_url_stats, format_page_load_summary)
+from dom_harvester import harvest_image_urls
+from download_engine import (PhotoDownloadEngine, add_download_arguments, host_limits_from_arg, format_bytes,
+                             DEFAULT_WORKERS, DEFAULT_CHUNK_KB)
+from http_session import get_shared_session, DEFAULT_POOL_SIZE
+from wait_engine import WaitEngine, format_wait_summary, page_iframe_ready
+
 class NaverMapBulkDownloader:
-    def __init__(self, excel_path, base_folder="downloads"):
+    def __init__(self, excel_path, base_folder="downloads", download_workers=DEFAULT_WORKERS, host_limit=None,
+                 http_pool_size=DEFAULT_POOL_SIZE, chunk_kb=DEFAULT_CHUNK_KB,
+                 headless=True, block_images=False, page_load='normal'):
         self.excel_path = excel_path
         self.base_folder = base_folder
         self.driver = None
@@ -29,21 +39,40 @@ class NaverMapBulkDownloader:
             'success': 0,
             'failed': 0,
             'no_url': 0,
-            'total_photos': 0
+            'total_photos': 0,
+            'total_bytes': 0
         }
         
+        # 브라우저 모드 (--headless / --block-images) + 문서별 로드 시간 / 전송량 측정
+        self.headless = headless
+        self.block_images = block_images
+        self.stats['browser'] = new_page_metrics()
+        
+        # 페이지 로드 전략 + 매장별 첫 사진 URL까지 걸린 시간
+        self.page_load = page_load
+        self.stats['first_url'] = new_first_url_stats()
+        self.first_url_timer = FirstUrlTimer(self.stats['first_url'])
+        
+        # 조건 기반 대기 (eager/none 로드 전략에서 페이지 준비 확인)
+        self.waits = WaitEngine(self.stats.setdefault('waits', {}))
+        
+        # 공유 HTTP 세션 풀 + 동시 다운로드 엔진
+        self.http_pool = get_shared_session(http_pool_size)
+        self.download_engine = PhotoDownloadEngine(
+            max_workers=download_workers,
+            host_limits=host_limits_from_arg(host_limit),
+            session=self.http_pool,
+            chunk_kb=chunk_kb
+        )
+        
     def setup_driver(self):
         """Chrome 드라이버 설정"""
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        chrome_options = build_chrome_options(headless=self.headless, block_images=self.block_images,
+                                              page_load=self.page_load, maximize=False, lang=False)
         
         self.driver = webdriver.Chrome(options=chrome_options)
-        print("✅ Chrome 드라이버 초기화 완료\n")
+        self.waits.attach(self.driver)
+        print(f"✅ Chrome 드라이버 초기화 완료 ({describe_mode(self.headless, self.block_images, self.page_load)})\n")
         
     def read_excel(self):
         """엑셀 파일 읽기"""
@@ -163,6 +192,13 @@ class NaverMapBulkDownloader:
         
         return link_file
         
+    def wait_page_ready(self, fallback):
+        """driver.get 이후 대기 - normal은 기존 고정 대기, eager/none은 장소 iframe이 생길 때까지만 대기"""
+        if self.page_load == 'normal':
+            time.sleep(fallback)
+        else:
+            self.waits.wait_for('페이지 iframe', page_iframe_ready(), timeout=10, fallback=fallback)
+    
     def extract_photos_from_url(self, url):
         """네이버 맵 URL에서 사진 추출"""
         photos = []
@@ -171,7 +207,7 @@ class NaverMapBulkDownloader:
         try:
             print(f"   🌐 페이지 로딩: {url}")
             self.driver.get(url)
-            time.sleep(3)
+            self.wait_page_ready(3)
             
             # 사진 탭 찾기 및 클릭
             photo_tab_found = False
@@ -308,52 +344,22 @@ class NaverMapBulkDownloader:
         photos = []
         
         try:
-            # 다양한 이미지 선택자
-            image_selectors = [
-                "//img[contains(@class, 'place_thumb')]",
-                "//img[contains(@class, 'img_thumb')]",
-                "//img[contains(@src, 'phinf')]",
-                "//img[contains(@src, 'blogpfthumb')]",
-                "//div[contains(@class, 'photo')]//img",
-                "//a[contains(@class, 'pic')]//img",
-                "//div[contains(@class, 'flicking-camera')]//img",
-                "//li[contains(@class, 'item')]//img"
-            ]
-            
-            for selector in image_selectors:
-                try:
-                    images = self.driver.find_elements(By.XPATH, selector)
-                    for img in images:
-                        src = img.get_attribute('src')
-                        if src and 'http' in src:
-                            # 썸네일이 아닌 이미지만
-                            if any(x in src for x in ['phinf', 'blogpfthumb', 'sslphinf', 'dthumb']):
-                                # 원본 크기로 변환
-                                src = self.convert_to_original_size(src)
-                                if src not in photos:
-                                    photos.append(src)
-                except:
-                    continue
+            # 브라우저 로드 시간 / 전송량 측정 (이미지 차단 모드 절감량 비교용)
+            record_page_metrics(self.driver, self.stats['browser'])
             
-            # 배경 이미지도 확인
-            try:
-                bg_elements = self.driver.find_elements(By.XPATH, "//*[contains(@style, 'background-image')]")
-                for elem in bg_elements:
-                    style = elem.get_attribute('style')
-                    if 'url(' in style:
-                        url_start = style.find('url(') + 4
-                        url_end = style.find(')', url_start)
-                        img_url = style[url_start:url_end].strip('"\'')
-                        if img_url and 'http' in img_url:
-                            img_url = self.convert_to_original_size(img_url)
-                            if img_url not in photos:
-                                photos.append(img_url)
-            except:
-                pass
+            # img src / data-src / srcset / background-image를 한 번에 수집
+            for src in harvest_image_urls(self.driver, domains=['phinf', 'blogpfthumb', 'sslphinf', 'dthumb']):
+                # 원본 크기로 변환
+                src = self.convert_to_original_size(src)
+                if src not in photos:
+                    photos.append(src)
                 
         except Exception as e:
             pass
             
+        if photos:
+            self.first_url_timer.mark()
+            
         return photos
         
     def convert_to_original_size(self, url):
@@ -381,70 +387,28 @@ class NaverMapBulkDownloader:
             print("   ℹ️  다운로드할 사진이 없습니다.")
             return 0
             
-        downloaded_count = 0
+        tasks = []
         
         # 카테고리별로 사진 다운로드
         if photo_categories:
             for category, category_photos in photo_categories.items():
                 category_folder = os.path.join(folder_path, self.sanitize_filename(category))
-                os.makedirs(category_folder, exist_ok=True)
                 
                 print(f"   📁 카테고리: {category} ({len(category_photos)}개)")
                 
                 for idx, url in enumerate(category_photos, 1):
-                    try:
-                        response = requests.get(url, timeout=15, headers={
-                            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                        })
-                        
-                        if response.status_code == 200:
-                            ext = '.jpg'
-                            content_type = response.headers.get('Content-Type', '')
-                            if 'png' in content_type:
-                                ext = '.png'
-                            elif 'webp' in content_type:
-                                ext = '.webp'
-                            
-                            filename = f"{category}_{idx:03d}{ext}"
-                            filepath = os.path.join(category_folder, filename)
-                            
-                            with open(filepath, 'wb') as f:
-                                f.write(response.content)
-                            
-                            downloaded_count += 1
-                            
-                    except Exception as e:
-                        print(f"   ⚠️  다운로드 실패 [{idx}]: {str(e)[:50]}")
+                    tasks.append({'url': url, 'folder': category_folder, 'name': f"{category}_{idx:03d}"})
                         
         else:
             # 카테고리 없으면 전체 사진 폴더에 저장
             all_photos_folder = os.path.join(folder_path, "전체사진")
-            os.makedirs(all_photos_folder, exist_ok=True)
             
             for idx, url in enumerate(photos, 1):
-                try:
-                    response = requests.get(url, timeout=15, headers={
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                    })
-                    
-                    if response.status_code == 200:
-                        ext = '.jpg'
-                        content_type = response.headers.get('Content-Type', '')
-                        if 'png' in content_type:
-                            ext = '.png'
-                        elif 'webp' in content_type:
-                            ext = '.webp'
-                        
-                        filename = f"photo_{idx:03d}{ext}"
-                        filepath = os.path.join(all_photos_folder, filename)
-                        
-                        with open(filepath, 'wb') as f:
-                            f.write(response.content)
-                        
-                        downloaded_count += 1
-                        
-                except Exception as e:
-                    print(f"   ⚠️  다운로드 실패 [{idx}]: {str(e)[:50]}")
+                tasks.append({'url': url, 'folder': all_photos_folder, 'name': f"photo_{idx:03d}"})
+        
+        results = self.download_engine.download(tasks, progress_every=0)
+        downloaded_count = sum(1 for result in results if result['ok'])
+        self.stats['total_bytes'] += sum(result['size'] for result in results if result['ok'])
         
         print(f"   ✅ {downloaded_count}개 사진 다운로드 완료")
         return downloaded_count
@@ -476,6 +440,7 @@ class NaverMapBulkDownloader:
             print(f"   🔗 링크 파일 저장: {os.path.basename(link_file)}")
             
             # 사진 추출
+            self.first_url_timer.begin()
             photos, photo_categories = self.extract_photos_from_url(naver_url)
             
             if photos:
@@ -542,23 +507,39 @@ class NaverMapBulkDownloader:
         print(f"❌ 실패: {self.stats['failed']}개")
         print(f"⚠️  링크 없음: {self.stats['no_url']}개")
         print(f"📷 다운로드한 총 사진 수: {self.stats['total_photos']}개")
+        print(f"💾 다운로드 용량: {format_bytes(self.stats['total_bytes'])}")
+        print(self.http_pool.summary())
+        for line in format_browser_summary(type(self).__name__, self.stats['browser'], self.headless, self.block_images, default_headless=True):
+            print(line)
+        for line in format_page_load_summary(type(self).__name__, self.page_load, self.stats['first_url']):
+            print(line)
+        for line in format_wait_summary(self.stats['waits']):
+            print(line)
         print(f"⏱️  소요 시간: {elapsed_time/60:.1f}분")
         print(f"📁 저장 위치: {os.path.abspath(self.base_folder)}")
         print("="*60 + "\n")
 
 def main():
-    if len(sys.argv) < 2:
-        print("사용법: python naver_map_bulk_downloader.py <엑셀파일경로>")
-        print("예: python naver_map_bulk_downloader.py 리스트_네이버지도링크추가.xlsx")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description="네이버 맵 대량 사진 다운로더")
+    parser.add_argument('excel_path', help='엑셀 파일 경로')
+    add_download_arguments(parser)
+    add_browser_arguments(parser, allow_headless=False)
+    args = parser.parse_args()
     
-    excel_path = sys.argv[1]
+    excel_path = args.excel_path
     
     if not os.path.exists(excel_path):
         print(f"❌ 파일을 찾을 수 없습니다: {excel_path}")
         sys.exit(1)
     
-    downloader = NaverMapBulkDownloader(excel_path)
+    downloader = NaverMapBulkDownloader(
+        excel_path,
+        download_workers=args.download_workers,
+        host_limit=args.host_limit,
+        http_pool_size=args.http_pool_size,
+        chunk_kb=args.chunk_size,
+        **browser_options_from_args(args)
+    )
     downloader.run()
 
 if __name__ == "__main__":
@@ -13,60 +13,98 @@
 import os
 import sys
 import time
-import requests
+import argparse
 import pandas as pd
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import traceback
 from datetime import datetime
 import re
 
+from browser_options import (build_chrome_options, add_browser_arguments, browser_options_from_args,
+                             describe_mode, new_page_metrics, record_page_metrics, format_browser_summary,
+                             FirstUrlTimer, new_first_url_stats, format_page_load_summary, BROWSER_DEFAULTS)
+from click_probe import ClickProbe, format_probe_summary, PHOTO_TAB_FULL_STRATEGIES
+from dom_harvester import harvest_image_urls
+from driver_health import (DriverHealth, add_health_arguments, health_options_from_args, new_health_stats,
+                           format_health_summary, HEALTH_DEFAULTS)
+from download_engine import (PhotoDownloadEngine, add_download_arguments, host_limits_from_arg, format_bytes,
+                             DOWNLOAD_DEFAULTS)
+from frame_locator import (FrameLocator, add_frame_cache_arguments, frame_cache_options_from_args,
+                           FRAME_CACHE_DEFAULTS, MAIN_FRAME)
+from http_session import get_shared_session
+from store_watchdog import (StoreWatchdog, add_watchdog_arguments, watchdog_options_from_args, format_timeout_summary,
+                            WATCHDOG_DEFAULTS)
+from tool_options import ToolOptions, merge_defaults
+from wait_engine import WaitEngine, format_wait_summary, page_iframe_ready
+
+# 생성자 옵션 기본값 (기능 모듈별 기본값 + V3 전용)
+V3_OPTIONS = merge_defaults(DOWNLOAD_DEFAULTS, BROWSER_DEFAULTS, WATCHDOG_DEFAULTS, FRAME_CACHE_DEFAULTS,
+                            HEALTH_DEFAULTS, {'base_folder': 'downloads'})
+
 class NaverMapBulkDownloaderV3:
-    def __init__(self, excel_path, base_folder="downloads"):
+    def __init__(self, excel_path, **options):
+        options = ToolOptions(V3_OPTIONS, options)
         self.excel_path = excel_path
         # 현재 스크립트 위치에서 downloads 폴더 생성
         script_dir = os.path.dirname(os.path.abspath(__file__))
-        self.base_folder = os.path.join(script_dir, base_folder)
+        self.base_folder = os.path.join(script_dir, options.base_folder)
         self.driver = None
         self.stats = {
             'total': 0,
             'success': 0,
             'failed': 0,
             'no_url': 0,
-            'total_photos': 0
+            'total_photos': 0,
+            'total_bytes': 0
         }
-        # iframe 캐싱: 어느 iframe에 사진 탭이 있는지 기억
-        self.photo_tab_iframe_index = None  # None = 아직 모름, 0 = 메인 페이지, 1~N = iframe 번호
+        
+        # 브라우저 모드 (--headless / --block-images) + 문서별 로드 시간 / 전송량 측정
+        self.headless = options.headless
+        self.block_images = options.block_images
+        self.stats['browser'] = new_page_metrics()
+        
+        # 페이지 로드 전략 + 매장별 첫 사진 URL까지 걸린 시간
+        self.page_load = options.page_load
+        self.stats['first_url'] = new_first_url_stats()
+        self.first_url_timer = FirstUrlTimer(self.stats['first_url'])
+        
+        # 조건 기반 대기 (eager/none 로드 전략에서 페이지 준비 확인)
+        self.waits = WaitEngine(self.stats.setdefault('waits', {}))
+        
+        # 매장별 제한 시간 감시 + 시간 초과 매장 재시도
+        self.stats['timed_out'] = 0
+        self.stats['timed_out_stores'] = []
+        self.watchdog = StoreWatchdog(options.store_timeout, options.timeout_retries)
+        
+        # 드라이버 상태 감시: 매장 수 / 메모리 / 로드 시간 기준 초과 또는 크래시 시 재시작
+        self.stats['driver_health'] = new_health_stats()
+        self.driver_health = DriverHealth(options.recycle_stores, options.max_memory_mb,
+                                          options.max_load_seconds, stats=self.stats['driver_health'])
+        
+        # 사진 탭 클릭: 선택자 후보를 한 번의 스크립트로 시도 + 전략별 적중 횟수
+        self.click_probe = ClickProbe(self.stats.setdefault('click_probe', {}))
+        
+        # 공유 HTTP 세션 풀 + 동시 다운로드 엔진
+        self.http_pool = get_shared_session(options.http_pool_size)
+        self.download_engine = PhotoDownloadEngine(
+            max_workers=options.download_workers,
+            host_limits=host_limits_from_arg(options.host_limit),
+            session=self.http_pool,
+            chunk_kb=options.chunk_kb
+        )
+        # iframe 캐싱: 어느 iframe에 사진 탭이 있는지 기억 (frame_cache.json - V4 / 실행 간 공유)
+        self.frame_locator = FrameLocator('photo_tab', options.frame_cache, self.stats.setdefault('frames', {}))
         
     def setup_driver(self):
         """Chrome 드라이버 설정"""
-        chrome_options = Options()
-        # headless 모드 비활성화 (디버깅용)
-        # chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--start-maximized')
-        chrome_options.add_argument('--lang=ko-KR')
-        chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-        
-        # 이미지 로드 활성화
-        prefs = {
-            "profile.managed_default_content_settings.images": 1,
-            "profile.default_content_setting_values.notifications": 2
-        }
-        chrome_options.add_experimental_option("prefs", prefs)
+        chrome_options = build_chrome_options(headless=self.headless, block_images=self.block_images,
+                                              page_load=self.page_load)
         
         self.driver = webdriver.Chrome(options=chrome_options)
         self.driver.implicitly_wait(10)
-        print("✅ Chrome 드라이버 초기화 완료\n")
+        self.waits.attach(self.driver)
+        print(f"✅ Chrome 드라이버 초기화 완료 ({describe_mode(self.headless, self.block_images, self.page_load)})\n")
         
     def read_excel(self):
         """엑셀 파일 읽기"""
@@ -185,6 +223,13 @@ class NaverMapBulkDownloaderV3:
         
         return link_file
         
+    def wait_page_ready(self, fallback):
+        """driver.get 이후 대기 - normal은 기존 고정 대기, eager/none은 장소 iframe이 생길 때까지만 대기"""
+        if self.page_load == 'normal':
+            time.sleep(fallback)
+        else:
+            self.waits.wait_for('페이지 iframe', page_iframe_ready(), timeout=10, fallback=fallback)
+    
     def extract_photos_from_url(self, url):
         """네이버 맵 URL에서 사진 추출 - V3 완전히 새로운 방식"""
         photos = []
@@ -193,72 +238,58 @@ class NaverMapBulkDownloaderV3:
         try:
             print(f"   🌐 페이지 로딩 중...")
             self.driver.get(url)
-            time.sleep(5)  # 충분한 로딩 시간
+            self.wait_page_ready(5)
             
-            # iframe 캐싱 사용: 이전에 찾은 위치가 있으면 바로 이동
-            if self.photo_tab_iframe_index is not None:
-                if self.photo_tab_iframe_index == 0:
-                    # 메인 페이지에 사진 탭이 있음
-                    print(f"   ⚡ 캐시 사용: 메인 페이지에서 사진 탭 찾기")
+            # iframe 캐싱 사용: 이전에 찾은 위치(frame_cache.json)가 있으면 바로 이동
+            if self.frame_locator.key is not None:
+                print(f"   ⚡ 캐시 사용: {self.frame_locator.key}로 바로 이동")
+                try:
+                    if not self.frame_locator.enter(self.driver):
+                        print("   ⚠️  캐시된 iframe이 없음. 전체 검색 시작...")
+                        return self.extract_photos_from_url(url)  # 재시도
+                    if self.frame_locator.key != MAIN_FRAME:
+                        time.sleep(1)
                     if self.find_and_click_photo_tab():
-                        print("   ✅ 메인 페이지에서 사진 탭 클릭 성공!")
+                        print(f"   ✅ {self.frame_locator.key}에서 사진 탭 클릭 성공!")
                     else:
                         print("   ⚠️  캐시가 잘못됨. 전체 검색 시작...")
-                        self.photo_tab_iframe_index = None  # 캐시 무효화
-                        return self.extract_photos_from_url(url)  # 재시도
-                else:
-                    # 특정 iframe에 사진 탭이 있음
-                    iframes = self.driver.find_elements(By.TAG_NAME, "iframe")
-                    if iframes and len(iframes) >= self.photo_tab_iframe_index:
-                        print(f"   ⚡ 캐시 사용: iframe [{self.photo_tab_iframe_index}]로 바로 이동")
-                        try:
-                            self.driver.switch_to.frame(iframes[self.photo_tab_iframe_index - 1])
-                            time.sleep(1)
-                            if self.find_and_click_photo_tab():
-                                print(f"   ✅ iframe [{self.photo_tab_iframe_index}]에서 사진 탭 클릭 성공!")
-                            else:
-                                print("   ⚠️  캐시가 잘못됨. 전체 검색 시작...")
-                                self.driver.switch_to.default_content()
-                                self.photo_tab_iframe_index = None  # 캐시 무효화
-                                return self.extract_photos_from_url(url)  # 재시도
-                        except Exception as e:
-                            print(f"   ⚠️  캐시 사용 실패: {e}")
-                            self.driver.switch_to.default_content()
-                            self.photo_tab_iframe_index = None  # 캐시 무효화
-                            return self.extract_photos_from_url(url)  # 재시도
-                    else:
-                        print("   ⚠️  iframe 개수가 달라짐. 전체 검색 시작...")
-                        self.photo_tab_iframe_index = None  # 캐시 무효화
+                        self.driver.switch_to.default_content()
+                        self.frame_locator.invalidate()  # 캐시 무효화
                         return self.extract_photos_from_url(url)  # 재시도
+                except Exception as e:
+                    print(f"   ⚠️  캐시 사용 실패: {e}")
+                    self.driver.switch_to.default_content()
+                    self.frame_locator.invalidate()  # 캐시 무효화
+                    return self.extract_photos_from_url(url)  # 재시도
             else:
                 # 캐시 없음: 첫 매장이므로 전체 검색
                 print(f"   🔍 첫 검색: 메인 페이지에서 사진 탭 찾는 중...")
                 if self.find_and_click_photo_tab():
                     print("   ✅ 메인 페이지에서 사진 탭 클릭 성공!")
-                    self.photo_tab_iframe_index = 0  # 메인 페이지에 있음을 캐시
+                    self.frame_locator.remember(MAIN_FRAME)  # 메인 페이지에 있음을 캐시
                     print("   💾 캐시 저장: 메인 페이지")
                 else:
                     # 메인 페이지에서 실패하면 iframe 확인
                     print(f"   ⚠️  메인 페이지에서 사진 탭을 찾지 못함")
                     print(f"   🔍 iframe 확인 중...")
                     
-                    iframes = self.driver.find_elements(By.TAG_NAME, "iframe")
+                    iframes = self.frame_locator.frames(self.driver)
                     if iframes:
                         print(f"   📦 {len(iframes)}개의 iframe 발견")
                         
                         # 각 iframe을 순회하면서 사진 탭 찾기
                         found_in_iframe = False
-                        for i, iframe in enumerate(iframes):
+                        for i, (key, iframe) in enumerate(iframes):
                             try:
-                                print(f"      🔍 iframe [{i+1}] 확인 중...")
+                                print(f"      🔍 iframe [{i+1}] {key} 확인 중...")
                                 self.driver.switch_to.frame(iframe)
                                 time.sleep(1)
                                 
                                 # iframe 내부에서 사진 탭 찾기
                                 if self.find_and_click_photo_tab():
                                     print(f"      ✅ iframe [{i+1}]에서 사진 탭 찾음!")
-                                    self.photo_tab_iframe_index = i + 1  # iframe 번호 캐시 (1부터 시작)
-                                    print(f"      💾 캐시 저장: iframe [{i+1}]")
+                                    self.frame_locator.remember(key)  # 프레임 키 캐시 (순번 대신 id/name/src)
+                                    print(f"      💾 캐시 저장: {key}")
                                     found_in_iframe = True
                                     break
                                 else:
@@ -325,113 +356,14 @@ class NaverMapBulkDownloaderV3:
             return [], {}
     
     def find_and_click_photo_tab(self):
-        """사진 탭 찾기 및 클릭 - 모든 가능한 방법 시도"""
-        
-        # 방법 1: 텍스트로 직접 찾기 (가장 확실함)
-        try:
-            print("   🔍 방법 1: 텍스트로 '사진' 탭 찾는 중...")
-            # 모든 요소 찾기
-            all_elements = self.driver.find_elements(By.XPATH, "//*[contains(text(), '사진')]")
-            print(f"      발견된 '사진' 포함 요소: {len(all_elements)}개")
-            
-            for elem in all_elements:
-                try:
-                    # 클릭 가능한 요소인지 확인
-                    if elem.is_displayed() and elem.is_enabled():
-                        text = elem.text.strip()
-                        print(f"      시도 중: '{text}' (tag: {elem.tag_name})")
-                        
-                        # '사진'이라는 텍스트만 있는 요소 찾기
-                        if text == '사진' or text.startswith('사진'):
-                            # JavaScript로 강제 클릭
-                            self.driver.execute_script("arguments[0].click();", elem)
-                            time.sleep(2)
-                            return True
-                except Exception as e:
-                    continue
-        except Exception as e:
-            print(f"      방법 1 실패: {e}")
-        
-        # 방법 2: a 태그 찾기
-        try:
-            print("   🔍 방법 2: <a> 태그로 사진 탭 찾는 중...")
-            photo_links = self.driver.find_elements(By.XPATH, "//a[contains(., '사진')]")
-            print(f"      발견된 링크: {len(photo_links)}개")
-            
-            for link in photo_links:
-                try:
-                    if link.is_displayed():
-                        print(f"      클릭 시도: {link.text}")
-                        self.driver.execute_script("arguments[0].click();", link)
-                        time.sleep(2)
-                        return True
-                except:
-                    continue
-        except Exception as e:
-            print(f"      방법 2 실패: {e}")
-        
-        # 방법 3: span 태그 찾기
-        try:
-            print("   🔍 방법 3: <span> 태그로 사진 탭 찾는 중...")
-            photo_spans = self.driver.find_elements(By.XPATH, "//span[contains(., '사진')]")
-            print(f"      발견된 span: {len(photo_spans)}개")
-            
-            for span in photo_spans:
-                try:
-                    if span.is_displayed():
-                        parent = span.find_element(By.XPATH, "..")
-                        print(f"      클릭 시도: {span.text} (부모 태그: {parent.tag_name})")
-                        self.driver.execute_script("arguments[0].click();", parent)
-                        time.sleep(2)
-                        return True
-                except:
-                    continue
-        except Exception as e:
-            print(f"      방법 3 실패: {e}")
-        
-        # 방법 4: CSS 클래스로 탭 찾기
-        try:
-            print("   🔍 방법 4: CSS 클래스로 탭 찾는 중...")
-            tab_selectors = [
-                "[class*='tab']",
-                "[class*='Tab']",
-                "[role='tab']",
-                "[class*='menu'] a",
-                "[class*='nav'] a"
-            ]
-            
-            for selector in tab_selectors:
-                try:
-                    tabs = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for tab in tabs:
-                        if tab.is_displayed() and '사진' in tab.text:
-                            print(f"      클릭 시도: {tab.text}")
-                            self.driver.execute_script("arguments[0].click();", tab)
-                            time.sleep(2)
-                            return True
-                except:
-                    continue
-        except Exception as e:
-            print(f"      방법 4 실패: {e}")
-        
-        # 방법 5: 모든 클릭 가능한 요소 검사
-        try:
-            print("   🔍 방법 5: 모든 클릭 가능한 요소 검사 중...")
-            clickable_elements = self.driver.find_elements(By.XPATH, "//*[@onclick or @href or @role='button' or self::a or self::button]")
-            
-            for elem in clickable_elements:
-                try:
-                    if elem.is_displayed() and '사진' in elem.text:
-                        print(f"      클릭 시도: {elem.text} (tag: {elem.tag_name})")
-                        self.driver.execute_script("arguments[0].click();", elem)
-                        time.sleep(2)
-                        return True
-                except:
-                    continue
-        except Exception as e:
-            print(f"      방법 5 실패: {e}")
-        
-        return False
+        """사진 탭 찾기 및 클릭 - 모든 가능한 방법을 한 번의 스크립트로 시도"""
+        result = self.click_probe.click(self.driver, '사진 탭', PHOTO_TAB_FULL_STRATEGIES)
+        if not result:
+            return False
+        
+        print(f"   🎯 사진 탭 클릭: {result['strategy']} ('{result['text']}', tag: {result['tag']})")
+        time.sleep(2)
+        return True
     
     def find_photo_categories(self):
         """사진 카테고리 버튼 찾기 - 업체만 찾기"""
@@ -502,42 +434,25 @@ class NaverMapBulkDownloaderV3:
             # 스크롤하여 모든 이미지 로드
             self.scroll_to_load_all_images()
             
-            # 모든 img 태그 찾기
-            all_images = self.driver.find_elements(By.TAG_NAME, "img")
-            print(f"      🖼️  총 {len(all_images)}개 이미지 발견")
-            
-            for img in all_images:
-                try:
-                    src = img.get_attribute('src')
-                    
-                    # 네이버 CDN 이미지만 추출
-                    if src and any(domain in src for domain in ['phinf.pstatic.net', 'blogpfthumb', 'postfiles']):
-                        # 원본 크기로 변환
-                        original_src = self.convert_to_original_size(src)
-                        
-                        if original_src not in photos:
-                            photos.append(original_src)
-                            
-                except:
-                    continue
+            # 브라우저 로드 시간 / 전송량 측정 (이미지 차단 모드 절감량 비교용)
+            record_page_metrics(self.driver, self.stats['browser'])
             
-            # 추가: data-src 속성도 확인
-            all_images_with_data_src = self.driver.find_elements(By.XPATH, "//*[@data-src]")
-            for img in all_images_with_data_src:
-                try:
-                    src = img.get_attribute('data-src')
-                    if src and any(domain in src for domain in ['phinf.pstatic.net', 'blogpfthumb', 'postfiles']):
-                        original_src = self.convert_to_original_size(src)
-                        if original_src not in photos:
-                            photos.append(original_src)
-                except:
-                    continue
+            # img src / data-src / srcset / background-image를 한 번에 수집 (네이버 CDN만)
+            for src in harvest_image_urls(self.driver):
+                # 원본 크기로 변환
+                original_src = self.convert_to_original_size(src)
+                
+                if original_src not in photos:
+                    photos.append(original_src)
             
             print(f"      ✅ {len(photos)}개 사진 URL 추출")
                         
         except Exception as e:
             print(f"      ⚠️  사진 추출 오류: {e}")
             
+        if photos:
+            self.first_url_timer.mark()
+            
         return photos
     
     def scroll_to_load_all_images(self):
@@ -585,40 +500,20 @@ class NaverMapBulkDownloaderV3:
             print("   ℹ️  다운로드할 사진이 없습니다.")
             return 0
             
-        downloaded_count = 0
+        tasks = []
         
         if photo_categories:
             for category, category_photos in photo_categories.items():
                 category_folder = os.path.join(folder_path, self.sanitize_filename(category))
-                os.makedirs(category_folder, exist_ok=True)
                 
                 print(f"   📁 카테고리: {category} ({len(category_photos)}개)")
                 
                 for idx, url in enumerate(category_photos, 1):
-                    try:
-                        response = requests.get(url, timeout=15, headers={
-                            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                            'Referer': 'https://map.naver.com/'
-                        })
-                        
-                        if response.status_code == 200:
-                            ext = '.jpg'
-                            content_type = response.headers.get('Content-Type', '')
-                            if 'png' in content_type:
-                                ext = '.png'
-                            elif 'webp' in content_type:
-                                ext = '.webp'
-                            
-                            filename = f"{category}_{idx:03d}{ext}"
-                            filepath = os.path.join(category_folder, filename)
-                            
-                            with open(filepath, 'wb') as f:
-                                f.write(response.content)
-                            
-                            downloaded_count += 1
-                            
-                    except Exception as e:
-                        print(f"   ⚠️  다운로드 실패 [{idx}]: {str(e)[:50]}")
+                    tasks.append({'url': url, 'folder': category_folder, 'name': f"{category}_{idx:03d}"})
+        
+        results = self.download_engine.download(tasks, progress_every=0)
+        downloaded_count = sum(1 for result in results if result['ok'])
+        self.stats['total_bytes'] += sum(result['size'] for result in results if result['ok'])
         
         print(f"   ✅ {downloaded_count}개 사진 다운로드 완료")
         return downloaded_count
@@ -646,6 +541,7 @@ class NaverMapBulkDownloaderV3:
             link_file = self.save_link_file(folder_path, store_name, naver_url)
             print(f"   🔗 링크 파일 저장: {os.path.basename(link_file)}")
             
+            self.first_url_timer.begin()
             photos, photo_categories = self.extract_photos_from_url(naver_url)
             
             if photos:
@@ -676,7 +572,7 @@ class NaverMapBulkDownloaderV3:
         
         try:
             for idx, row in df.iterrows():
-                self.process_single_store(idx, row)
+                self.driver_health.run(self, idx, row, self.watchdog.run)
                 
                 progress = (idx + 1) / len(df) * 100
                 print(f"\n📊 진행률: {progress:.1f}% ({idx + 1}/{len(df)})")
@@ -684,6 +580,9 @@ class NaverMapBulkDownloaderV3:
                 if (idx + 1) % 5 == 0:
                     print("   ⏳ 5개 처리마다 3초 대기 중...")
                     time.sleep(3)
+            
+            # 시간 초과 매장은 본 처리가 끝난 뒤 다시 시도
+            self.watchdog.run_retries(self, self.driver_health)
                     
         except KeyboardInterrupt:
             print("\n\n⚠️  사용자에 의해 중단되었습니다.")
@@ -703,24 +602,54 @@ class NaverMapBulkDownloaderV3:
         print(f"총 처리 대상: {self.stats['total']}개")
         print(f"✅ 성공: {self.stats['success']}개")
         print(f"❌ 실패: {self.stats['failed']}개")
+        for line in format_timeout_summary(self.stats):
+            print(line)
+        for line in format_health_summary(self.stats['driver_health']):
+            print(line)
         print(f"⚠️  링크 없음: {self.stats['no_url']}개")
         print(f"📷 다운로드한 총 사진 수: {self.stats['total_photos']}개")
+        print(f"💾 다운로드 용량: {format_bytes(self.stats['total_bytes'])}")
+        print(self.http_pool.summary())
+        print(self.frame_locator.summary())
+        for line in format_browser_summary(type(self).__name__, self.stats['browser'], self.headless, self.block_images):
+            print(line)
+        for line in format_page_load_summary(type(self).__name__, self.page_load, self.stats['first_url']):
+            print(line)
+        for line in format_wait_summary(self.stats['waits']):
+            print(line)
+        for line in format_probe_summary(self.stats['click_probe']):
+            print(line)
         print(f"⏱️  소요 시간: {elapsed_time/60:.1f}분")
         print(f"📁 저장 위치: {os.path.abspath(self.base_folder)}")
         print("="*60 + "\n")
 
 def main():
-    if len(sys.argv) < 2:
-        print("사용법: python naver_map_bulk_downloader_v3.py <엑셀파일경로>")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description="네이버 맵 대량 사진 다운로더 V3")
+    parser.add_argument('excel_path', help='엑셀 파일 경로')
+    add_download_arguments(parser)
+    add_browser_arguments(parser)
+    add_watchdog_arguments(parser)
+    add_frame_cache_arguments(parser)
+    add_health_arguments(parser)
+    args = parser.parse_args()
     
-    excel_path = sys.argv[1]
+    excel_path = args.excel_path
     
     if not os.path.exists(excel_path):
         print(f"❌ 파일을 찾을 수 없습니다: {excel_path}")
         sys.exit(1)
     
-    downloader = NaverMapBulkDownloaderV3(excel_path)
+    downloader = NaverMapBulkDownloaderV3(
+        excel_path,
+        download_workers=args.download_workers,
+        host_limit=args.host_limit,
+        http_pool_size=args.http_pool_size,
+        chunk_kb=args.chunk_size,
+        **browser_options_from_args(args),
+        **watchdog_options_from_args(args),
+        **frame_cache_options_from_args(args),
+        **health_options_from_args(args)
+    )
     downloader.run()
 
 if __name__ == "__main__":
@@ -1,73 +1,252 @@
 #!/usr/bin/env python3
 """
 네이버 맵 대량 사진 다운로더 V4 (엑셀 기반) - 완전 재작성
-사용법: python naver_map_bulk_downloader_v4.py <엑셀파일경로>
+사용법: python naver_map_bulk_downloader_v4.py <엑셀파일경로> [--download-workers N] [--pipeline] [--workers N] [--fast]
 
 V4 주요 개선사항:
 1. iframe 캐싱으로 속도 대폭 향상
 2. 업체 사진만 다운로드 (블로그, 클립 등 제외)
 3. 깔끔한 로그 출력
 4. 안정적인 에러 처리
+5. 동시 다운로드 엔진 (워커 수 / 호스트별 동시 접속 제한)
+6. 파이프라인 모드 (--pipeline): 브라우저 추출과 다운로드를 겹쳐서 실행
+7. 멀티 브라우저 모드 (--workers N): Chrome N개가 엑셀 행을 나눠서 처리
+8. 운영용 추출 모드 (--fast): 헤드리스 + 브라우저 이미지 차단 (URL은 DOM에서 추출)
+9. naver.me 단축 링크 사전 해석 + 영구 캐시 (link_cache.json - 가격표 추출과 공유)
+10. 사진 페이지 직접 이동: 장소 ID로 pcmap 사진 탭을 바로 열고, 사진 그리드가 없으면 기존 방식으로 전환
+11. 추출 방식 선택 (--extract-mode dom|network|compare): DOM 수집 / 네트워크 로그 수집 / 매장별 비교
+12. 불필요한 요청 차단 (지도 타일 / 웹폰트 / 통계 / 광고) - 매장별 차단 수 로그
+13. 페이지 로드 전략 선택 (--page-load eager|none) + 첫 사진 URL까지 걸린 시간 비교
+14. 매장별 제한 시간 (--store-timeout): 초과 시 드라이버 재시작, 본 처리 후 재시도
+15. 사진 탭 프레임 위치 영구 캐시 (frame_cache.json, iframe id/name/src 기준 - 찾지 못하면 자동 무효화)
+16. 드라이버 주기적 재시작: 매장 수 / 메모리 / 평균 로드 시간 기준 또는 크래시 시 (사유 로그)
+17. 상주 브라우저 데몬 연결 (--attach): Chrome 시작 시간 / 빈 캐시 비용 절감 (browser_daemon.py)
+18. 탭 미리 로드 (--tabs N): Chrome 하나에서 탭 N개를 돌려 쓰며 다음 매장 페이지를 미리 로드
+19. 비동기 백엔드 (--backend playwright --async-pages N): 프로세스 하나에서 페이지 N개 동시 처리 (선택 설치)
+20. 매장별 결과 체크포인트 (checkpoint.db) + 이어서 실행 (--resume): 완료된 매장은 건너뜀
+21. 단계별 체크포인트: 사진 URL 목록 / 실패한 사진을 기록해서 --resume 때 못 받은 사진만 Chrome 없이 다시 다운로드
+22. 실패 목록 JSONL (사진다운로드_실패_목록.jsonl) + 실패 매장만 다시 처리 (--retry-failed)
+    (사진 일부만 못 받은 매장은 목록 대신 --resume이 Chrome 없이 다시 받음)
+23. 실패 원인 분류 (시간 초과 / 선택자 / 크래시 / 죽은 링크 / HTTP) - 일시적 실패만 자동 재시도
+24. 요청 속도 자동 조절 (--rate): 5개마다 3초 대기 대신 워커 공유 토큰 버킷 - 느린 응답 / 캡차 / 오류 화면이면 감속
 """
 
 import os
 import sys
 import time
-import requests
+import argparse
+import queue
+import threading
 import pandas as pd
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import traceback
 from datetime import datetime
-import re
+from async_backend import (AsyncPhotoBackend, add_backend_arguments, backend_options_from_args,
+                           format_backend_summary, BACKEND_DEFAULTS)
+from browser_daemon import (add_attach_arguments, attach_options_from_args, start_driver, new_startup_stats,
+                            format_startup_summary, ATTACH_DEFAULTS)
+from browser_options import (build_chrome_options, add_browser_arguments, browser_options_from_args,
+                             describe_mode, new_page_metrics, record_page_metrics, format_browser_summary,
+                             FirstUrlTimer, new_first_url_stats, format_page_load_summary, BROWSER_DEFAULTS)
+from checkpoint_ledger import (CheckpointLedger, add_checkpoint_arguments, checkpoint_options_from_args,
+                               new_checkpoint_stats, format_checkpoint_summary, row_key, CHECKPOINT_DEFAULTS,
+                               PHASE_LINK_FILE, PHASE_URLS, PHASE_PHOTOS, PHASE_PENDING)
+from click_probe import ClickProbe, format_probe_summary, PHOTO_TAB_STRATEGIES, COMPANY_CATEGORY_STRATEGIES
+from dom_harvester import harvest_image_urls, to_original_size, canonical_urls
+from driver_health import (DriverHealth, add_health_arguments, health_options_from_args, new_health_stats,
+                           format_health_summary, HEALTH_DEFAULTS)
+from download_engine import (PhotoDownloadEngine, add_download_arguments, download_options_from_args,
+                             host_limits_from_arg, format_bytes, DOWNLOAD_DEFAULTS)
+from failure_classes import (FailureTracker, classify_download, format_failure_summary, is_transient, worst,
+                             LABELS, SELECTOR_MISS, DEAD_LINK, UNKNOWN)
+from failure_ledger import (add_retry_arguments, retry_options_from_args, failure_entry, merge_failure_ledger,
+                            failed_rows, RETRY_DEFAULTS)
+from frame_locator import (FrameLocator, add_frame_cache_arguments, frame_cache_options_from_args,
+                           FRAME_CACHE_DEFAULTS, MAIN_FRAME)
+from http_session import get_shared_session
+from link_resolver import (ShortLinkResolver, add_resolver_arguments, resolver_options_from_args,
+                           RESOLVER_DEFAULTS)
+from network_capture import (add_extract_mode_arguments, enable_performance_log, PerformanceLog,
+                             collect_image_urls, new_compare_stats, record_comparison, format_compare_summary, timed)
+from rate_limiter import (RateLimiter, add_rate_arguments, rate_options_from_args, new_rate_stats, format_rate_summary,
+                          RATE_DEFAULTS)
+from request_blocker import (RequestBlocker, add_blocker_arguments, blocker_options_from_args, new_block_stats,
+                             BLOCKER_DEFAULTS)
+from store_watchdog import (StoreWatchdog, add_watchdog_arguments, watchdog_options_from_args, format_timeout_summary,
+                            WATCHDOG_DEFAULTS)
+from tab_pool import TabPool, add_tab_arguments, tab_options_from_args, new_tab_stats, format_tab_summary, TAB_DEFAULTS
+from tool_options import ToolOptions, merge_defaults
+from worker_pool import run_parallel, add_worker_arguments
+from wait_engine import (WaitEngine, format_wait_summary, page_iframe_ready, text_present, photo_grid_populated,
+                         photo_grid_changed, photo_grid_signature, scroll_height_changed)
+
+# 장소 ID를 알면 지도 화면 없이 바로 여는 사진 탭 페이지
+PLACE_PHOTO_URL = "https://pcmap.place.naver.com/place/{place_id}/photo"
+
+# 실패 매장 목록 (--retry-failed 입력으로 사용)
+FAILURE_LEDGER_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "사진다운로드_실패_목록.jsonl")
+
+# 생성자 옵션 기본값 (기능 모듈별 기본값 + V4 전용)
+V4_OPTIONS = merge_defaults(
+    DOWNLOAD_DEFAULTS, BROWSER_DEFAULTS, RESOLVER_DEFAULTS, BLOCKER_DEFAULTS, WATCHDOG_DEFAULTS,
+    FRAME_CACHE_DEFAULTS, HEALTH_DEFAULTS, ATTACH_DEFAULTS, TAB_DEFAULTS, BACKEND_DEFAULTS,
+    CHECKPOINT_DEFAULTS, RETRY_DEFAULTS, RATE_DEFAULTS,
+    {
+        'base_folder': 'downloads',
+        'pipeline': False,
+        'pipeline_workers': 2,
+        'queue_size': 4,
+        'direct_photo_page': True,
+        'extract_mode': 'dom',
+        'block_preset': 'photo'
+    }
+)
 
 class NaverMapBulkDownloaderV4:
-    def __init__(self, excel_path, base_folder="downloads"):
+    def __init__(self, excel_path, **options):
+        options = ToolOptions(V4_OPTIONS, options)
         self.excel_path = excel_path
         # 현재 스크립트 위치에서 downloads 폴더 생성
         script_dir = os.path.dirname(os.path.abspath(__file__))
-        self.base_folder = os.path.join(script_dir, base_folder)
+        self.base_folder = os.path.join(script_dir, options.base_folder)
         self.driver = None
         self.stats = {
             'total': 0,
             'success': 0,
             'failed': 0,
             'no_url': 0,
-            'total_photos': 0
+            'total_photos': 0,
+            'total_bytes': 0,
+            'direct_hits': 0,
+            'direct_fallbacks': 0
         }
         
-        # 🔥 iframe 캐싱 변수
-        self.cached_iframe_index = None  # None=모름, 0=메인, 1~N=iframe번호
+        # 브라우저 모드 (--headless / --block-images) + 문서별 로드 시간 / 전송량 측정
+        self.headless = options.headless
+        self.block_images = options.block_images
+        self.stats['browser'] = new_page_metrics()
+        
+        # 페이지 로드 전략 + 매장별 첫 사진 URL까지 걸린 시간
+        self.page_load = options.page_load
+        self.stats['first_url'] = new_first_url_stats()
+        self.first_url_timer = FirstUrlTimer(self.stats['first_url'])
+        
+        # 사진 URL 추출 방식 (dom / network / compare)
+        self.extract_mode = options.extract_mode
+        if self.extract_mode != 'dom':
+            if self.block_images:
+                print("⚠️  network/compare 추출은 이미지 요청이 필요하므로 이미지 차단을 끕니다")
+                self.block_images = False
+            if self.extract_mode == 'compare':
+                self.stats['extract_compare'] = new_compare_stats()
+        
+        # 탭 여러 개로 다음 매장 미리 로드 (performance 로그가 탭끼리 섞이므로 DOM 추출에서만)
+        self.tabs = max(1, options.tabs)
+        if self.tabs > 1 and self.extract_mode != 'dom':
+            print("⚠️  network/compare 추출은 탭별 네트워크 로그를 구분할 수 없으므로 탭 미리 로드를 끕니다")
+            self.tabs = 1
+        self.stats['tabs'] = new_tab_stats()
+        self.tab_pool = None
+        self.upcoming_urls = []
+        
+        # 🔥 iframe 캐싱: 사진 탭이 있는 프레임 키 (frame_cache.json - V3 / 실행 간 공유)
+        self.frame_locator = FrameLocator('photo_tab', options.frame_cache, self.stats.setdefault('frames', {}))
+        
+        # 조건 기반 대기 (조건별 대기 시간은 stats['waits']에 기록)
+        self.waits = WaitEngine(self.stats.setdefault('waits', {}))
+        
+        # 공유 HTTP 세션 풀 + 동시 다운로드 엔진
+        self.http_pool = get_shared_session(options.http_pool_size)
+        self.download_engine = PhotoDownloadEngine(
+            max_workers=options.download_workers,
+            host_limits=host_limits_from_arg(options.host_limit),
+            session=self.http_pool,
+            chunk_kb=options.chunk_kb
+        )
+        
+        # naver.me 단축 링크 → 최종 URL (도구 간 공유 캐시)
+        self.link_resolver = ShortLinkResolver(cache_path=options.link_cache, session=self.http_pool,
+                                               max_workers=options.resolve_workers)
+        self.stats['links'] = self.link_resolver.stats
+        
+        # 추출에 필요 없는 요청 차단 (지도 타일 / 폰트 / 통계 / 광고) + 매장별 차단 수 집계
+        self.stats['blocked'] = new_block_stats()
+        self.request_blocker = RequestBlocker(options.block_preset, options.block_patterns,
+                                              enabled=options.block_requests, stats=self.stats['blocked'])
+        self.perf_log = PerformanceLog()
+        
+        # 상주 브라우저 데몬 연결 (없으면 Chrome 새로 실행) + 드라이버 시작 시간
+        self.attach = options.attach
+        self.stats['startup'] = new_startup_stats()
+        
+        # 매장별 제한 시간 감시 + 시간 초과 매장 재시도
+        self.stats['timed_out'] = 0
+        self.stats['timed_out_stores'] = []
+        self.watchdog = StoreWatchdog(options.store_timeout, options.timeout_retries)
+        
+        # 드라이버 상태 감시: 매장 수 / 메모리 / 로드 시간 기준 초과 또는 크래시 시 재시작
+        self.stats['driver_health'] = new_health_stats()
+        self.driver_health = DriverHealth(options.recycle_stores, options.max_memory_mb,
+                                          options.max_load_seconds, stats=self.stats['driver_health'])
+        
+        # 탭 / 버튼 클릭: 선택자 후보를 한 번의 스크립트로 시도 + 전략별 적중 횟수
+        self.click_probe = ClickProbe(self.stats.setdefault('click_probe', {}))
+        
+        # 실패 원인 분류 (분류별 실패 매장 수는 stats['failure_classes'])
+        self.failures = FailureTracker(self.stats.setdefault('failure_classes', {}))
+        # 사진 탭 검색 중 프레임별로 본 실패 - 검색 전체(캐시 + 메인 + 모든 iframe)가 실패했을 때만 매장 분류에 반영
+        self.tab_search = FailureTracker()
+        
+        # 장소 ID를 아는 링크는 사진 탭 페이지로 바로 이동 (실패하면 기존 방식)
+        self.direct_photo_page = options.direct_photo_page
+        
+        # 파이프라인 모드: 추출 단계가 (폴더, 사진) 작업을 큐에 넣으면 백그라운드 워커가 다운로드
+        self.pipeline = options.pipeline
+        self.pipeline_workers = max(1, options.pipeline_workers)
+        self.download_queue = queue.Queue(maxsize=max(1, options.queue_size))  # 가득 차면 추출 단계가 대기 (backpressure)
+        self.download_threads = []
+        self.stats_lock = threading.Lock()
+        # 다운로드 스레드가 집계한 결과 (매장 시간 초과로 결과를 되돌릴 때 유지)
+        self.background_outcomes = {'success': 0, 'failed': 0}
+        
+        # 브라우저 백엔드: selenium(기본) / playwright(비동기 - 페이지 여러 개 동시 처리)
+        self.backend = options.backend
+        self.async_pages = max(1, options.async_pages)
+        
+        # 매장별 처리 결과 체크포인트 (--resume이면 완료된 매장 건너뜀)
+        self.resume = options.resume
+        self.stats['checkpoint'] = new_checkpoint_stats()
+        self.checkpoint = CheckpointLedger('v4', options.checkpoint, stats=self.stats['checkpoint'])
+        
+        # 실패 매장 목록 (JSONL) + 목록에 있는 매장만 다시 처리 (--retry-failed, 기본은 일시적 실패만)
+        self.failed_stores = []
+        # 파이프라인 다운로드 스레드의 실패 - 매장 시간 초과로 failed_stores를 되돌릴 때 섞이지 않도록 따로 모음
+        self.background_failures = []
+        self.retry_failed = options.retry_failed
+        self.retry_permanent = options.retry_permanent
+        # 이번 실행에서 처리한 매장 키 - 실패 목록을 병합할 때 이 매장들의 이전 줄만 교체 (워커 결과는 merge_stats로 합쳐짐)
+        self.stats['processed_keys'] = []
+        
+        # 페이지 이동 속도 제한 (워커 모드에서는 rate_shared로 워커 전체가 같은 버킷 사용)
+        self.stats['rate_limit'] = new_rate_stats()
+        self.rate_limiter = RateLimiter(options.rate, options.min_rate, options.max_rate, options.target_load,
+                                        shared=options.rate_shared, stats=self.stats['rate_limit'])
         
     def setup_driver(self):
         """Chrome 드라이버 설정"""
-        chrome_options = Options()
-        # headless 모드 비활성화 (디버깅용)
-        # chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--start-maximized')
-        chrome_options.add_argument('--lang=ko-KR')
-        chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-        
-        # 이미지 로드 활성화
-        prefs = {
-            "profile.managed_default_content_settings.images": 1,
-            "profile.default_content_setting_values.notifications": 2
-        }
-        chrome_options.add_experimental_option("prefs", prefs)
+        chrome_options = build_chrome_options(headless=self.headless, block_images=self.block_images,
+                                              page_load=self.page_load, debugger_address=self.attach)
+        # performance 로그 (네트워크 추출 / 차단 요청 집계)
+        enable_performance_log(chrome_options)
         
-        self.driver = webdriver.Chrome(options=chrome_options)
+        self.driver = start_driver(chrome_options, self.attach, self.stats['startup'])
         self.driver.implicitly_wait(10)
-        print("✅ Chrome 드라이버 초기화 완료\n")
+        self.waits.attach(self.driver)
+        self.request_blocker.apply(self.driver)
+        if self.tabs > 1:
+            # 드라이버를 새로 만들 때마다 탭 풀도 새로 (요청 차단은 탭마다 적용)
+            self.tab_pool = TabPool(self.driver, self.tabs, self.stats['tabs'], setup_tab=self.request_blocker.apply,
+                                    limiter=self.rate_limiter)
+        print(f"✅ Chrome 드라이버 초기화 완료 ({describe_mode(self.headless, self.block_images, self.page_load, self.attach)})\n")
         
     def read_excel(self):
         """엑셀 파일 읽기"""
@@ -186,37 +365,55 @@ class NaverMapBulkDownloaderV4:
         
         return link_file
         
-    def extract_photos_from_url(self, url):
+    def extract_photos_from_url(self, url, place_id=None):
         """네이버 맵 URL에서 사진 추출 - V4 캐싱 버전"""
         photos = []
         photo_categories = {}
         
+        # 이전 매장의 네트워크 로그 비우기
+        self.perf_log.reset(self.driver)
+        
+        # ⚡ 빠른 경로: 장소 사진 페이지를 최상위 문서로 직접 열기
+        if place_id and self.direct_photo_page:
+            photos, photo_categories = self.extract_photos_direct(place_id)
+            if photos:
+                self.stats['direct_hits'] += 1
+                return photos, photo_categories
+            print("   ⚠️  사진 페이지 직접 이동 실패 - 기존 방식으로 전환")
+            self.stats['direct_fallbacks'] += 1
+        
         try:
+            self.tab_search.begin()
             print(f"   🌐 페이지 로딩 중...")
-            self.driver.get(url)
-            time.sleep(5)  # 충분한 로딩 시간
+            self.open_page(url)
+            self.waits.wait_for('페이지 iframe', page_iframe_ready(), timeout=10, fallback=5)
             
             # 🔥 캐싱 사용
-            if self.cached_iframe_index is not None:
-                print(f"   ⚡ [캐시 사용] iframe [{self.cached_iframe_index}]로 바로 이동")
+            if self.frame_locator.key is not None:
+                print(f"   ⚡ [캐시 사용] {self.frame_locator.key}로 바로 이동")
                 success = self.try_cached_iframe()
                 if not success:
                     print("   ⚠️  캐시 실패 - 전체 검색으로 전환")
-                    self.cached_iframe_index = None
+                    self.frame_locator.invalidate()
                     return self.extract_photos_from_url(url)  # 재시도
             else:
                 print(f"   🔍 [첫 검색] 사진 탭 위치 찾는 중...")
                 if not self.find_photo_tab_first_time():
                     print("   ❌ 사진 탭을 찾을 수 없음")
+                    self.failures.note(self.tab_search.current or SELECTOR_MISS)
                     return [], {}
             
             print("   ✅ 사진 탭 접근 성공!")
-            time.sleep(3)  # 사진 로드 대기
+            if self.waits.wait_for('사진 그리드', photo_grid_populated(), timeout=8, fallback=3):
+                self.first_url_timer.mark()
             
             # 업체 카테고리만 찾기
+            grid_before = photo_grid_signature(self.driver)
             if self.click_company_category():
                 print("   📂 업체 카테고리 선택 완료")
-                time.sleep(2)
+                # 네트워크 추출은 전환 뒤에 받은 이미지만 (전환 전 전체 그리드 / 프로필 이미지 제외)
+                self.perf_log.mark(self.driver)
+                self.waits.wait_for('업체 카테고리 전환', photo_grid_changed(grid_before), timeout=4, fallback=2)
             else:
                 print("   ℹ️  업체 카테고리 버튼 없음 - 전체 사진 추출")
             
@@ -238,110 +435,129 @@ class NaverMapBulkDownloaderV4:
         except Exception as e:
             print(f"   ❌ 사진 추출 오류: {e}")
             traceback.print_exc()
+            self.failures.note(e)
             try:
                 self.driver.switch_to.default_content()
             except:
                 pass
             return [], {}
     
+    def open_page(self, url):
+        """매장 페이지 열기 - 탭 모드에서는 미리 로드해 둔 탭으로 전환하고 다음 매장 미리 로드 (요청 속도 제한 적용)
+
+        미리 로드는 로드를 시작할 때 토큰을 받았으므로 그 탭으로 전환할 때는 다시 받지 않음
+        """
+        if self.tab_pool:
+            self.rate_limiter.navigate(self.driver, url, lambda target: self.tab_pool.open(target, self.upcoming_urls),
+                                       charged=self.tab_pool.is_preloaded(url))
+        else:
+            self.rate_limiter.navigate(self.driver, url)
+    
+    def store_page_url(self, row):
+        """매장에서 처음 열게 될 URL (탭 미리 로드용) - 링크가 없으면 None"""
+        naver_url = row.get('네이버지도링크', None)
+        if pd.isna(naver_url) or not naver_url:
+            return None
+        place_id = self.link_resolver.place_id(naver_url)
+        if place_id and self.direct_photo_page:
+            return PLACE_PHOTO_URL.format(place_id=place_id)
+        return self.link_resolver.lookup(naver_url)
+    
+    def extract_photos_direct(self, place_id):
+        """장소 사진 페이지(pcmap)를 직접 열어서 추출 - 지도 화면 / iframe 탐색 / 사진 탭 클릭 생략"""
+        photos = []
+        photo_categories = {}
+        
+        try:
+            print(f"   ⚡ 사진 페이지로 바로 이동 (장소 ID {place_id})")
+            self.open_page(PLACE_PHOTO_URL.format(place_id=place_id))
+            
+            if not self.waits.wait_for('사진 페이지 직접 로드', photo_grid_populated(), timeout=6, fallback=2):
+                return [], {}
+            self.first_url_timer.mark()
+            
+            # 업체 카테고리만 찾기
+            grid_before = photo_grid_signature(self.driver)
+            if self.click_company_category():
+                print("   📂 업체 카테고리 선택 완료")
+                # 네트워크 추출은 전환 뒤에 받은 이미지만 (전환 전 전체 그리드 / 프로필 이미지 제외)
+                self.perf_log.mark(self.driver)
+                self.waits.wait_for('업체 카테고리 전환', photo_grid_changed(grid_before), timeout=4, fallback=2)
+            else:
+                print("   ℹ️  업체 카테고리 버튼 없음 - 전체 사진 추출")
+            
+            photos = self.extract_all_visible_photos()
+            if photos:
+                photo_categories['업체'] = photos
+                print(f"   ✅ 총 {len(photos)}개 사진 URL 추출 완료")
+            
+        except Exception as e:
+            print(f"   ⚠️  사진 페이지 직접 추출 오류: {str(e)[:80]}")
+            self.failures.note(e)
+            return [], {}
+        
+        return photos, photo_categories
+    
     def try_cached_iframe(self):
         """캐시된 iframe으로 바로 이동"""
         try:
-            if self.cached_iframe_index == 0:
-                # 메인 페이지
-                return self.click_photo_tab_simple()
-            else:
-                # iframe
-                iframes = self.driver.find_elements(By.TAG_NAME, "iframe")
-                if len(iframes) >= self.cached_iframe_index:
-                    self.driver.switch_to.frame(iframes[self.cached_iframe_index - 1])
-                    time.sleep(1)
-                    return self.click_photo_tab_simple()
-                else:
-                    return False
-        except:
+            if not self.frame_locator.enter(self.driver):
+                return False
+            if self.frame_locator.key != MAIN_FRAME:
+                self.waits.wait_for('iframe 내용', text_present('사진'), timeout=5, fallback=1)
+            return self.click_photo_tab_simple()
+        except Exception as e:
+            self.tab_search.note(e)
             return False
     
     def find_photo_tab_first_time(self):
         """첫 번째로 사진 탭 위치 찾기 (캐싱용)"""
         # 메인 페이지 시도
         if self.click_photo_tab_simple():
-            self.cached_iframe_index = 0
+            self.frame_locator.remember(MAIN_FRAME)
             print(f"   💾 [캐시 저장] 메인 페이지")
             return True
         
         # iframe 순회
-        iframes = self.driver.find_elements(By.TAG_NAME, "iframe")
+        iframes = self.frame_locator.frames(self.driver)
         if not iframes:
             return False
         
         print(f"   📦 {len(iframes)}개 iframe 발견 - 순회 시작")
         
-        for i, iframe in enumerate(iframes, 1):
+        for i, (key, iframe) in enumerate(iframes, 1):
             try:
                 print(f"      [{i}/{len(iframes)}] 확인 중...", end=" ")
                 self.driver.switch_to.frame(iframe)
-                time.sleep(0.5)
                 
-                if self.click_photo_tab_simple():
-                    self.cached_iframe_index = i
+                # 페이지 iframe은 page_iframe_ready에서 이미 준비됨 - 기다리지 않고 '사진' 글자가 있는 프레임만 클릭 시도
+                if text_present('사진')(self.driver) and self.click_photo_tab_simple():
+                    self.frame_locator.remember(key)
                     print(f"✅ 발견!")
-                    print(f"   💾 [캐시 저장] iframe [{i}]")
+                    print(f"   💾 [캐시 저장] {key}")
                     return True
                 else:
                     print("❌")
                     self.driver.switch_to.default_content()
             except Exception as e:
                 print(f"⚠️ 오류")
+                self.tab_search.note(e)
                 self.driver.switch_to.default_content()
                 continue
         
         return False
     
     def click_photo_tab_simple(self):
-        """사진 탭 클릭 (간단 버전)"""
-        try:
-            # 방법 1: XPath로 '사진' 텍스트 찾기
-            elements = self.driver.find_elements(By.XPATH, "//*[text()='사진']")
-            for elem in elements:
-                try:
-                    if elem.is_displayed() and elem.is_enabled():
-                        self.driver.execute_script("arguments[0].click();", elem)
-                        time.sleep(1)
-                        return True
-                except:
-                    continue
-            
-            # 방법 2: 포함 검색
-            elements = self.driver.find_elements(By.XPATH, "//*[contains(text(), '사진')]")
-            for elem in elements:
-                try:
-                    if elem.is_displayed() and '사진' == elem.text.strip():
-                        self.driver.execute_script("arguments[0].click();", elem)
-                        time.sleep(1)
-                        return True
-                except:
-                    continue
-            
-            return False
-        except:
-            return False
+        """사진 탭 클릭 (간단 버전) - 선택자 후보를 한 번의 스크립트로 시도"""
+        if self.click_probe.click(self.driver, '사진 탭', PHOTO_TAB_STRATEGIES):
+            return True
+        # 스크립트 오류(크래시 / 시간 초과)와 단순히 못 찾은 경우를 구분해서 기록 (검색 전체가 실패하면 매장 분류로)
+        self.tab_search.note(self.click_probe.last_error or SELECTOR_MISS)
+        return False
     
     def click_company_category(self):
         """업체 카테고리 버튼 클릭"""
-        try:
-            # '업체' 버튼 찾기
-            buttons = self.driver.find_elements(By.XPATH, "//*[text()='업체']")
-            for btn in buttons:
-                try:
-                    if btn.is_displayed():
-                        self.driver.execute_script("arguments[0].click();", btn)
-                        return True
-                except:
-                    continue
-            return False
-        except:
-            return False
+        return bool(self.click_probe.click(self.driver, '업체 버튼', COMPANY_CATEGORY_STRATEGIES))
     
     def extract_all_visible_photos(self):
         """현재 보이는 모든 사진 URL 추출"""
@@ -351,41 +567,35 @@ class NaverMapBulkDownloaderV4:
             # 스크롤하여 모든 이미지 로드
             self.scroll_to_load_all_images()
             
-            # 모든 img 태그 찾기
-            all_images = self.driver.find_elements(By.TAG_NAME, "img")
+            # 브라우저 로드 시간 / 전송량 측정 (이미지 차단 모드 절감량 비교용)
+            record_page_metrics(self.driver, self.stats['browser'])
             
-            for img in all_images:
-                try:
-                    src = img.get_attribute('src')
-                    
-                    # 네이버 CDN 이미지만 추출
-                    if src and any(domain in src for domain in ['phinf.pstatic.net', 'blogpfthumb', 'postfiles']):
-                        # 원본 크기로 변환
-                        original_src = self.convert_to_original_size(src)
-                        
-                        if original_src not in photos:
-                            photos.append(original_src)
-                            
-                except:
-                    continue
-            
-            # data-src 속성도 확인
-            all_images_with_data_src = self.driver.find_elements(By.XPATH, "//*[@data-src]")
-            for img in all_images_with_data_src:
-                try:
-                    src = img.get_attribute('data-src')
-                    if src and any(domain in src for domain in ['phinf.pstatic.net', 'blogpfthumb', 'postfiles']):
-                        original_src = self.convert_to_original_size(src)
-                        if original_src not in photos:
-                            photos.append(original_src)
-                except:
-                    continue
+            if self.extract_mode == 'network':
+                # 페이지가 실제로 받은 이미지 응답 (performance 로그)
+                photos = self.canonical_photos(collect_image_urls(self.perf_log.since_mark(self.driver)))
+            elif self.extract_mode == 'compare':
+                # 둘 다 수집해서 비교 (저장은 DOM 결과)
+                dom_sources, dom_seconds = timed(lambda: harvest_image_urls(self.driver))
+                network_sources, network_seconds = timed(lambda: collect_image_urls(self.perf_log.since_mark(self.driver)))
+                photos = self.canonical_photos(dom_sources)
+                record_comparison(self.stats['extract_compare'], photos, dom_seconds,
+                                  self.canonical_photos(network_sources), network_seconds)
+            else:
+                # img src / data-src / srcset / background-image를 한 번에 수집 (네이버 CDN만)
+                photos = self.canonical_photos(harvest_image_urls(self.driver))
                         
         except Exception as e:
             print(f"      ⚠️  사진 추출 오류: {e}")
             
+        if photos:
+            self.first_url_timer.mark()
+            
         return photos
     
+    def canonical_photos(self, sources):
+        """원본 크기로 변환 + 중복 제거 (순서 유지)"""
+        return canonical_urls(sources)
+    
     def scroll_to_load_all_images(self):
         """스크롤하여 모든 이미지 로드"""
         try:
@@ -393,89 +603,162 @@ class NaverMapBulkDownloaderV4:
             
             for i in range(10):  # 최대 10번 스크롤
                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(0.8)
                 
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
-                
-                if new_height == last_height:
+                # 추가 로드로 높이가 바뀔 때까지 대기 (안 바뀌면 끝까지 로드된 것)
+                if not self.waits.wait_for('스크롤 추가 로드', scroll_height_changed(last_height), timeout=1.5, fallback=0.8):
                     break
-                    
-                last_height = new_height
+                
+                last_height = self.driver.execute_script("return document.body.scrollHeight")
                 
         except:
             pass
     
     def convert_to_original_size(self, url):
-        """썸네일 URL을 원본 크기로 변환"""
-        # type 파라미터 변경
-        type_patterns = [
-            (r'\?type=w\d+', '?type=w1200'),
-            (r'\?type=m\d+', '?type=w1200'),
-            (r'\?type=a\d+', '?type=w1200'),
-            (r'/type=w\d+/', '/type=w1200/'),
-        ]
-        
-        for pattern, replacement in type_patterns:
-            url = re.sub(pattern, replacement, url)
-        
-        # 썸네일 크기 제거
-        url = re.sub(r'_[0-9]+x[0-9]+', '', url)
-        
-        return url
+        """썸네일 URL을 원본 크기로 변환 (비동기 백엔드와 같은 규칙)"""
+        return to_original_size(url)
     
-    def download_photos(self, photos, photo_categories, folder_path, store_name):
+    def download_photos(self, photos, photo_categories, folder_path, store_name, progress_every=5, row=None):
         """사진 다운로드"""
         if not photos:
             print("   ℹ️  다운로드할 사진이 없습니다.")
             return 0
             
-        downloaded_count = 0
-        
         # 업체 폴더 생성
         company_folder = os.path.join(folder_path, "업체")
-        os.makedirs(company_folder, exist_ok=True)
         
         print(f"   📥 다운로드 시작: {len(photos)}개")
         
-        for idx, url in enumerate(photos, 1):
-            try:
-                response = requests.get(url, timeout=15, headers={
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                    'Referer': 'https://map.naver.com/'
-                })
-                
-                if response.status_code == 200:
-                    ext = '.jpg'
-                    content_type = response.headers.get('Content-Type', '')
-                    if 'png' in content_type:
-                        ext = '.png'
-                    elif 'webp' in content_type:
-                        ext = '.webp'
-                    
-                    filename = f"업체_{idx:03d}{ext}"
-                    filepath = os.path.join(company_folder, filename)
-                    
-                    with open(filepath, 'wb') as f:
-                        f.write(response.content)
-                    
-                    downloaded_count += 1
-                    
-                    # 진행률 표시
-                    if idx % 5 == 0 or idx == len(photos):
-                        print(f"      [{idx}/{len(photos)}] 완료")
-                    
-            except Exception as e:
-                print(f"   ⚠️  다운로드 실패 [{idx}]: {str(e)[:50]}")
+        tasks = [
+            {'url': url, 'folder': company_folder, 'name': f"업체_{idx:03d}"}
+            for idx, url in enumerate(photos, 1)
+        ]
+        downloaded_count = self.download_tasks(tasks, progress_every, row)
         
         print(f"   ✅ {downloaded_count}개 사진 다운로드 완료")
         return downloaded_count
     
+    def download_tasks(self, tasks, progress_every=5, row=None, carried=()):
+        """다운로드 작업 실행 - 성공 수 반환, row가 있으면 실패한 사진 목록(+ carried)을 단계 체크포인트에 기록"""
+        results = self.download_engine.download(tasks, progress_every=progress_every)
+        downloaded_count = sum(1 for result in results if result['ok'])
+        with self.stats_lock:
+            self.stats['total_bytes'] += sum(result['size'] for result in results if result['ok'])
+        
+        if row is not None:
+            failed = list(carried) + [{'name': result['task']['name'], 'url': result['task']['url'],
+                                       'class': classify_download(result)}
+                                      for result in results if not result['ok']]
+            self.checkpoint.record_phase(row, PHASE_PHOTOS, 'partial' if failed else 'done', failed)
+        return downloaded_count
+    
+    def retry_downloads(self, rows):
+        """--resume: 사진 URL 목록이 기록된 매장은 Chrome 없이 못 받은 사진만 다시 다운로드 - 브라우저가 필요한 행 반환"""
+        phases = self.checkpoint.load_phases([PHASE_URLS, PHASE_PHOTOS])
+        remaining = []
+        for idx, row in rows:
+            store = phases.get(row_key(row), {})
+            urls = store.get(PHASE_URLS)
+            if not urls or urls['status'] != 'done':
+                remaining.append((idx, row))
+                continue
+            
+            self.stats['processed_keys'].append(row_key(row))
+            folder_path = self.create_folder_structure(row.get('지역', 'unknown'), row.get('지역상세', 'unknown'),
+                                                       row.get('매장명', 'unknown'))
+            company_folder = os.path.join(folder_path, "업체")
+            photos_phase = store.get(PHASE_PHOTOS)
+            permanent = []
+            if photos_phase and photos_phase['status'] != PHASE_PENDING:
+                # 지난번에 실패한 사진 중 일시적 실패만 (HTTP 4xx 등은 다시 받아도 같음)
+                failed = photos_phase['data'] or []
+                permanent = [item for item in failed if not is_transient(item.get('class') or UNKNOWN)]
+                tasks = [{'url': item['url'], 'folder': company_folder, 'name': item['name']}
+                         for item in failed if is_transient(item.get('class') or UNKNOWN)]
+            else:
+                # 다운로드 결과 기록 전에 중단 - URL 목록 전체
+                tasks = [{'url': url, 'folder': company_folder, 'name': f"업체_{i:03d}"}
+                         for i, url in enumerate(urls['data'] or [], 1)]
+            
+            if not tasks:
+                # 영구 실패 사진만 남음 → 분류를 기록해서 다음 --resume부터 건너뜀
+                failure_class = worst(item.get('class') for item in permanent)
+                self.checkpoint.record(row, 'partial' if failure_class else 'done', failure_class=failure_class)
+                continue
+            
+            print(f"📥 [이어받기] {row.get('매장명', 'unknown')}: 사진 {len(tasks)}개 다시 다운로드 (브라우저 없이)")
+            downloaded = self.download_tasks(tasks, progress_every=0, row=row, carried=permanent)
+            complete = downloaded == len(tasks)
+            with self.stats_lock:
+                self.stats['total_photos'] += downloaded
+                self.stats['success' if complete else 'failed'] += 1
+            self.stats['checkpoint']['download_only'] += 1
+            # 일시적 실패는 다 받았어도 영구 실패 사진이 남으면 위와 같이 분류 기록 (다음 --resume부터 건너뜀)
+            failure_class = worst(item.get('class') for item in permanent) if complete else None
+            self.checkpoint.record(row, 'done' if complete and not failure_class else 'partial', downloaded,
+                                   failure_class=failure_class)
+        return remaining
+    
+    def start_download_pipeline(self):
+        """백그라운드 다운로드 워커 시작"""
+        for i in range(self.pipeline_workers):
+            thread = threading.Thread(target=self.download_worker, name=f"download-worker-{i + 1}", daemon=True)
+            thread.start()
+            self.download_threads.append(thread)
+        print(f"🔀 파이프라인 모드: 다운로드 워커 {self.pipeline_workers}개, 큐 크기 {self.download_queue.maxsize}\n")
+    
+    def download_worker(self):
+        """큐에서 (폴더, 사진) 작업을 꺼내 다운로드"""
+        while True:
+            job = self.download_queue.get()
+            try:
+                if job is None:
+                    return
+                folder_path, photos, photo_categories, store_name, row = job
+                started = time.time()
+                print(f"   📥 [백그라운드] {store_name}: {len(photos)}개 다운로드")
+                downloaded = self.download_photos(photos, photo_categories, folder_path, store_name,
+                                                  progress_every=0, row=row)
+                # 성공 / 실패는 다운로드가 끝난 뒤에 집계 (순차 처리와 같은 기준)
+                with self.stats_lock:
+                    self.stats['total_photos'] += downloaded
+                    self.stats['success'] += 1
+                    self.background_outcomes['success'] += 1
+                # 다운로드까지 끝나야 완료로 기록 (큐에 남은 채 중단되면 다음 --resume에서 다시 처리)
+                self.checkpoint.record(row, 'done' if downloaded == len(photos) else 'partial', downloaded)
+            except Exception as e:
+                print(f"   ❌ [백그라운드] 다운로드 실패: {e}")
+                with self.stats_lock:
+                    self.stats['failed'] += 1
+                    self.background_outcomes['failed'] += 1
+                    # 추출 스레드의 self.failures와 섞이지 않도록 분류 통계만 공유하는 추적기 사용
+                    failure_class = FailureTracker(self.stats['failure_classes']).finish(e)
+                    self.background_failures.append(self.failure_entry(row, PHASE_PHOTOS, e, started, failure_class))
+                self.checkpoint.record(row, 'failed', detail=e, failure_class=failure_class)
+            finally:
+                self.download_queue.task_done()
+    
+    def stop_download_pipeline(self):
+        """남은 작업을 모두 처리한 뒤 워커 종료 (최종 통계가 정확하도록)"""
+        if not self.download_threads:
+            return
+        pending = self.download_queue.qsize()
+        if pending:
+            print(f"\n⏳ 남은 다운로드 작업 {pending}개 처리 대기 중...")
+        for _ in self.download_threads:
+            self.download_queue.put(None)
+        for thread in self.download_threads:
+            thread.join()
+        self.download_threads = []
+    
     def process_single_store(self, row_idx, row):
         """개별 매장 처리"""
         region = row.get('지역', 'unknown')
         region_detail = row.get('지역상세', 'unknown')
         store_name = row.get('매장명', 'unknown')
         naver_url = row.get('네이버지도링크', None)
+        self.failures.begin()
+        started = time.time()
+        self.stats['processed_keys'].append(row_key(row))
         
         print(f"\n{'='*60}")
         print(f"[{row_idx + 1}/{self.stats['total']}] 처리 중: {region} > {region_detail} > {store_name}")
@@ -484,6 +767,7 @@ class NaverMapBulkDownloaderV4:
         if pd.isna(naver_url) or not naver_url:
             print("   ⚠️  네이버 지도 링크가 없습니다. 건너뜁니다.")
             self.stats['no_url'] += 1
+            self.checkpoint.record(row, 'no_url')
             return
         
         try:
@@ -492,23 +776,62 @@ class NaverMapBulkDownloaderV4:
             
             link_file = self.save_link_file(folder_path, store_name, naver_url)
             print(f"   🔗 링크 저장: {os.path.basename(link_file)}")
+            self.checkpoint.record_phase(row, PHASE_LINK_FILE, 'done')
             
-            photos, photo_categories = self.extract_photos_from_url(naver_url)
+            # 단축 링크는 캐시된 최종 URL로 바로 이동 (리다이렉트 생략)
+            self.first_url_timer.begin()
+            if self.link_resolver.is_dead(naver_url):
+                self.failures.note(DEAD_LINK)
+            photos, photo_categories = self.extract_photos_from_url(self.link_resolver.lookup(naver_url),
+                                                                    place_id=self.link_resolver.place_id(naver_url))
+            self.request_blocker.record_store(self.perf_log.read(self.driver))
             
-            if photos:
-                downloaded = self.download_photos(photos, photo_categories, folder_path, store_name)
-                self.stats['total_photos'] += downloaded
-                self.stats['success'] += 1
+            if not photos and self.failures.current:
+                # 사진 탭 / 그리드를 못 찾은 원인이 있으면 '사진 없음'이 아니라 실패로 분류
+                failure_class = self.failures.finish()
+                print(f"   ❌ 사진 추출 실패 ({LABELS[failure_class]})")
+                self.record_failure(row, failure_class, 'PhotoExtractFailed', started)
+                return
+            
+            # 추출한 URL 목록 보관 → 다운로드만 실패하면 다음 --resume에서 브라우저 없이 재시도
+            self.checkpoint.record_urls(row, photos)
+            
+            if photos and self.pipeline:
+                # 큐가 가득 차 있으면 여기서 대기 (backpressure)
+                self.download_queue.put((folder_path, photos, photo_categories, store_name, row))
+                print(f"   📤 다운로드 큐에 추가 ({len(photos)}개, 대기 {self.download_queue.qsize()}건)")
+            elif photos:
+                downloaded = self.download_photos(photos, photo_categories, folder_path, store_name, row=row)
+                with self.stats_lock:
+                    self.stats['total_photos'] += downloaded
+                    self.stats['success'] += 1
+                self.checkpoint.record(row, 'done' if downloaded == len(photos) else 'partial', downloaded)
             else:
                 print("   ℹ️  사진을 찾을 수 없습니다.")
-                self.stats['success'] += 1
+                with self.stats_lock:
+                    self.stats['success'] += 1
+                self.checkpoint.record(row, 'done')
                 
         except Exception as e:
             print(f"   ❌ 처리 실패: {e}")
             traceback.print_exc()
+            self.record_failure(row, self.failures.finish(e), e, started)
+    
+    def failure_entry(self, row, phase, error, started, failure_class):
+        """실패 목록 한 줄 (재시도 때 링크 확인용으로 원래 링크 포함)"""
+        return {**failure_entry(row, phase, error, time.time() - started, failure_class),
+                '네이버지도링크': row.get('네이버지도링크')}
+    
+    def record_failure(self, row, failure_class, error, started):
+        """매장 실패 확정 - 실패 집계 + 실패 목록 + 체크포인트 기록 (비동기 백엔드도 같은 경로 사용)"""
+        entry = self.failure_entry(row, PHASE_URLS, error, started, failure_class)
+        with self.stats_lock:
             self.stats['failed'] += 1
+            self.failed_stores.append(entry)
+        self.checkpoint.record(row, 'failed', detail=None if isinstance(error, str) else error,
+                               failure_class=failure_class)
     
-    def run(self):
+    def run(self, workers=1, worker_options=None):
         """전체 프로세스 실행"""
         start_time = time.time()
         
@@ -519,18 +842,61 @@ class NaverMapBulkDownloaderV4:
         df = self.read_excel()
         self.stats['total'] = len(df)
         
+        # 단축 링크 사전 해석 (HTTP 리다이렉트만 - 캐시된 링크는 건너뜀)
+        self.link_resolver.resolve_all(df.get('네이버지도링크', []))
+        
+        # 이어서 실행: 체크포인트에 완료로 기록된 매장 제외
+        rows = self.checkpoint.pending(df.iterrows()) if self.resume else list(df.iterrows())
+        if self.retry_failed:
+            rows = failed_rows(rows, self.retry_failed, self.retry_permanent)
+        if self.resume:
+            # URL 목록까지 기록된 매장은 다운로드 단계만 브라우저 없이 재시도
+            rows = self.retry_downloads(rows)
+        
+        if not rows:
+            print("✅ 브라우저로 처리할 매장이 없습니다.")
+        elif self.backend == 'playwright':
+            # 비동기 백엔드: 프로세스 하나에서 페이지 여러 개로 동시 처리 (--workers 대신 --async-pages)
+            if workers > 1:
+                print(f"⚠️  playwright 백엔드는 --workers를 쓰지 않습니다. 동시 페이지 {self.async_pages}개로 처리합니다.")
+            try:
+                AsyncPhotoBackend(self, PLACE_PHOTO_URL, self.async_pages).run(rows)
+            except KeyboardInterrupt:
+                print("\n\n⚠️  사용자에 의해 중단되었습니다.")
+        elif workers > 1:
+            # 멀티 브라우저 모드: 워커마다 독립된 Chrome + iframe 캐시
+            run_parallel(self, rows, workers, worker_options or {})
+        else:
+            self.process_rows(rows)
+                
+        elapsed_time = time.time() - start_time
+        self.print_final_stats(elapsed_time)
+        
+        # 실패가 없어도 써서 --retry-failed 목록을 최신으로 유지 (이번에 처리하지 않은 매장의 이전 줄은 유지)
+        merge_failure_ledger(FAILURE_LEDGER_FILE, self.failed_stores, self.stats['processed_keys'])
+    
+    def process_rows(self, rows):
+        """(행 번호, 행) 목록 처리 - 드라이버 준비/정리 포함"""
         self.setup_driver()
         
+        if self.pipeline:
+            self.start_download_pipeline()
+        
+        # 탭 모드는 다음 매장을 미리 알아야 하므로 목록으로
+        rows = list(rows)
+        
         try:
-            for idx, row in df.iterrows():
-                self.process_single_store(idx, row)
-                
-                progress = (idx + 1) / len(df) * 100
-                print(f"\n📊 진행률: {progress:.1f}% ({idx + 1}/{len(df)})")
+            for count, (idx, row) in enumerate(rows, 1):
+                if self.tabs > 1:
+                    upcoming = rows[count:count + self.tabs - 1]
+                    self.upcoming_urls = [self.store_page_url(next_row) for _, next_row in upcoming]
+                self.driver_health.run(self, idx, row, self.watchdog.run)
                 
-                if (idx + 1) % 5 == 0:
-                    print("   ⏳ 5개 처리마다 3초 대기 중...")
-                    time.sleep(3)
+                progress = (idx + 1) / self.stats['total'] * 100
+                print(f"\n📊 진행률: {progress:.1f}% ({idx + 1}/{self.stats['total']})")
+            
+            # 시간 초과 매장은 본 처리가 끝난 뒤 다시 시도
+            self.watchdog.run_retries(self, self.driver_health)
                     
         except KeyboardInterrupt:
             print("\n\n⚠️  사용자에 의해 중단되었습니다.")
@@ -538,9 +904,10 @@ class NaverMapBulkDownloaderV4:
         finally:
             if self.driver:
                 self.driver.quit()
-                
-        elapsed_time = time.time() - start_time
-        self.print_final_stats(elapsed_time)
+            self.stop_download_pipeline()
+            self.failed_stores.extend(self.background_failures)
+            self.background_failures = []
+            self.checkpoint.close()
     
     def print_final_stats(self, elapsed_time):
         """최종 통계 출력"""
@@ -550,25 +917,109 @@ class NaverMapBulkDownloaderV4:
         print(f"총 처리 대상: {self.stats['total']}개")
         print(f"✅ 성공: {self.stats['success']}개")
         print(f"❌ 실패: {self.stats['failed']}개")
+        for line in format_timeout_summary(self.stats):
+            print(line)
+        for line in format_health_summary(self.stats['driver_health']):
+            print(line)
         print(f"⚠️  링크 없음: {self.stats['no_url']}개")
+        for line in format_failure_summary(self.stats['failure_classes']):
+            print(line)
         print(f"📷 다운로드한 총 사진 수: {self.stats['total_photos']}개")
+        print(f"💾 다운로드 용량: {format_bytes(self.stats['total_bytes'])}")
+        print(self.http_pool.summary())
+        print(self.link_resolver.summary())
+        print(self.frame_locator.summary())
+        for line in self.request_blocker.summary_lines():
+            print(line)
+        if self.stats['direct_hits'] or self.stats['direct_fallbacks']:
+            print(f"⚡ 사진 페이지 직접 이동: 성공 {self.stats['direct_hits']}회 / 기존 방식 전환 {self.stats['direct_fallbacks']}회")
+        for line in format_browser_summary(type(self).__name__, self.stats['browser'], self.headless, self.block_images,
+                                           attach=self.attach):
+            print(line)
+        for line in format_page_load_summary(type(self).__name__, self.page_load, self.stats['first_url'],
+                                             attach=self.attach):
+            print(line)
+        for line in format_compare_summary(self.stats.get('extract_compare')):
+            print(line)
+        for line in format_wait_summary(self.stats['waits']):
+            print(line)
+        for line in format_startup_summary(type(self).__name__, self.stats['startup']):
+            print(line)
+        for line in format_tab_summary(self.tabs, self.stats['tabs']):
+            print(line)
+        for line in format_probe_summary(self.stats['click_probe']):
+            print(line)
+        for line in format_backend_summary(self.backend, self.async_pages):
+            print(line)
+        for line in format_checkpoint_summary(self.stats['checkpoint']):
+            print(line)
+        for line in format_rate_summary(self.rate_limiter.current_rate(), self.stats['rate_limit']):
+            print(line)
         print(f"⏱️  소요 시간: {elapsed_time/60:.1f}분")
         print(f"📁 저장 위치: {os.path.abspath(self.base_folder)}")
         print("="*60 + "\n")
 
 def main():
-    if len(sys.argv) < 2:
-        print("사용법: python naver_map_bulk_downloader_v4.py <엑셀파일경로>")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description="네이버 맵 대량 사진 다운로더 V4")
+    parser.add_argument('excel_path', help='엑셀 파일 경로')
+    add_download_arguments(parser)
+    add_browser_arguments(parser)
+    add_resolver_arguments(parser)
+    add_frame_cache_arguments(parser)
+    add_extract_mode_arguments(parser)
+    add_blocker_arguments(parser, 'photo')
+    add_watchdog_arguments(parser)
+    add_health_arguments(parser)
+    add_attach_arguments(parser)
+    add_tab_arguments(parser)
+    add_backend_arguments(parser)
+    add_checkpoint_arguments(parser)
+    add_retry_arguments(parser)
+    add_rate_arguments(parser)
+    add_worker_arguments(parser)
+    parser.add_argument('--pipeline', action='store_true',
+                        help='브라우저 추출과 사진 다운로드를 겹쳐서 실행')
+    parser.add_argument('--pipeline-workers', type=int, default=2,
+                        help='파이프라인 다운로드 워커 수 (기본: 2)')
+    parser.add_argument('--queue-size', type=int, default=4,
+                        help='다운로드 대기 큐 크기 - 가득 차면 추출 단계가 대기 (기본: 4)')
+    parser.add_argument('--no-direct', action='store_true',
+                        help='사진 페이지 직접 이동을 끄고 항상 지도 화면에서 사진 탭 찾기')
+    args = parser.parse_args()
     
-    excel_path = sys.argv[1]
+    excel_path = args.excel_path
     
     if not os.path.exists(excel_path):
         print(f"❌ 파일을 찾을 수 없습니다: {excel_path}")
         sys.exit(1)
     
-    downloader = NaverMapBulkDownloaderV4(excel_path)
-    downloader.run()
+    if args.retry_failed and not os.path.exists(args.retry_failed):
+        print(f"❌ 실패 목록을 찾을 수 없습니다: {args.retry_failed}")
+        sys.exit(1)
+    
+    options = download_options_from_args(args)
+    options.update(browser_options_from_args(args))
+    options.update(resolver_options_from_args(args))
+    options.update(frame_cache_options_from_args(args))
+    options['direct_photo_page'] = not args.no_direct
+    options['extract_mode'] = args.extract_mode
+    options.update(blocker_options_from_args(args))
+    options.update(watchdog_options_from_args(args))
+    options.update(health_options_from_args(args))
+    options.update(attach_options_from_args(args))
+    options.update(tab_options_from_args(args))
+    options.update(backend_options_from_args(args))
+    options.update(checkpoint_options_from_args(args))
+    options.update(retry_options_from_args(args))
+    options.update(rate_options_from_args(args))
+    options.update({
+        'pipeline': args.pipeline,
+        'pipeline_workers': args.pipeline_workers,
+        'queue_size': args.queue_size
+    })
+    
+    downloader = NaverMapBulkDownloaderV4(excel_path, **options)
+    downloader.run(workers=args.workers, worker_options=options)
 
 if __name__ == "__main__":
     main()
@@ -8,7 +8,6 @@
 import os
 import sys
 import time
-import requests
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -17,6 +16,9 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from urllib.parse import urlparse, parse_qs
 import json
+from dom_harvester import harvest_image_urls
+from download_engine import PhotoDownloadEngine
+from http_session import get_shared_session
 
 class NaverMapPhotoDownloader:
     def __init__(self, url):
@@ -24,6 +26,10 @@ class NaverMapPhotoDownloader:
         self.download_folder = "naver_map_photos"
         self.driver = None
         
+        # 공유 HTTP 세션 풀 + 동시 다운로드 엔진
+        self.http_pool = get_shared_session()
+        self.download_engine = PhotoDownloadEngine(session=self.http_pool, timeout=10)
+        
     def setup_driver(self):
         """Chrome 드라이버 설정"""
         chrome_options = Options()
@@ -92,46 +98,17 @@ class NaverMapPhotoDownloader:
                 last_height = new_height
                 scroll_count += 1
             
-            # 사진 이미지 찾기
-            image_selectors = [
-                "//img[contains(@class, 'place_thumb')]",
-                "//img[contains(@class, 'photo')]",
-                "//div[contains(@class, 'photo')]//img",
-                "//a[contains(@class, 'pic')]//img",
-                "//div[contains(@class, 'flicking-camera')]//img"
-            ]
-            
-            for selector in image_selectors:
-                try:
-                    images = self.driver.find_elements(By.XPATH, selector)
-                    if images:
-                        print(f"선택자 '{selector}'로 {len(images)}개 이미지 발견")
-                        for img in images:
-                            src = img.get_attribute('src')
-                            if src and ('http' in src) and ('sslphinf' in src or 'blogpfthumb' in src or 'phinf' in src):
-                                # 원본 크기로 변환
-                                src = src.replace('?type=w120', '?type=w1200')
-                                src = src.replace('?type=w240', '?type=w1200')
-                                src = src.replace('?type=w360', '?type=w1200')
-                                if src not in photos:
-                                    photos.append(src)
-                except Exception as e:
-                    continue
+            # 사진 이미지 찾기 - img src / data-src / srcset / background-image를 한 번에 수집
+            image_urls = harvest_image_urls(self.driver, domains=['sslphinf', 'blogpfthumb', 'phinf'])
+            print(f"{len(image_urls)}개 이미지 URL 발견")
             
-            # 배경 이미지도 확인
-            try:
-                elements = self.driver.find_elements(By.XPATH, "//*[contains(@style, 'background-image')]")
-                for elem in elements:
-                    style = elem.get_attribute('style')
-                    if 'url(' in style:
-                        url_start = style.find('url(') + 4
-                        url_end = style.find(')', url_start)
-                        img_url = style[url_start:url_end].strip('"\'')
-                        if img_url and 'http' in img_url and img_url not in photos:
-                            img_url = img_url.replace('?type=w120', '?type=w1200')
-                            photos.append(img_url)
-            except:
-                pass
+            for src in image_urls:
+                # 원본 크기로 변환
+                src = src.replace('?type=w120', '?type=w1200')
+                src = src.replace('?type=w240', '?type=w1200')
+                src = src.replace('?type=w360', '?type=w1200')
+                if src not in photos:
+                    photos.append(src)
                 
         except Exception as e:
             print(f"사진 추출 중 오류: {e}")
@@ -150,29 +127,18 @@ class NaverMapPhotoDownloader:
             
         print(f"\n총 {len(photo_urls)}개의 사진을 다운로드합니다...")
         
-        for idx, url in enumerate(photo_urls, 1):
-            try:
-                response = requests.get(url, timeout=10)
-                if response.status_code == 200:
-                    # 파일 확장자 결정
-                    ext = '.jpg'
-                    if 'image/png' in response.headers.get('Content-Type', ''):
-                        ext = '.png'
-                    
-                    filename = f"photo_{idx:03d}{ext}"
-                    filepath = os.path.join(self.download_folder, filename)
-                    
-                    with open(filepath, 'wb') as f:
-                        f.write(response.content)
-                    
-                    print(f"[{idx}/{len(photo_urls)}] 다운로드 완료: {filename}")
-                else:
-                    print(f"[{idx}/{len(photo_urls)}] 다운로드 실패: HTTP {response.status_code}")
-                    
-            except Exception as e:
-                print(f"[{idx}/{len(photo_urls)}] 다운로드 오류: {e}")
+        tasks = [
+            {'url': url, 'folder': self.download_folder, 'name': f"photo_{idx:03d}"}
+            for idx, url in enumerate(photo_urls, 1)
+        ]
+        results = self.download_engine.download(tasks, progress_every=0)
+        
+        for idx, result in enumerate(results, 1):
+            if result['ok']:
+                print(f"[{idx}/{len(photo_urls)}] 다운로드 완료: {os.path.basename(result['filepath'])}")
                 
         print(f"\n다운로드 완료! 저장 위치: {os.path.abspath(self.download_folder)}")
+        print(self.http_pool.summary())
         
     def run(self):
         """전체 프로세스 실행"""
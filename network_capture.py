@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+네트워크 기반 이미지 URL 수집 (Chrome DevTools performance 로그)
+
+DOM 수집(dom_harvester)은 스크롤 후 남아 있는 속성만 보기 때문에
+lazy-load로 src가 바뀐 이미지나 속성 이름이 바뀐 경우를 놓칠 수 있음.
+이 모듈은 페이지가 실제로 받은 이미지 응답(Network.responseReceived)을 모아서 반환:
+- chromedriver performance 로그 활성화 (goog:loggingPrefs)
+- 매장 시작 전에 로그를 비우고(PerformanceLog.reset), 추출 시점까지 받은 이미지 응답만 사용
+- 업체 카테고리 전환 직후 위치를 표시해서(PerformanceLog.mark) 전환 전 그리드 / 다른 카테고리 / 프로필 이미지는 제외
+- 네이버 CDN 도메인 필터 (원본 크기 변환은 호출 측에서)
+
+추출 방식 (--extract-mode):
+- dom: 기존 DOM 수집 (기본)
+- network: 네트워크 로그 수집
+- compare: 둘 다 수집해서 매장별 개수 / 소요 시간 비교 (저장은 DOM 결과 사용)
+
+주의: 이미지를 차단하면(--block-images) 이미지 요청 자체가 없으므로 network/compare에서는 차단을 끔
+"""
+
+import json
+import time
+
+from dom_harvester import CDN_DOMAINS
+
+EXTRACT_MODES = ['dom', 'network', 'compare']
+
+
+def add_extract_mode_arguments(parser):
+    """추출 방식 관련 CLI 옵션 추가"""
+    parser.add_argument('--extract-mode', choices=EXTRACT_MODES, default='dom',
+                        help='사진 URL 추출 방식: dom / network / compare (기본: dom)')
+
+
+def enable_performance_log(chrome_options):
+    """Chrome 옵션에 performance(네트워크) 로그 활성화"""
+    chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    return chrome_options
+
+
+class PerformanceLog:
+    """매장 단위 performance 로그 버퍼
+
+    driver.get_log('performance')는 읽으면 비워지므로,
+    네트워크 수집과 요청 차단 통계가 같은 매장의 로그를 이 버퍼로 나눠 씀
+    """
+
+    def __init__(self):
+        self.messages = []
+        self.mark_index = 0
+
+    def reset(self, driver):
+        """쌓여 있는 로그 비우기 (이전 매장 요청이 섞이지 않도록)"""
+        try:
+            driver.get_log('performance')
+        except Exception:
+            pass
+        self.messages = []
+        self.mark_index = 0
+
+    def mark(self, driver):
+        """지금까지 받은 메시지 위치 표시 - since_mark는 이후 메시지만 반환 (차단 통계용 read는 그대로 전체)"""
+        self.mark_index = len(self.read(driver))
+
+    def since_mark(self, driver):
+        """마지막 mark(없으면 reset) 이후의 DevTools 메시지 목록"""
+        return self.read(driver)[self.mark_index:]
+
+    def read(self, driver):
+        """마지막 reset 이후의 DevTools 메시지 목록 ({'method', 'params'})"""
+        try:
+            entries = driver.get_log('performance')
+        except Exception:
+            entries = []
+        for entry in entries:
+            try:
+                self.messages.append(json.loads(entry['message'])['message'])
+            except (KeyError, ValueError):
+                continue
+        return self.messages
+
+
+def collect_image_urls(messages, domains=None):
+    """받은 이미지 응답 URL 목록 (순서 유지, 중복 제거)"""
+    domains = domains or CDN_DOMAINS
+    urls = []
+    seen = set()
+
+    for message in messages:
+        if message.get('method') != 'Network.responseReceived':
+            continue
+
+        params = message.get('params', {})
+        response = params.get('response', {})
+        if params.get('type') != 'Image' and not response.get('mimeType', '').startswith('image/'):
+            continue
+        if response.get('status') not in (200, 304):
+            continue
+
+        url = response.get('url', '')
+        if url.startswith('http') and any(domain in url for domain in domains) and url not in seen:
+            seen.add(url)
+            urls.append(url)
+
+    return urls
+
+
+def new_compare_stats():
+    """stats['extract_compare']에 들어갈 빈 비교 통계"""
+    return {'stores': 0, 'dom_photos': 0, 'network_photos': 0, 'common': 0,
+            'dom_seconds': 0.0, 'network_seconds': 0.0}
+
+
+def record_comparison(stats, dom_photos, dom_seconds, network_photos, network_seconds):
+    """매장 하나의 DOM / 네트워크 결과 비교를 출력하고 누적"""
+    common = len(set(dom_photos) & set(network_photos))
+    print(f"      🔬 DOM {len(dom_photos)}개 ({dom_seconds:.2f}초) / "
+          f"네트워크 {len(network_photos)}개 ({network_seconds:.2f}초), 공통 {common}개")
+
+    stats['stores'] += 1
+    stats['dom_photos'] += len(dom_photos)
+    stats['network_photos'] += len(network_photos)
+    stats['common'] += common
+    stats['dom_seconds'] += dom_seconds
+    stats['network_seconds'] += network_seconds
+
+
+def format_compare_summary(stats):
+    """최종 통계용 추출 방식 비교 요약"""
+    if not stats or not stats.get('stores'):
+        return []
+    stores = stats['stores']
+    return [
+        f"🔬 추출 방식 비교 ({stores}개 매장):",
+        f"   - DOM: {stats['dom_photos']}개, 매장당 {stats['dom_seconds'] / stores:.2f}초",
+        f"   - 네트워크: {stats['network_photos']}개, 매장당 {stats['network_seconds'] / stores:.2f}초",
+        f"   - 공통: {stats['common']}개 (DOM에만 {stats['dom_photos'] - stats['common']}개, "
+        f"네트워크에만 {stats['network_photos'] - stats['common']}개)"
+    ]
+
+
+def timed(func):
+    """(결과, 소요 초) 반환"""
+    start = time.time()
+    result = func()
+    return result, time.time() - start
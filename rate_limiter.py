@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+페이지 이동 요청 속도 제한 (토큰 버킷, 워커 간 공유) + 응답 상태에 따른 자동 조절
+
+기존에는 매장 N개마다 고정 시간(V4: 5개마다 3초, 가격표 / 캡처: 3개마다 2초)을 쉬어서
+사이트가 빠를 때는 시간을 버리고, 느리거나 차단 화면이 뜰 때는 그대로 계속 요청했음.
+- 페이지 이동(driver.get / 탭 전환 / 검색) 전마다 토큰 하나를 받고, 없으면 생길 때까지 대기
+- 이동 후 로드 시간 / 응답 상태 확인:
+    캡차 · 접근 제한 · 429 → 속도 절반 + 잠시 멈춤
+    5xx · 오류 페이지 · 로드 시간 초과 → 속도 절반
+    로드 시간이 기준(--target-load)보다 느림 → 속도 70%
+    정상 → 속도 조금씩 올림 (--max-rate까지)
+- 멀티 브라우저 모드(--workers)에서는 Manager 프로세스의 공유 상태로 워커 전체가 같은 버킷을 씀
+- 최종 통계에 현재 속도 / 대기 횟수 / 총 대기 시간 / 감속 사유 출력
+
+사용 예:
+    self.rate_limiter = RateLimiter(rate, min_rate, max_rate, target_load, shared=rate_shared,
+                                    stats=self.stats['rate_limit'])
+    self.rate_limiter.navigate(self.driver, url)
+"""
+
+import time
+import threading
+
+from selenium.common.exceptions import TimeoutException
+
+DEFAULT_RATE = 1.0
+DEFAULT_MIN_RATE = 0.05
+DEFAULT_MAX_RATE = 2.0
+DEFAULT_TARGET_LOAD = 5.0
+
+# 쉬었다가 한꺼번에 보낼 수 있는 최대 이동 수
+BURST = 2
+
+# 조절 폭
+SLOW_FACTOR = 0.7
+ERROR_FACTOR = 0.5
+SPEEDUP_STEP = 0.05
+# 캡차 / 접근 제한 화면 뒤 멈춤 시간(초)
+BLOCK_COOLDOWN = 30
+
+# 이 시간 이상 기다릴 때만 로그 출력
+LOG_WAIT_SECONDS = 1.0
+
+PAGE_OK = 'ok'
+PAGE_SLOW = 'slow'
+PAGE_ERROR = 'error'
+PAGE_BLOCKED = 'blocked'
+
+REASON_LABELS = {PAGE_BLOCKED: '캡차/접근 제한', PAGE_ERROR: '오류 페이지', PAGE_SLOW: '느린 응답'}
+
+# 최상위 문서 URL / 본문에서 찾는 차단 · 오류 화면 표시
+PAGE_MARKERS = {
+    'blocked_url': ['captcha'],
+    'blocked_text': ['자동입력 방지문자', '비정상적인 접근', '이용이 일시적으로 제한'],
+    'error_text': ['잠시 후 다시 시도', '일시적인 오류가 발생', '서비스 점검 중']
+}
+
+PAGE_STATE_SCRIPT = """
+var markers = arguments[0];
+var nav = performance.getEntriesByType('navigation')[0];
+var status = nav && nav.responseStatus ? nav.responseStatus : 0;
+var end = nav ? (nav.loadEventEnd || nav.domContentLoadedEventEnd || nav.responseEnd) : 0;
+var href = location.href;
+var text = document.body ? (document.body.innerText || '').slice(0, 3000) : '';
+
+function any(list, value) {
+    for (var i = 0; i < list.length; i++) {
+        if (value.indexOf(list[i]) !== -1) return true;
+    }
+    return false;
+}
+
+var state = 'ok';
+if (status === 429 || any(markers.blocked_url, href) || any(markers.blocked_text, text)) {
+    state = 'blocked';
+} else if (status >= 500 || href.indexOf('chrome-error://') === 0 || any(markers.error_text, text)) {
+    state = 'error';
+}
+return {state: state, status: status, load: end ? end - nav.startTime : null};
+"""
+
+
+def add_rate_arguments(parser):
+    """요청 속도 제한 관련 CLI 옵션 추가"""
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE,
+                        help=f'페이지 이동 속도 시작값(초당 횟수, 워커 전체 합계), 0이면 끔 (기본: {DEFAULT_RATE})')
+    parser.add_argument('--min-rate', type=float, default=DEFAULT_MIN_RATE,
+                        help=f'자동 감속 하한(초당 횟수) (기본: {DEFAULT_MIN_RATE})')
+    parser.add_argument('--max-rate', type=float, default=DEFAULT_MAX_RATE,
+                        help=f'자동 가속 상한(초당 횟수) (기본: {DEFAULT_MAX_RATE})')
+    parser.add_argument('--target-load', type=float, default=DEFAULT_TARGET_LOAD,
+                        help=f'이보다 느리게 로드되면 감속(초) (기본: {DEFAULT_TARGET_LOAD})')
+
+
+# 도구 생성자 옵션 기본값 (rate_options_from_args와 같은 키)
+RATE_DEFAULTS = {
+    'rate': DEFAULT_RATE,
+    'min_rate': DEFAULT_MIN_RATE,
+    'max_rate': DEFAULT_MAX_RATE,
+    'target_load': DEFAULT_TARGET_LOAD,
+    'rate_shared': None  # 워커 모드에서 run_parallel이 채움 (RateLimiter.share)
+}
+
+
+def rate_options_from_args(args):
+    """CLI 인자에서 도구 생성자용 속도 제한 옵션 추출"""
+    return {
+        'rate': args.rate,
+        'min_rate': args.min_rate,
+        'max_rate': args.max_rate,
+        'target_load': args.target_load
+    }
+
+
+def new_rate_stats():
+    """stats['rate_limit']에 들어갈 빈 통계"""
+    return {'navigations': 0, 'load_seconds': 0.0, 'waits': 0, 'throttle_seconds': 0.0,
+            'speedups': 0, 'backoffs': {}}
+
+
+def page_state(result, elapsed):
+    """PAGE_STATE_SCRIPT 결과 → (로드 시간(초), 상태)"""
+    if not result:
+        return elapsed, PAGE_OK
+    seconds = max(elapsed, (result.get('load') or 0) / 1000)
+    return seconds, result.get('state') or PAGE_OK
+
+
+def page_health(driver, elapsed):
+    """현재 페이지의 로드 시간 / 차단 · 오류 화면 여부 (스크립트 실패 시 경과 시간만)"""
+    try:
+        result = driver.execute_script(PAGE_STATE_SCRIPT, PAGE_MARKERS)
+    except Exception:
+        result = None
+    return page_state(result, elapsed)
+
+
+class RateLimiter:
+    def __init__(self, rate=DEFAULT_RATE, min_rate=DEFAULT_MIN_RATE, max_rate=DEFAULT_MAX_RATE,
+                 target_load=DEFAULT_TARGET_LOAD, shared=None, stats=None):
+        self.enabled = bool(rate and rate > 0)
+        self.min_rate = max(0.001, min_rate or DEFAULT_MIN_RATE)
+        self.max_rate = max(self.min_rate, max_rate or DEFAULT_MAX_RATE)
+        self.target_load = target_load
+        self.initial_rate = min(max(rate or 0, self.min_rate), self.max_rate)
+
+        self.stats = stats if stats is not None else new_rate_stats()
+
+        # 버킷 상태 (워커 모드에서는 Manager 프록시 - share()로 만든 (상태, 잠금)을 받음)
+        if shared is not None:
+            self.state, self.lock = shared
+        else:
+            self.state = {'rate': self.initial_rate, 'tokens': float(BURST), 'updated': time.time()}
+            self.lock = threading.Lock()
+
+    def share(self, manager):
+        """워커 프로세스와 공유할 (상태, 잠금) 프록시 생성 - 생성자 rate_shared 옵션으로 전달"""
+        self.state = manager.dict(self.state)
+        self.lock = manager.Lock()
+        return self.state, self.lock
+
+    def unshare(self):
+        """Manager 종료 전에 공유 상태를 로컬로 복사 (최종 통계용) - Manager가 먼저 끝났으면(Ctrl+C) 시작 속도로"""
+        try:
+            self.state = dict(self.state)
+        except (OSError, EOFError):
+            self.state = {'rate': self.initial_rate, 'tokens': float(BURST), 'updated': time.time()}
+        self.lock = threading.Lock()
+
+    def current_rate(self):
+        """현재 속도(초당 횟수) - 꺼져 있으면 None"""
+        return self.state['rate'] if self.enabled else None
+
+    def _refill(self, now):
+        """경과 시간만큼 토큰 채우기 (잠금 안에서 호출)"""
+        tokens = self.state['tokens'] + (now - self.state['updated']) * self.state['rate']
+        self.state['tokens'] = min(float(BURST), tokens)
+        self.state['updated'] = now
+
+    def reserve(self):
+        """토큰 하나 예약 → 기다려야 할 시간(초) (대기열 순서대로 토큰이 음수가 될 수 있음)"""
+        if not self.enabled:
+            return 0
+        with self.lock:
+            now = time.time()
+            self._refill(now)
+            wait = max(0.0, (1 - self.state['tokens']) / self.state['rate'])
+            self.state['tokens'] -= 1
+        if wait > 0:
+            self.stats['waits'] += 1
+            self.stats['throttle_seconds'] += wait
+        return wait
+
+    def acquire(self):
+        """토큰을 받을 때까지 대기"""
+        wait = self.reserve()
+        if wait >= LOG_WAIT_SECONDS:
+            print(f"   🚦 요청 속도 조절: {wait:.1f}초 대기 (현재 {self.state['rate']:.2f}회/초)")
+        if wait > 0:
+            time.sleep(wait)
+
+    def try_acquire(self):
+        """기다리지 않고 토큰 하나 받기 - 지금 토큰이 없으면 False (탭 미리 로드처럼 미뤄도 되는 이동용)"""
+        if not self.enabled:
+            return True
+        with self.lock:
+            self._refill(time.time())
+            if self.state['tokens'] < 1:
+                return False
+            self.state['tokens'] -= 1
+        return True
+
+    def observe(self, seconds, state=PAGE_OK):
+        """페이지 이동 결과로 속도 조절"""
+        if not self.enabled:
+            return
+        if state == PAGE_OK and self.target_load and seconds > self.target_load:
+            state = PAGE_SLOW
+
+        with self.lock:
+            self._refill(time.time())
+            rate = self.state['rate']
+            if state in (PAGE_BLOCKED, PAGE_ERROR):
+                new_rate = rate * ERROR_FACTOR
+            elif state == PAGE_SLOW:
+                new_rate = rate * SLOW_FACTOR
+            else:
+                new_rate = rate + SPEEDUP_STEP
+            new_rate = min(max(new_rate, self.min_rate), self.max_rate)
+            self.state['rate'] = new_rate
+            if state == PAGE_BLOCKED:
+                # 다음 이동이 BLOCK_COOLDOWN초 뒤에 나가도록 토큰을 빚으로
+                self.state['tokens'] = min(self.state['tokens'], 1 - new_rate * BLOCK_COOLDOWN)
+
+        self.stats['navigations'] += 1
+        self.stats['load_seconds'] += seconds
+        if state == PAGE_OK:
+            if new_rate > rate:
+                self.stats['speedups'] += 1
+        else:
+            backoffs = self.stats['backoffs']
+            backoffs[state] = backoffs.get(state, 0) + 1
+            print(f"   🚦 {REASON_LABELS[state]} ({seconds:.1f}초) - 속도 낮춤 {rate:.2f} → {new_rate:.2f}회/초")
+
+    def navigate(self, driver, url, opener=None, charged=False):
+        """토큰을 받은 뒤 페이지 이동(opener, 기본 driver.get) → 로드 시간 / 응답 상태로 속도 조절
+
+        charged: 이미 토큰을 받은 이동 (미리 로드한 탭으로 전환) - 대기 없이 로드 결과만 반영
+        """
+        opener = opener or driver.get
+        if not self.enabled:
+            return opener(url)
+
+        if not charged:
+            self.acquire()
+        started = time.time()
+        try:
+            result = opener(url)
+        except TimeoutException:
+            self.observe(time.time() - started, PAGE_ERROR)
+            raise
+        self.observe(*page_health(driver, time.time() - started))
+        return result
+
+
+def format_rate_summary(rate, stats):
+    """최종 통계용 요청 속도 요약 (rate는 현재 속도, 꺼져 있으면 None)"""
+    if rate is None or not stats:
+        return []
+    line = f"🚦 요청 속도: 현재 {rate:.2f}회/초, 대기 {stats['waits']}회 (총 {stats['throttle_seconds']:.1f}초)"
+    if stats['navigations']:
+        line += f", 평균 로드 {stats['load_seconds'] / stats['navigations']:.1f}초"
+    lines = [line]
+    if stats['backoffs'] or stats['speedups']:
+        detail = ', '.join(f"{REASON_LABELS.get(name, name)} {count}회" for name, count in stats['backoffs'].items())
+        lines.append(f"   - 가속 {stats['speedups']}회" + (f" / 감속: {detail}" if detail else ""))
+    return lines
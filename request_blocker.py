@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+추출에 필요 없는 요청 차단 (DevTools Network.setBlockedURLs)
+
+지도 화면을 여는 동안 Chrome은 지도 타일, 웹폰트, 통계 비콘, 광고 스크립트를 받지만
+사진 / 가격표 추출에는 하나도 쓰이지 않음. 이 모듈은:
+- 도구별 프리셋(photo / price / capture)의 URL 패턴을 setup_driver에서 만든 드라이버에 적용
+- --block-pattern으로 패턴 추가, --no-block으로 차단 끄기
+- 매장마다 performance 로그에서 차단된 요청 수를 분류별로 집계 → 로그 출력
+- 절감 바이트: 차단 끈 실행(--no-block)에서 같은 패턴 요청의 평균 크기를 기록해 두고
+  차단 실행에서 차단 수 × 평균 크기로 추정 (기록이 없으면 요청 수만 표시)
+
+패턴 형식은 DevTools와 같음 ('*' 와일드카드)
+"""
+
+import os
+import json
+from fnmatch import fnmatchcase
+
+from download_engine import format_bytes
+
+# 분류별 URL 패턴
+BLOCK_CATEGORIES = {
+    '지도 타일': ['*map.pstatic.net/nrb/*', '*nrbe.map.naver.net/*', '*map.pstatic.net/*/tile*'],
+    '웹폰트': ['*.woff', '*.woff?*', '*.woff2', '*.woff2?*', '*.ttf', '*.ttf?*', '*.otf'],
+    '통계': ['*wcs.naver.net/*', '*lcs.naver.com/*', '*nelo2-col.navercorp.com/*', '*ntm.pstatic.net/*',
+             '*google-analytics.com/*', '*googletagmanager.com/*'],
+    '광고': ['*adcr.naver.com/*', '*veta.naver.com/*', '*tivan.naver.com/*', '*ssl.pstatic.net/tveta/*',
+             '*doubleclick.net/*'],
+}
+
+# 도구별 프리셋 - 캡처는 화면이 그대로 보여야 하므로 타일 / 폰트는 차단하지 않음
+BLOCK_PRESETS = {
+    'photo': ['지도 타일', '웹폰트', '통계', '광고'],
+    'price': ['지도 타일', '웹폰트', '통계', '광고'],
+    'capture': ['통계', '광고'],
+}
+
+# 차단 끈 실행에서 측정한 분류별 평균 크기 저장 파일 (프리셋별, 스크립트 폴더)
+SIZE_BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'blocklist_sizes.json')
+
+
+def add_blocker_arguments(parser, default_preset):
+    """요청 차단 관련 CLI 옵션 추가"""
+    parser.add_argument('--block-preset', choices=sorted(BLOCK_PRESETS), default=default_preset,
+                        help=f'차단 프리셋 (기본: {default_preset})')
+    parser.add_argument('--block-pattern', action='append', default=[],
+                        help='추가로 차단할 URL 패턴 (* 와일드카드, 여러 번 사용 가능)')
+    parser.add_argument('--no-block', action='store_true',
+                        help='요청 차단 끄기 (절감량 추정용 평균 크기 측정)')
+
+
+# 도구 생성자 옵션 기본값 (blocker_options_from_args와 같은 키)
+BLOCKER_DEFAULTS = {'block_preset': 'photo', 'block_patterns': None, 'block_requests': True}
+
+
+def blocker_options_from_args(args):
+    """CLI 인자에서 도구 생성자용 차단 옵션 추출"""
+    return {
+        'block_preset': args.block_preset,
+        'block_patterns': list(args.block_pattern),
+        'block_requests': not args.no_block
+    }
+
+
+def new_block_stats():
+    """stats['blocked']에 들어갈 빈 통계 (measured: 차단 끈 실행에서 측정한 분류별 크기)"""
+    return {'requests': 0, 'bytes': 0, 'categories': {}, 'measured': {}}
+
+
+class RequestBlocker:
+    def __init__(self, preset, extra_patterns=None, enabled=True, stats=None, baseline_path=SIZE_BASELINE_FILE):
+        self.preset = preset
+        self.enabled = enabled
+        self.baseline_path = baseline_path
+
+        # 분류 -> 패턴 목록
+        self.categories = {name: list(BLOCK_CATEGORIES[name]) for name in BLOCK_PRESETS[preset]}
+        if extra_patterns:
+            self.categories['사용자 지정'] = list(extra_patterns)
+
+        self.stats = stats if stats is not None else new_block_stats()
+        self.size_baseline = self._load_size_baseline()
+
+    @property
+    def patterns(self):
+        return [pattern for patterns in self.categories.values() for pattern in patterns]
+
+    def apply(self, driver):
+        """드라이버에 차단 패턴 적용 (드라이버 재시작 시 다시 호출)"""
+        if not self.enabled:
+            return
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.patterns})
+            print(f"🚫 요청 차단 적용: {self.preset} 프리셋 ({len(self.patterns)}개 패턴)")
+        except Exception as e:
+            print(f"⚠️  요청 차단 적용 실패 (차단 없이 진행): {e}")
+            self.enabled = False
+
+    def category_of(self, url):
+        """URL이 속한 차단 분류 (없으면 None)"""
+        for name, patterns in self.categories.items():
+            if any(fnmatchcase(url, pattern) for pattern in patterns):
+                return name
+        return None
+
+    def record_store(self, messages):
+        """매장 하나의 performance 로그에서 차단 수 집계 → 한 줄 로그"""
+        urls = {}
+        blocked = {}
+        sizes = {}
+
+        for message in messages:
+            method = message.get('method')
+            params = message.get('params', {})
+            if method == 'Network.requestWillBeSent':
+                urls[params.get('requestId')] = params.get('request', {}).get('url', '')
+            elif method == 'Network.loadingFailed' and params.get('blockedReason'):
+                category = self.category_of(urls.get(params.get('requestId'), ''))
+                if category:
+                    blocked[category] = blocked.get(category, 0) + 1
+            elif method == 'Network.loadingFinished' and not self.enabled:
+                category = self.category_of(urls.get(params.get('requestId'), ''))
+                if category:
+                    entry = sizes.setdefault(category, {'requests': 0, 'bytes': 0})
+                    entry['requests'] += 1
+                    entry['bytes'] += int(params.get('encodedDataLength') or 0)
+
+        if not self.enabled:
+            # 차단 끈 실행: 나중에 절감량 추정에 쓸 평균 크기 누적
+            for category, entry in sizes.items():
+                total = self.stats['measured'].setdefault(category, {'requests': 0, 'bytes': 0})
+                total['requests'] += entry['requests']
+                total['bytes'] += entry['bytes']
+            return
+
+        count = sum(blocked.values())
+        avoided = 0
+        for category, n in blocked.items():
+            entry = self.stats['categories'].setdefault(category, {'requests': 0, 'bytes': 0})
+            entry['requests'] += n
+            baseline = self.size_baseline.get(category)
+            if baseline and baseline.get('requests'):
+                estimated = int(n * baseline['bytes'] / baseline['requests'])
+                entry['bytes'] += estimated
+                avoided += estimated
+
+        self.stats['requests'] += count
+        self.stats['bytes'] += avoided
+
+        if count:
+            detail = ', '.join(f"{name} {n}" for name, n in sorted(blocked.items(), key=lambda item: -item[1]))
+            line = f"   🚫 차단 요청 {count}개 ({detail})"
+            if avoided:
+                line += f" - 약 {format_bytes(avoided)} 절감"
+            print(line)
+
+    def _load_size_baseline(self):
+        try:
+            with open(self.baseline_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get(self.preset, {})
+        except (OSError, ValueError):
+            return {}
+
+    def save_measurements(self):
+        """차단 끈 실행의 분류별 크기를 저장 (다음 차단 실행의 절감량 추정용)"""
+        if self.enabled or not self.stats['measured']:
+            return
+        data = {}
+        if os.path.exists(self.baseline_path):
+            try:
+                with open(self.baseline_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                data = {}
+        data[self.preset] = self.stats['measured']
+        try:
+            with open(self.baseline_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+        except OSError:
+            pass
+
+    def summary_lines(self):
+        """최종 통계용 차단 요약"""
+        if not self.enabled:
+            self.save_measurements()
+            if self.stats['measured']:
+                return [f"🚫 요청 차단: 꺼짐 (분류별 평균 크기 측정 → {self.baseline_path})"]
+            return ["🚫 요청 차단: 꺼짐"]
+
+        lines = [f"🚫 요청 차단 ({self.preset}): {self.stats['requests']}개"]
+        if self.stats['bytes']:
+            lines[0] += f", 약 {format_bytes(self.stats['bytes'])} 절감"
+        elif self.stats['requests']:
+            lines[0] += " (절감 용량은 --no-block으로 한 번 실행하면 추정됩니다)"
+        for name, entry in sorted(self.stats['categories'].items(), key=lambda item: -item[1]['requests']):
+            line = f"   - {name}: {entry['requests']}개"
+            if entry['bytes']:
+                line += f" (약 {format_bytes(entry['bytes'])})"
+            lines.append(line)
+        return lines
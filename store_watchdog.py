@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+매장별 제한 시간 감시 (watchdog) + 시간 초과 매장 재시도
+
+implicitly_wait(10)과 여러 선택자 시도가 겹치면 레이아웃이 다른 매장 하나에서
+몇 분씩 쓰거나, chromedriver 호출이 멈추면 전체 실행이 영원히 멈출 수 있음.
+- 매장마다 타이머 시작 → 제한 시간을 넘기면 chromedriver(+Chrome)를 강제 종료해서 멈춘 호출을 풀어냄
+- 드라이버 재시작 후 다음 매장 계속 진행
+- 시간 초과 매장은 재시도 대기열에 넣었다가 본 처리가 끝난 뒤 다시 시도
+- 재시도에서도 초과하면 '시간 초과'로 집계 (실패와 별도)
+
+도구 규약: driver, setup_driver(), process_single_store(idx, row), stats 딕셔너리
+"""
+
+import os
+import signal
+import subprocess
+import threading
+
+DEFAULT_STORE_TIMEOUT = 180
+DEFAULT_TIMEOUT_RETRIES = 1
+
+# 시간 초과 시 되돌릴 매장 결과 카운터 (타이밍 / 바이트 통계는 유지)
+OUTCOME_KEYS = ['success', 'failed', 'no_url', 'no_folder', 'no_price']
+
+
+def add_watchdog_arguments(parser):
+    """매장 제한 시간 관련 CLI 옵션 추가"""
+    parser.add_argument('--store-timeout', type=int, default=DEFAULT_STORE_TIMEOUT,
+                        help=f'매장 하나의 제한 시간(초), 0이면 끔 (기본: {DEFAULT_STORE_TIMEOUT})')
+    parser.add_argument('--timeout-retries', type=int, default=DEFAULT_TIMEOUT_RETRIES,
+                        help=f'시간 초과 매장 재시도 횟수 (기본: {DEFAULT_TIMEOUT_RETRIES})')
+
+
+# 도구 생성자 옵션 기본값 (watchdog_options_from_args와 같은 키)
+WATCHDOG_DEFAULTS = {'store_timeout': DEFAULT_STORE_TIMEOUT, 'timeout_retries': DEFAULT_TIMEOUT_RETRIES}
+
+
+def watchdog_options_from_args(args):
+    """CLI 인자에서 도구 생성자용 제한 시간 옵션 추출"""
+    return {
+        'store_timeout': args.store_timeout,
+        'timeout_retries': args.timeout_retries
+    }
+
+
+def child_pids(pid):
+    """pid의 하위 프로세스 목록 (chromedriver → Chrome → 렌더러)"""
+    children = []
+    if os.path.isdir('/proc'):
+        parents = {}
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f'/proc/{entry}/stat', 'r') as f:
+                    # "pid (comm) state ppid ..." - comm에 공백이 있을 수 있으므로 마지막 ')' 뒤에서 자름
+                    fields = f.read().rsplit(')', 1)[1].split()
+                parents.setdefault(int(fields[1]), []).append(int(entry))
+            except (OSError, IndexError, ValueError):
+                continue
+        stack = [pid]
+        while stack:
+            for child in parents.get(stack.pop(), []):
+                children.append(child)
+                stack.append(child)
+    else:
+        try:
+            output = subprocess.run(['pgrep', '-P', str(pid)], capture_output=True, text=True).stdout
+            for child in (int(line) for line in output.split()):
+                children.append(child)
+                children.extend(child_pids(child))
+        except (OSError, ValueError):
+            pass
+    return children
+
+
+def kill_driver(driver):
+    """chromedriver와 하위 Chrome 프로세스 강제 종료 (멈춘 드라이버 호출을 예외로 풀어냄)"""
+    process = getattr(getattr(driver, 'service', None), 'process', None)
+    if not process:
+        return
+    try:
+        if os.name == 'nt':
+            subprocess.run(['taskkill', '/F', '/T', '/PID', str(process.pid)], capture_output=True)
+        else:
+            for child in reversed(child_pids(process.pid)):
+                try:
+                    os.kill(child, signal.SIGKILL)
+                except OSError:
+                    pass
+            process.kill()
+    except Exception as e:
+        print(f"   ⚠️  드라이버 강제 종료 실패: {e}")
+
+
+def snapshot_outcome(tool):
+    """매장 처리 전 결과 카운터 / 실패 목록 길이 (처리 결과를 되돌릴 때 사용)"""
+    lock = getattr(tool, 'stats_lock', None) or threading.Lock()
+    with lock:
+        counters = {key: tool.stats[key] for key in OUTCOME_KEYS if key in tool.stats}
+        background = dict(getattr(tool, 'background_outcomes', {}))
+    return counters, background, len(getattr(tool, 'failed_stores', []))
+
+
+def restore_outcome(tool, snapshot):
+    """snapshot_outcome 시점으로 결과 카운터 / 실패 목록 되돌리기 (재시도 결과로 다시 집계)
+
+    그 사이 백그라운드 스레드(V4 파이프라인 다운로드)가 집계한 결과(tool.background_outcomes)는 유지
+    """
+    counters, background, failed_before = snapshot
+    counters = dict(counters)
+    lock = getattr(tool, 'stats_lock', None) or threading.Lock()
+    with lock:
+        for key, value in getattr(tool, 'background_outcomes', {}).items():
+            if key in counters:
+                counters[key] += value - background.get(key, 0)
+        tool.stats.update(counters)
+    if hasattr(tool, 'failed_stores'):
+        del tool.failed_stores[failed_before:]
+
+
+def store_label(row):
+    """로그 / 통계용 매장 이름"""
+    return f"{row.get('지역', 'unknown')} > {row.get('지역상세', 'unknown')} > {row.get('매장명', 'unknown')}"
+
+
+class StoreWatchdog:
+    def __init__(self, timeout=DEFAULT_STORE_TIMEOUT, retries=DEFAULT_TIMEOUT_RETRIES):
+        self.timeout = max(0, timeout or 0)
+        self.retries = max(0, retries)
+        self.fired = False
+        self.retry_queue = []
+
+    def _expire(self, driver):
+        self.fired = True
+        print(f"\n   ⏰ 매장 제한 시간 {self.timeout}초 초과 - 드라이버 강제 종료")
+        kill_driver(driver)
+
+    def run(self, tool, idx, row):
+        """제한 시간 안에서 매장 처리 - 초과하면 결과를 되돌리고 드라이버 재시작 후 재시도 대기열에 추가"""
+        if not self.timeout:
+            tool.process_single_store(idx, row)
+            return True
+
+        snapshot = snapshot_outcome(tool)
+
+        self.fired = False
+        timer = threading.Timer(self.timeout, self._expire, args=(tool.driver,))
+        timer.daemon = True
+        timer.start()
+        try:
+            tool.process_single_store(idx, row)
+        except Exception:
+            # 강제 종료로 process_single_store 밖까지 올라온 드라이버 오류
+            if not self.fired:
+                raise
+        finally:
+            timer.cancel()
+
+        if not self.fired:
+            return True
+
+        # 시간 초과 매장의 성공 / 실패 집계 되돌리기 (재시도 결과로 다시 집계)
+        restore_outcome(tool, snapshot)
+
+        self.recover(tool)
+        self.retry_queue.append((idx, row))
+        return False
+
+    def recover(self, tool):
+        """강제 종료된 드라이버 정리 후 새 드라이버 시작"""
+        print("   🔄 드라이버 재시작 중...")
+        try:
+            tool.driver.quit()
+        except Exception:
+            pass
+        tool.driver = None
+        tool.setup_driver()
+
+    def run_retries(self, tool, health=None):
+        """본 처리 후 시간 초과 매장 재시도 - 끝까지 초과한 매장은 stats['timed_out']에 기록
+
+        health(DriverHealth)를 주면 본 처리와 같이 health.run으로 감싸서 크래시 재시도 / 재시작 기준도 적용
+        """
+        for attempt in range(1, self.retries + 1):
+            if not self.retry_queue:
+                break
+            queue, self.retry_queue = self.retry_queue, []
+            print(f"\n🔁 시간 초과 매장 재시도 ({attempt}/{self.retries}): {len(queue)}개")
+            for idx, row in queue:
+                if health:
+                    health.run(tool, idx, row, self.run)
+                else:
+                    self.run(tool, idx, row)
+
+        for idx, row in self.retry_queue:
+            tool.stats['timed_out'] += 1
+            tool.stats['timed_out_stores'].append(store_label(row))
+        self.retry_queue = []
+
+
+def format_timeout_summary(stats):
+    """최종 통계용 시간 초과 매장 목록"""
+    if not stats.get('timed_out'):
+        return []
+    lines = [f"⏰ 시간 초과: {stats['timed_out']}개"]
+    for name in stats.get('timed_out_stores', []):
+        lines.append(f"   - {name}")
+    return lines
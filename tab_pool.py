@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Chrome 하나 안에서 탭 여러 개로 매장 페이지 미리 로드
+
+멀티 브라우저 모드(--workers N)는 Chrome 프로세스가 N개라 메모리가 작은 PC에서는 부담됨.
+이 모듈은 드라이버 하나로 탭(window handle) N개를 돌려 쓰면서:
+- 현재 탭에서 사진을 추출하는 동안 다음 매장 페이지를 다른 탭에서 미리 로드
+  (window.location.assign은 기다리지 않고 바로 반환 → 로드는 브라우저가 알아서 진행)
+- 다음 매장 차례가 되면 미리 로드해 둔 탭으로 전환 (driver.get 대기 생략)
+- 탭은 순서대로 돌려 씀 - 다 쓴 탭은 다음 미리 로드에 재사용
+- 탭을 전환할 때마다 최상위 문서로 돌아가므로 이전 매장의 iframe 전환 상태가 남지 않음
+
+주의:
+- 요청 차단(Network.setBlockedURLs)은 탭마다 적용해야 하므로 setup_tab 콜백으로 새 탭마다 적용
+- 미리 로드도 실제 페이지 요청이므로 limiter(RateLimiter)가 있으면 미리 로드마다 토큰을 받음
+  (토큰이 없으면 기다리지 않고 미리 로드를 미룸 → --tabs N이 요청 속도를 N배로 늘리지 않음)
+- performance 로그가 탭끼리 섞이므로 네트워크 추출(--extract-mode network/compare)과는 같이 쓰지 않음
+"""
+
+DEFAULT_TABS = 1
+
+
+def add_tab_arguments(parser):
+    """탭 동시 처리 관련 CLI 옵션 추가"""
+    parser.add_argument('--tabs', type=int, default=DEFAULT_TABS,
+                        help=f'Chrome 하나에서 돌려 쓸 탭 수 - 2 이상이면 다음 매장을 미리 로드 (기본: {DEFAULT_TABS})')
+
+
+# 도구 생성자 옵션 기본값 (tab_options_from_args와 같은 키)
+TAB_DEFAULTS = {'tabs': DEFAULT_TABS}
+
+
+def tab_options_from_args(args):
+    """CLI 인자에서 도구 생성자용 탭 옵션 추출"""
+    return {'tabs': args.tabs}
+
+
+def new_tab_stats():
+    """stats['tabs']에 들어갈 빈 통계"""
+    return {'preloaded': 0, 'used': 0, 'ready_on_switch': 0, 'deferred': 0}
+
+
+class TabPool:
+    def __init__(self, driver, size, stats=None, setup_tab=None, limiter=None):
+        self.driver = driver
+        self.limiter = limiter
+        self.stats = stats if stats is not None else new_tab_stats()
+
+        self.handles = [driver.current_window_handle]
+        for _ in range(max(1, size) - 1):
+            driver.switch_to.new_window('tab')
+            handle = driver.current_window_handle
+            self.handles.append(handle)
+            # 상주 브라우저에 연결한 드라이버는 자기가 연 탭만 닫음
+            if hasattr(driver, 'own_handles'):
+                driver.own_handles.append(handle)
+            if setup_tab:
+                setup_tab(driver)
+
+        self.current = self.handles[0]
+        driver.switch_to.window(self.current)
+
+        # 미리 로드 중인 URL -> 탭
+        self.loading = {}
+
+    def preload(self, urls):
+        """남는 탭에서 URL 미리 로드 (이미 로드 중인 URL은 건너뜀, 순서대로)"""
+        # 처리 순서에서 빠진 URL(건너뛴 매장 등)이 잡고 있던 탭은 회수
+        self.loading = {url: handle for url, handle in self.loading.items() if url in urls}
+
+        free = [handle for handle in self.handles
+                if handle != self.current and handle not in self.loading.values()]
+        for url in urls:
+            if not free:
+                break
+            if not url or url in self.loading:
+                continue
+            # 요청 속도 제한 - 토큰이 없으면 남은 미리 로드는 다음 전환 때로 미룸
+            if self.limiter and not self.limiter.try_acquire():
+                self.stats['deferred'] += 1
+                break
+            handle = free.pop(0)
+            try:
+                self.driver.switch_to.window(handle)
+                self.driver.execute_script("window.location.assign(arguments[0]);", url)
+                self.loading[url] = handle
+                self.stats['preloaded'] += 1
+            except Exception:
+                continue
+
+    def is_preloaded(self, url):
+        """url을 미리 로드 중인 탭이 있는지 (전환은 새 요청이 아니므로 토큰 불필요)"""
+        return url in self.loading
+
+    def open(self, url, upcoming=()):
+        """매장 페이지 열기 - 미리 로드한 탭이 있으면 전환, 없으면 현재 탭에서 driver.get
+
+        전환 / 로드 전에 다음 매장들을 남는 탭에서 미리 로드 시작
+        """
+        handle = self.loading.pop(url, None)
+        if handle:
+            self.current = handle
+        self.preload([next_url for next_url in upcoming if next_url != url])
+
+        # 탭 전환 + 최상위 문서로 (이전 매장의 iframe 상태 초기화)
+        self.driver.switch_to.window(self.current)
+        self.driver.switch_to.default_content()
+
+        if not handle:
+            self.driver.get(url)
+            return False
+
+        self.stats['used'] += 1
+        try:
+            if self.driver.execute_script("return document.readyState;") == 'complete':
+                self.stats['ready_on_switch'] += 1
+        except Exception:
+            pass
+        return True
+
+
+def format_tab_summary(tabs, stats):
+    """최종 통계용 탭 미리 로드 요약"""
+    if tabs <= 1 or not stats:
+        return []
+    lines = [f"🗂️  탭 {tabs}개: 미리 로드 {stats['preloaded']}개, 미리 로드한 탭 사용 {stats['used']}개 "
+             f"(전환 시 이미 로드 완료 {stats['ready_on_switch']}개)"]
+    if stats.get('deferred'):
+        lines.append(f"   - 요청 속도 제한으로 미리 로드 미룸 {stats['deferred']}회")
+    return lines
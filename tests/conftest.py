@@ -0,0 +1,140 @@
+"""
+테스트 공통 설정
+
+도구 모듈은 저장소 최상위에 있으므로 테스트에서 바로 import할 수 있게 경로 추가.
+HTTP 요청은 FakeSession(공유 세션 풀과 같은 get 인터페이스)으로 대신함.
+"""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, body=b'', content_type='image/jpeg', fail_after=None):
+        self.status_code = status_code
+        self.headers = {'Content-Type': content_type}
+        self.body = body
+        # 청크 몇 개를 보낸 뒤 연결이 끊기는 응답
+        self.fail_after = fail_after
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def iter_content(self, chunk_size=1):
+        for sent, start in enumerate(range(0, len(self.body), chunk_size)):
+            if self.fail_after is not None and sent >= self.fail_after:
+                raise ConnectionError('connection reset')
+            yield self.body[start:start + chunk_size]
+
+
+class FakeSession:
+    """URL별 응답을 돌려주고 호스트별 동시 요청 수 최댓값을 기록"""
+
+    def __init__(self, responses=None, delay=0.0):
+        self.responses = responses or {}
+        self.delay = delay
+        self.active = {}
+        self.peak = {}
+        self.lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        host = url.split('/')[2]
+        with self.lock:
+            self.active[host] = self.active.get(host, 0) + 1
+            self.peak[host] = max(self.peak.get(host, 0), self.active[host])
+        try:
+            time.sleep(self.delay)
+            return self.responses.get(url) or FakeResponse(body=url.encode())
+        finally:
+            with self.lock:
+                self.active[host] -= 1
+
+
+@pytest.fixture
+def fake_session():
+    return FakeSession
+
+
+class FakeFrame:
+    """가짜 문서 하나 (최상위 문서 또는 iframe)"""
+
+    def __init__(self, key='main', text='', photo_tab=False):
+        self.key = key
+        self.text = text
+        self.photo_tab = photo_tab
+
+
+class _SwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def frame(self, frame):
+        self.driver.current = frame
+
+    def default_content(self):
+        self.driver.current = self.driver.main
+
+
+class FakeDriver:
+    """Selenium 드라이버 대역 - 도구가 쓰는 스크립트만 흉내 냄 (실행한 스크립트는 calls에 기록)"""
+
+    def __init__(self, main=None, frames=()):
+        from click_probe import PROBE_SCRIPT, PHOTO_TAB_STRATEGIES
+        from frame_locator import FRAME_KEYS_SCRIPT
+
+        self.probe_script = PROBE_SCRIPT
+        self.photo_tab_strategies = PHOTO_TAB_STRATEGIES
+        self.frame_keys_script = FRAME_KEYS_SCRIPT
+        self.main = main or FakeFrame()
+        self.frames = list(frames)
+        self.current = self.main
+        self.switch_to = _SwitchTo(self)
+        self.calls = []
+        self.current_url = 'about:blank'
+
+    def get(self, url):
+        self.current_url = url
+        self.current = self.main
+
+    def get_log(self, kind):
+        return []
+
+    def execute_script(self, script, *args):
+        self.calls.append((self.current.key, script))
+        if script == self.probe_script:
+            if args[0] == self.photo_tab_strategies and self.current.photo_tab:
+                return {'strategy': '텍스트 일치', 'tag': 'a', 'text': '사진'}
+            return None
+        if script == self.frame_keys_script:
+            return [frame.key for frame in self.frames]
+        if 'querySelectorAll(\'iframe\'))' in script:
+            return list(self.frames)
+        if 'querySelectorAll(\'iframe\')[arguments[0]]' in script:
+            return self.frames[args[0]]
+        if 'innerText.indexOf' in script:
+            return args[0] in self.current.text
+        return None
+
+    def probes(self):
+        """사진 탭 클릭 스크립트를 실행한 문서 키 목록"""
+        return [key for key, script in self.calls if script == self.probe_script]
+
+
+@pytest.fixture
+def tool(tmp_path):
+    """캐시 / 체크포인트 / 저장 폴더를 임시 폴더에 둔 V4 도구 (드라이버 없음)"""
+    from naver_map_bulk_downloader_v4 import NaverMapBulkDownloaderV4
+    return NaverMapBulkDownloaderV4('stores.xlsx',
+                                    base_folder=str(tmp_path / 'downloads'),
+                                    link_cache=str(tmp_path / 'links.json'),
+                                    frame_cache=str(tmp_path / 'frames.json'),
+                                    checkpoint=str(tmp_path / 'checkpoint.db'))
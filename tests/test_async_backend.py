@@ -0,0 +1,93 @@
+import asyncio
+import time
+
+from async_backend import AsyncPhotoBackend
+from failure_classes import NAVIGATION_TIMEOUT, SELECTOR_MISS
+
+ROW = {'지역': '서울', '지역상세': '강남', '매장명': '테스트점', '네이버지도링크': 'https://map.naver.com/p/entry/place/1'}
+
+
+class Page:
+    async def close(self):
+        pass
+
+
+class Context:
+    async def new_page(self):
+        return Page()
+
+
+def stored(tool):
+    return tool.checkpoint._connect().execute("SELECT status, failure_class FROM stores").fetchall()
+
+
+def run_store(backend):
+    asyncio.run(backend.process_store(Context(), 0, ROW))
+
+
+def test_missing_photo_tab_is_a_classified_failure(tool):
+    tool.stats['total'] = 1
+    backend = AsyncPhotoBackend(tool, 'https://pcmap.place.naver.com/place/{place_id}/photo')
+
+    async def extract(page, url, place_id=None, failures=None):
+        failures.note(SELECTOR_MISS)
+        return []
+
+    backend.extract_photos = extract
+    run_store(backend)
+
+    assert tool.stats['success'] == 0
+    assert tool.stats['failed'] == 1
+    assert tool.stats['failure_classes'] == {SELECTOR_MISS: 1}
+    assert stored(tool) == [('failed', SELECTOR_MISS)]
+    assert [(entry['매장명'], entry['class']) for entry in tool.failed_stores] == [('테스트점', SELECTOR_MISS)]
+
+
+def test_timed_out_store_is_checkpointed_and_retried(tool):
+    tool.stats['total'] = 1
+    tool.watchdog.timeout = 0.05
+    tool.watchdog.retries = 1
+    backend = AsyncPhotoBackend(tool, 'https://pcmap.place.naver.com/place/{place_id}/photo')
+    attempts = []
+
+    async def extract(page, url, place_id=None, failures=None):
+        attempts.append(url)
+        await asyncio.sleep(1)
+
+    backend.extract_photos = extract
+    run_store(backend)
+    assert stored(tool) == [('failed', NAVIGATION_TIMEOUT)]
+    assert backend.retry_queue == [(0, ROW)]
+
+    async def guarded(idx, row):
+        await backend.process_store(Context(), idx, row)
+
+    asyncio.run(backend._run_retries(guarded))
+
+    assert len(attempts) == 2
+    assert tool.stats['timed_out'] == 1
+    assert tool.stats['failed'] == 0
+    assert tool.failed_stores == []
+
+
+def test_slow_download_counts_against_the_store_timeout(tool):
+    tool.stats['total'] = 1
+    tool.watchdog.timeout = 0.05
+    backend = AsyncPhotoBackend(tool, 'https://pcmap.place.naver.com/place/{place_id}/photo')
+
+    async def extract(page, url, place_id=None, failures=None):
+        return ['https://ldb-phinf.pstatic.net/1.jpg']
+
+    def download_photos(*args):
+        time.sleep(0.3)
+        return 1
+
+    backend.extract_photos = extract
+    tool.download_photos = download_photos
+    run_store(backend)
+
+    # 추출은 제한 시간 안에 끝났지만 다운로드까지 합치면 초과 → 성공으로 세지 않고 재시도 대기
+    assert backend.retry_queue == [(0, ROW)]
+    assert tool.stats['success'] == 0
+    assert tool.stats['total_photos'] == 0
+    assert stored(tool) == [('failed', NAVIGATION_TIMEOUT)]
@@ -0,0 +1,41 @@
+import os
+
+import browser_options
+from browser_options import (describe_mode, format_browser_summary, format_page_load_summary, load_baseline,
+                             save_baseline)
+
+
+def test_measurement_files_live_next_to_the_scripts():
+    script_dir = os.path.dirname(os.path.abspath(browser_options.__file__))
+    assert os.path.dirname(browser_options.BASELINE_FILE) == script_dir
+    assert os.path.dirname(browser_options.PAGE_LOAD_BENCHMARK_FILE) == script_dir
+
+
+def test_baseline_round_trip_keeps_other_tools(tmp_path):
+    path = str(tmp_path / 'baseline.json')
+    save_baseline('V4', {'documents': 2, 'bytes': 10}, path)
+    save_baseline('Price', {'documents': 1, 'bytes': 5}, path)
+    save_baseline('Empty', {'documents': 0}, path)
+
+    assert load_baseline('V4', path) == {'documents': 2, 'bytes': 10}
+    assert load_baseline('Price', path) == {'documents': 1, 'bytes': 5}
+    assert load_baseline('Empty', path) is None
+
+
+def test_attached_session_is_its_own_mode_and_saves_no_baselines(tmp_path, monkeypatch):
+    benchmark_path = str(tmp_path / 'page_load.json')
+    saved = []
+    monkeypatch.setattr(browser_options, 'save_baseline', lambda *args, **kwargs: saved.append(args))
+    metrics = {'documents': 2, 'load_ms': 2000, 'bytes': 10, 'image_bytes': 5, 'image_requests': 1,
+               'images_skipped': 0}
+
+    # 플래그는 기본 모드지만 실제 Chrome은 데몬 설정을 따름
+    assert describe_mode(False, False, attach='127.0.0.1:9222') == '데몬 연결 127.0.0.1:9222'
+    lines = format_browser_summary('V4', metrics, False, False, attach='127.0.0.1:9222')
+    lines += format_page_load_summary('V4', 'eager', {'stores': 2, 'seconds': 3.0}, benchmark_path,
+                                      attach='127.0.0.1:9222')
+
+    assert lines[0] == '🖥️  브라우저 모드: 데몬 연결 127.0.0.1:9222'
+    assert any('데몬 연결, 기록 안 함' in line for line in lines)
+    assert saved == []
+    assert not os.path.exists(benchmark_path)
@@ -0,0 +1,72 @@
+import sqlite3
+
+from checkpoint_ledger import CheckpointLedger, row_key, PHASE_LINK_FILE, PHASE_PRICE
+from failure_classes import NAVIGATION_TIMEOUT, SELECTOR_MISS
+
+
+def store(name):
+    return {'지역': '서울', '지역상세': '강남', '매장명': name, '네이버지도링크': f'https://naver.me/{name}'}
+
+
+def test_completed_keeps_done_and_permanent_failures_only(tmp_path):
+    ledger = CheckpointLedger('v4', str(tmp_path / 'checkpoint.db'))
+    ledger.record(store('done'), 'done', 3)
+    ledger.record(store('partial'), 'partial', 1)
+    ledger.record(store('permanent'), 'failed', failure_class=SELECTOR_MISS)
+    ledger.record(store('transient'), 'failed', failure_class=NAVIGATION_TIMEOUT)
+
+    completed = ledger.completed()
+
+    assert row_key(store('done')) in completed
+    assert row_key(store('permanent')) in completed
+    assert row_key(store('partial')) not in completed
+    assert row_key(store('transient')) not in completed
+
+
+def test_pending_skips_completed_rows_for_the_same_tool_only(tmp_path):
+    path = str(tmp_path / 'checkpoint.db')
+    ledger = CheckpointLedger('v4', path)
+    ledger.record(store('a'), 'done', 1)
+    rows = [(0, store('a')), (1, store('b'))]
+
+    assert ledger.pending(rows) == [(1, store('b'))]
+    assert ledger.stats['skipped'] == 1
+    # 다른 도구의 체크포인트는 영향 없음
+    assert CheckpointLedger('price', path).pending(rows) == rows
+
+
+def test_latest_result_overwrites_the_previous_one(tmp_path):
+    ledger = CheckpointLedger('v4', str(tmp_path / 'checkpoint.db'))
+    ledger.record(store('a'), 'done', 1)
+    ledger.record(store('a'), 'failed', failure_class=NAVIGATION_TIMEOUT)
+
+    assert ledger.completed() == set()
+
+
+def test_phases_are_kept_per_tool(tmp_path):
+    path = str(tmp_path / 'checkpoint.db')
+    v4 = CheckpointLedger('v4', path)
+    v3 = CheckpointLedger('v3', path)
+    v4.record_phase(store('a'), PHASE_LINK_FILE, 'done')
+    v3.record_phase(store('a'), PHASE_LINK_FILE, 'failed')
+
+    assert v4.load_phases([PHASE_LINK_FILE])[row_key(store('a'))][PHASE_LINK_FILE]['status'] == 'done'
+    assert v3.load_phases([PHASE_LINK_FILE])[row_key(store('a'))][PHASE_LINK_FILE]['status'] == 'failed'
+
+
+def test_phases_without_a_tool_column_are_migrated(tmp_path):
+    path = str(tmp_path / 'checkpoint.db')
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE phases (row_key TEXT NOT NULL, phase TEXT NOT NULL, status TEXT NOT NULL, "
+                 "data TEXT, updated_at TEXT NOT NULL, PRIMARY KEY (row_key, phase))")
+    conn.executemany("INSERT INTO phases VALUES (?, ?, ?, ?, ?)",
+                     [(row_key(store('a')), PHASE_LINK_FILE, 'done', None, '2026-10-01T00:00:00'),
+                      (row_key(store('a')), PHASE_PRICE, 'done', '{"files": 2}', '2026-10-01T00:00:00')])
+    conn.commit()
+    conn.close()
+
+    # 단계 이름으로 원래 도구를 찾아 옮김
+    assert CheckpointLedger('v4', path).load_phases([PHASE_LINK_FILE, PHASE_PRICE]) == \
+        {row_key(store('a')): {PHASE_LINK_FILE: {'status': 'done', 'data': None}}}
+    assert CheckpointLedger('price', path).load_phases([PHASE_LINK_FILE, PHASE_PRICE]) == \
+        {row_key(store('a')): {PHASE_PRICE: {'status': 'done', 'data': {'files': 2}}}}
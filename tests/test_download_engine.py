@@ -0,0 +1,76 @@
+from conftest import FakeResponse
+from download_engine import PhotoDownloadEngine, host_limits_from_arg, guess_extension, DEFAULT_HOST_LIMITS
+
+
+def make_tasks(folder, host, count):
+    return [{'url': f"https://{host}/photo/{i}.jpg", 'folder': str(folder), 'name': f"업체_{i:03d}"}
+            for i in range(1, count + 1)]
+
+
+def test_results_keep_task_order(tmp_path, fake_session):
+    engine = PhotoDownloadEngine(max_workers=4, session=fake_session(delay=0.01))
+    tasks = make_tasks(tmp_path, 'a.phinf.pstatic.net', 6)
+
+    results = engine.download(tasks, progress_every=0)
+
+    assert [result['task']['name'] for result in results] == [task['name'] for task in tasks]
+    assert all(result['ok'] for result in results)
+    assert (tmp_path / '업체_003.jpg').read_bytes() == tasks[2]['url'].encode()
+
+
+def test_host_limit_caps_concurrent_requests(tmp_path, fake_session):
+    session = fake_session(delay=0.05)
+    engine = PhotoDownloadEngine(max_workers=8, host_limits={'phinf.pstatic.net': 2}, session=session)
+
+    engine.download(make_tasks(tmp_path, 'a.phinf.pstatic.net', 8), progress_every=0)
+    engine.download(make_tasks(tmp_path, 'example.com', 8), progress_every=0)
+
+    assert session.peak['a.phinf.pstatic.net'] <= 2
+    # 제한 없는 호스트는 워커 수만큼 동시에
+    assert session.peak['example.com'] > 2
+
+
+def test_host_limits_from_arg():
+    assert host_limits_from_arg(None) == DEFAULT_HOST_LIMITS
+    assert host_limits_from_arg(3) == {host: 3 for host in DEFAULT_HOST_LIMITS}
+
+
+def test_guess_extension():
+    assert guess_extension('image/png') == '.png'
+    assert guess_extension('image/webp') == '.webp'
+    assert guess_extension(None) == '.jpg'
+
+
+def test_streamed_file_is_renamed_into_place(tmp_path, fake_session):
+    url = "https://a.phinf.pstatic.net/photo/1.png"
+    body = b'x' * 10000
+    session = fake_session({url: FakeResponse(body=body, content_type='image/png')})
+    engine = PhotoDownloadEngine(session=session, chunk_kb=1)
+
+    [result] = engine.download([{'url': url, 'folder': str(tmp_path), 'name': '업체_001'}], progress_every=0)
+
+    assert result['ok'] and result['size'] == len(body)
+    assert (tmp_path / '업체_001.png').read_bytes() == body
+    assert engine.bytes_written == len(body)
+    assert not list(tmp_path.glob('*.part'))
+
+
+def test_interrupted_stream_leaves_no_partial_file(tmp_path, fake_session):
+    url = "https://a.phinf.pstatic.net/photo/1.jpg"
+    session = fake_session({url: FakeResponse(body=b'x' * 10000, fail_after=3)})
+    engine = PhotoDownloadEngine(session=session, chunk_kb=1)
+
+    [result] = engine.download([{'url': url, 'folder': str(tmp_path), 'name': '업체_001'}], progress_every=0)
+
+    assert not result['ok']
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_http_error_keeps_status(tmp_path, fake_session):
+    url = "https://a.phinf.pstatic.net/photo/1.jpg"
+    engine = PhotoDownloadEngine(session=fake_session({url: FakeResponse(status_code=404)}))
+
+    [result] = engine.download([{'url': url, 'folder': str(tmp_path), 'name': '업체_001'}], progress_every=0)
+
+    assert result['status'] == 404 and not result['ok']
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,94 @@
+import driver_health
+from driver_health import DriverHealth
+from store_watchdog import StoreWatchdog
+
+
+class Driver:
+    """window_handles / quit만 있는 드라이버 대역"""
+
+    def __init__(self):
+        self.window_handles = ['main']
+        self.quit_called = False
+
+    def execute_script(self, script, *args):
+        return None
+
+    def quit(self):
+        self.quit_called = True
+
+
+class Tool:
+    def __init__(self, attach=None):
+        self.attach = attach
+        self.driver = Driver()
+        self.starts = 0
+        self.stats = {'success': 0, 'failed': 0}
+        self.failed_stores = []
+
+    def setup_driver(self):
+        self.starts += 1
+        self.driver = Driver()
+
+    def process_single_store(self, idx, row):
+        process(self, idx, row)
+
+
+def process(tool, idx, row):
+    tool.stats['success'] += 1
+
+
+def test_recycle_restarts_after_the_configured_store_count():
+    tool = Tool()
+    health = DriverHealth(recycle_stores=2, max_memory_mb=0, max_load_seconds=0)
+
+    for idx in range(4):
+        health.run(tool, idx, {}, process)
+
+    assert tool.starts == 2
+    assert health.stats['reasons'] == {'매장 수': 2}
+
+
+def test_attached_browser_skips_recycle_and_memory_thresholds(monkeypatch):
+    monkeypatch.setattr(driver_health, 'driver_memory_mb', lambda driver: 10_000)
+    tool = Tool(attach='127.0.0.1:9222')
+    health = DriverHealth(recycle_stores=1, max_memory_mb=100, max_load_seconds=0)
+
+    for idx in range(3):
+        health.run(tool, idx, {}, process)
+
+    assert tool.starts == 0
+    assert health.stats['restarts'] == 0
+
+
+def test_driver_replaced_by_watchdog_recovery_resets_the_store_count():
+    tool = Tool()
+    health = DriverHealth(recycle_stores=3, max_memory_mb=0, max_load_seconds=0)
+
+    def timed_out(tool, idx, row):
+        # StoreWatchdog.recover처럼 runner 안에서 드라이버를 새로 시작
+        tool.setup_driver()
+
+    health.run(tool, 0, {}, process)
+    health.run(tool, 1, {}, process)
+    health.run(tool, 2, {}, timed_out)
+    assert health.stores_since_start == 0
+
+    health.run(tool, 3, {}, process)
+    health.run(tool, 4, {}, process)
+    assert health.stats['restarts'] == 0
+    assert tool.starts == 1
+
+
+def test_timeout_retries_go_through_driver_health():
+    tool = Tool()
+    tool.stats.update({'timed_out': 0, 'timed_out_stores': []})
+    health = DriverHealth(recycle_stores=2, max_memory_mb=0, max_load_seconds=0)
+    watchdog = StoreWatchdog(timeout=0, retries=1)
+    watchdog.retry_queue = [(0, {}), (1, {})]
+
+    watchdog.run_retries(tool, health)
+
+    # 재시도한 매장도 재시작 기준 매장 수에 포함
+    assert tool.stats['success'] == 2
+    assert health.stats['reasons'] == {'매장 수': 1}
+    assert tool.starts == 1
@@ -0,0 +1,36 @@
+import requests
+from selenium.common.exceptions import (InvalidSessionIdException, NoSuchElementException, TimeoutException,
+                                        WebDriverException)
+
+from failure_classes import (FailureTracker, classify_exception, is_transient, worst, DRIVER_CRASH, HTTP_4XX,
+                             NAVIGATION_TIMEOUT, SELECTOR_MISS, UNKNOWN)
+
+
+def test_classify_exception():
+    assert classify_exception(TimeoutException()) == NAVIGATION_TIMEOUT
+    assert classify_exception(requests.exceptions.ReadTimeout()) == NAVIGATION_TIMEOUT
+    assert classify_exception(InvalidSessionIdException()) == DRIVER_CRASH
+    assert classify_exception(WebDriverException('chrome not reachable')) == DRIVER_CRASH
+    assert classify_exception(WebDriverException('script timed out')) == NAVIGATION_TIMEOUT
+    assert classify_exception(NoSuchElementException()) == SELECTOR_MISS
+    assert classify_exception(ValueError('boom')) == UNKNOWN
+
+
+def test_worst_keeps_the_most_fundamental_cause():
+    assert worst([]) is None
+    assert worst([None, SELECTOR_MISS]) == SELECTOR_MISS
+    assert worst([SELECTOR_MISS, DRIVER_CRASH, UNKNOWN]) == DRIVER_CRASH
+    assert worst([UNKNOWN, HTTP_4XX]) == HTTP_4XX
+
+
+def test_tracker_counts_one_class_per_store():
+    stats = {}
+    tracker = FailureTracker(stats)
+    tracker.begin()
+    tracker.note(SELECTOR_MISS)
+    assert tracker.finish(TimeoutException()) == NAVIGATION_TIMEOUT
+
+    tracker.begin()
+    assert tracker.finish() == UNKNOWN
+    assert stats == {NAVIGATION_TIMEOUT: 1, UNKNOWN: 1}
+    assert is_transient(NAVIGATION_TIMEOUT) and not is_transient(SELECTOR_MISS)
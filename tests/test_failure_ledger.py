@@ -0,0 +1,65 @@
+from checkpoint_ledger import row_key
+from failure_classes import HTTP_5XX, NAVIGATION_TIMEOUT, SELECTOR_MISS
+from failure_ledger import (failed_rows, failure_entry, load_failure_entries, merge_failure_ledger,
+                            write_failure_ledger)
+
+
+def store(name):
+    return {'지역': '서울', '지역상세': '강남', '매장명': name}
+
+
+def test_failed_rows_selects_transient_failures_and_keeps_row_numbers(tmp_path):
+    path = str(tmp_path / 'failures.jsonl')
+    write_failure_ledger(path, [failure_entry(store('timeout'), 'urls', 'TimeoutException', 1.0, NAVIGATION_TIMEOUT),
+                                failure_entry(store('missing'), 'urls', 'PhotoExtractFailed', 1.0, SELECTOR_MISS),
+                                failure_entry(store('http'), 'photos', 'HTTPError', 1.0, HTTP_5XX)])
+    rows = [(0, store('ok')), (1, store('timeout')), (2, store('missing')), (3, store('http'))]
+
+    assert failed_rows(rows, path) == [(1, store('timeout')), (3, store('http'))]
+    assert failed_rows(rows, path, include_permanent=True) == rows[1:]
+
+
+def test_failed_rows_skips_broken_lines(tmp_path):
+    path = tmp_path / 'failures.jsonl'
+    path.write_text('{"key": "서울|강남|a", "class": "unknown"}\n{broken\n\n', encoding='utf-8')
+
+    assert failed_rows([(0, store('a')), (1, store('b'))], str(path)) == [(0, store('a'))]
+
+
+def test_v4_failures_are_recorded_for_the_ledger(tool):
+    row = dict(store('a'), 네이버지도링크='https://naver.me/a')
+
+    tool.record_failure(row, SELECTOR_MISS, 'PhotoExtractFailed', 0)
+
+    assert tool.stats['failed'] == 1
+    entry, = tool.failed_stores
+    assert (entry['key'], entry['class'], entry['transient']) == ('서울|강남|a', SELECTOR_MISS, False)
+    assert entry['네이버지도링크'] == 'https://naver.me/a'
+
+
+def test_retry_run_keeps_permanent_and_unprocessed_entries(tmp_path):
+    path = str(tmp_path / 'failures.jsonl')
+    write_failure_ledger(path, [failure_entry(store('timeout'), 'urls', 'TimeoutException', 1.0, NAVIGATION_TIMEOUT),
+                                failure_entry(store('flaky'), 'urls', 'TimeoutException', 1.0, NAVIGATION_TIMEOUT),
+                                failure_entry(store('missing'), 'urls', 'PhotoExtractFailed', 1.0, SELECTOR_MISS)])
+    rows = [(0, store('timeout')), (1, store('flaky')), (2, store('missing'))]
+
+    # --retry-failed (영구 실패 제외): timeout은 이번에 성공, flaky는 다시 실패
+    selected = failed_rows(rows, path)
+    assert selected == rows[:2]
+    again = failure_entry(store('flaky'), 'urls', 'TimeoutException', 2.0, NAVIGATION_TIMEOUT)
+    merge_failure_ledger(path, [again], [row_key(row) for _, row in selected])
+
+    entries = load_failure_entries(path)
+    assert sorted(entry['key'] for entry in entries) == ['서울|강남|flaky', '서울|강남|missing']
+    assert [entry['elapsed'] for entry in entries if entry['key'] == '서울|강남|flaky'] == [2.0]
+    # 재시도에서 빠진 영구 실패는 --retry-permanent로 여전히 다시 처리 가능
+    assert failed_rows(rows, path, include_permanent=True) == [(1, store('flaky')), (2, store('missing'))]
+
+
+def test_v4_stores_are_recorded_as_processed(tool):
+    tool.stats['total'] = 1
+
+    tool.process_single_store(0, store('a'))
+
+    assert tool.stats['processed_keys'] == ['서울|강남|a']
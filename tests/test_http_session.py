@@ -0,0 +1,32 @@
+import pytest
+
+import http_session
+
+
+@pytest.fixture(autouse=True)
+def fresh_pool(monkeypatch):
+    monkeypatch.setattr(http_session, '_shared_pool', None)
+
+
+def test_shared_pool_is_created_once():
+    first = http_session.get_shared_session(8)
+    assert http_session.get_shared_session() is first
+    assert first.pool_size == 8
+
+
+def test_different_size_warns_and_keeps_existing_pool(capsys):
+    first = http_session.get_shared_session(8)
+
+    assert http_session.get_shared_session(32) is first
+    assert first.pool_size == 8
+    assert '32' in capsys.readouterr().out
+
+
+def test_same_size_does_not_warn(capsys):
+    http_session.get_shared_session(8)
+    http_session.get_shared_session(8)
+    assert capsys.readouterr().out == ''
+
+
+def test_default_size():
+    assert http_session.get_shared_session().pool_size == http_session.DEFAULT_POOL_SIZE
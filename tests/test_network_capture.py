@@ -0,0 +1,66 @@
+import json
+
+import naver_map_bulk_downloader_v4
+from conftest import FakeDriver
+from network_capture import PerformanceLog, collect_image_urls
+
+
+def image_response(url):
+    """chromedriver performance 로그 한 줄 (이미지 응답)"""
+    message = {'method': 'Network.responseReceived',
+               'params': {'type': 'Image', 'response': {'url': url, 'status': 200, 'mimeType': 'image/jpeg'}}}
+    return {'message': json.dumps({'message': message})}
+
+
+class LogDriver(FakeDriver):
+    """get_log가 쌓아 둔 performance 로그를 돌려주는 드라이버"""
+
+    def __init__(self):
+        super().__init__()
+        self.pending = []
+
+    def receive(self, *urls):
+        self.pending.extend(image_response(url) for url in urls)
+
+    def get_log(self, kind):
+        entries, self.pending = self.pending, []
+        return entries
+
+
+def test_since_mark_skips_responses_before_the_mark():
+    driver = LogDriver()
+    log = PerformanceLog()
+    log.reset(driver)
+    driver.receive('https://ldb-phinf.pstatic.net/grid.jpg')
+    log.mark(driver)
+    driver.receive('https://ldb-phinf.pstatic.net/company.jpg')
+
+    assert collect_image_urls(log.since_mark(driver)) == ['https://ldb-phinf.pstatic.net/company.jpg']
+    # 요청 차단 통계는 매장 전체 로그를 그대로 사용
+    assert len(log.read(driver)) == 2
+
+
+def test_network_mode_keeps_only_images_loaded_after_the_company_click(tool, monkeypatch):
+    tool.extract_mode = 'network'
+    tool.driver = LogDriver()
+    before = ['https://ldb-phinf.pstatic.net/all_1.jpg', 'https://ldb-phinf.pstatic.net/profile.jpg']
+    after = ['https://ldb-phinf.pstatic.net/company_1.jpg', 'https://ldb-phinf.pstatic.net/company_2.jpg']
+
+    def wait_for(label, *args, **kwargs):
+        # 업체 카테고리 전환을 기다리는 동안 업체 사진이 로드됨
+        if label == '업체 카테고리 전환':
+            tool.driver.receive(*after)
+        return True
+
+    # 페이지를 열면 전체 그리드 / 프로필 이미지가 먼저 로드됨
+    monkeypatch.setattr(tool, 'open_page', lambda url: tool.driver.receive(*before))
+    monkeypatch.setattr(tool, 'click_company_category', lambda: True)
+    monkeypatch.setattr(tool, 'scroll_to_load_all_images', lambda: None)
+    monkeypatch.setattr(tool.waits, 'wait_for', wait_for)
+    monkeypatch.setattr(naver_map_bulk_downloader_v4, 'record_page_metrics', lambda driver, stats: None)
+    tool.perf_log.reset(tool.driver)
+
+    photos, categories = tool.extract_photos_direct('1')
+
+    assert photos == after
+    assert categories == {'업체': after}
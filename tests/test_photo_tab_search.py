@@ -0,0 +1,48 @@
+import time
+
+from conftest import FakeDriver, FakeFrame
+
+
+def test_iframe_scan_does_not_wait_on_frames_without_photo_text(tool):
+    frames = [FakeFrame(f'id:ad{i}', text='광고') for i in range(5)]
+    frames.append(FakeFrame('id:entryIframe', text='홈 사진 리뷰', photo_tab=True))
+    tool.driver = FakeDriver(frames=frames)
+
+    started = time.time()
+    assert tool.find_photo_tab_first_time()
+
+    assert time.time() - started < 0.5
+    # '사진' 글자가 없는 프레임은 클릭 스크립트도 실행하지 않음
+    assert tool.driver.probes() == ['main', 'id:entryIframe']
+    assert tool.frame_locator.key == 'id:entryIframe'
+
+
+def test_photo_tab_found_in_iframe_with_zero_photos_is_not_a_failure(tool, monkeypatch):
+    # 그리드 / 스크롤 대기는 바로 실패 (사진 없는 매장)
+    monkeypatch.setattr(tool.waits, 'wait_for', lambda *args, **kwargs: False)
+    frames = [FakeFrame('id:ad', text='광고'), FakeFrame('id:entryIframe', text='홈 사진 리뷰', photo_tab=True)]
+    tool.driver = FakeDriver(frames=frames)
+    tool.stats['total'] = 1
+    row = {'지역': '서울', '지역상세': '강남', '매장명': '사진없는점',
+           '네이버지도링크': 'https://map.naver.com/p/entry/place/1'}
+
+    tool.process_single_store(0, row)
+
+    # 메인 문서 / 광고 프레임에서 못 찾은 것은 매장 실패 원인이 아님
+    assert tool.frame_locator.key == 'id:entryIframe'
+    assert tool.stats['success'] == 1
+    assert tool.stats['failed'] == 0
+    assert tool.stats['failure_classes'] == {}
+    assert tool.checkpoint.completed() == {'서울|강남|사진없는점'}
+
+
+def test_photo_tab_missing_everywhere_is_a_selector_miss(tool, monkeypatch):
+    monkeypatch.setattr(tool.waits, 'wait_for', lambda *args, **kwargs: False)
+    tool.driver = FakeDriver(frames=[FakeFrame('id:ad', text='광고 사진')])
+    tool.stats['total'] = 1
+    row = {'지역': '서울', '지역상세': '강남', '매장명': '탭없는점', '네이버지도링크': 'https://map.naver.com/p/1'}
+
+    tool.process_single_store(0, row)
+
+    assert tool.stats['failed'] == 1
+    assert tool.stats['failure_classes'] == {'selector_miss': 1}
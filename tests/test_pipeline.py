@@ -0,0 +1,45 @@
+import pytest
+
+from naver_map_bulk_downloader_v4 import NaverMapBulkDownloaderV4
+from store_watchdog import snapshot_outcome, restore_outcome
+
+
+@pytest.fixture
+def tool(tmp_path):
+    return NaverMapBulkDownloaderV4('stores.xlsx', pipeline=True, pipeline_workers=2,
+                                    link_cache=str(tmp_path / 'links.json'),
+                                    frame_cache=str(tmp_path / 'frames.json'),
+                                    checkpoint=str(tmp_path / 'checkpoint.db'))
+
+
+def row(name):
+    return {'지역': '서울', '지역상세': '강남구', '매장명': name}
+
+
+def test_pipeline_counts_outcomes_after_download(tool, monkeypatch):
+    def fake_download(photos, categories, folder, store_name, progress_every=5, row=None):
+        if store_name == 'broken':
+            raise OSError('disk full')
+        return len(photos) - (store_name == 'partial')
+
+    monkeypatch.setattr(tool, 'download_photos', fake_download)
+    tool.start_download_pipeline()
+    for name in ['ok', 'partial', 'broken']:
+        tool.download_queue.put(('folder', ['a', 'b'], {}, name, row(name)))
+    tool.stop_download_pipeline()
+
+    assert tool.stats['success'] == 2
+    assert tool.stats['failed'] == 1
+    assert tool.stats['total_photos'] == 3
+    assert tool.stats['failure_classes'] == {'unknown': 1}
+
+
+def test_restore_keeps_background_outcomes(tool):
+    snapshot = snapshot_outcome(tool)
+    tool.stats['success'] += 1            # 시간 초과된 매장 자신의 결과
+    tool.stats['success'] += 1            # 그 사이 끝난 백그라운드 다운로드
+    tool.background_outcomes['success'] += 1
+
+    restore_outcome(tool, snapshot)
+
+    assert tool.stats['success'] == 1
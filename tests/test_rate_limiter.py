@@ -0,0 +1,97 @@
+import multiprocessing
+
+import pytest
+
+import rate_limiter
+from rate_limiter import (RateLimiter, format_rate_summary, page_state, BLOCK_COOLDOWN, BURST, PAGE_BLOCKED,
+                          PAGE_ERROR, PAGE_OK, PAGE_SLOW, SLOW_FACTOR, SPEEDUP_STEP)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """rate_limiter 안의 time.time()을 고정 (now[0]을 바꿔서 시간 진행)"""
+    now = [1000.0]
+    monkeypatch.setattr(rate_limiter.time, 'time', lambda: now[0])
+    return now
+
+
+def test_reserve_spends_the_burst_then_queues_waits(clock):
+    limiter = RateLimiter(rate=1.0, max_rate=2.0)
+
+    assert [limiter.reserve() for _ in range(BURST)] == [0] * BURST
+    assert limiter.reserve() == pytest.approx(1.0)
+    # 앞에서 예약한 이동 뒤로 줄을 섬
+    assert limiter.reserve() == pytest.approx(2.0)
+    assert limiter.stats['waits'] == 2
+    assert limiter.stats['throttle_seconds'] == pytest.approx(3.0)
+
+    clock[0] += 10
+    assert limiter.reserve() == 0
+
+
+def test_observe_adjusts_rate_within_bounds(clock):
+    limiter = RateLimiter(rate=1.0, min_rate=0.1, max_rate=1.02, target_load=5)
+
+    limiter.observe(1.0)
+    assert limiter.current_rate() == pytest.approx(1.02)
+    assert limiter.stats['speedups'] == 1
+    limiter.observe(1.0)
+    assert limiter.current_rate() == pytest.approx(1.02)
+
+    limiter.observe(8.0)
+    assert limiter.current_rate() == pytest.approx(1.02 * SLOW_FACTOR)
+    for _ in range(10):
+        limiter.observe(1.0, PAGE_ERROR)
+    assert limiter.current_rate() == pytest.approx(0.1)
+    assert limiter.stats['backoffs'] == {PAGE_SLOW: 1, PAGE_ERROR: 10}
+    assert limiter.stats['navigations'] == 13
+
+
+def test_blocked_page_pauses_the_next_navigation(clock):
+    limiter = RateLimiter(rate=1.0, min_rate=0.05, max_rate=2.0)
+
+    limiter.observe(1.0, PAGE_BLOCKED)
+
+    assert limiter.current_rate() == pytest.approx(0.5)
+    assert limiter.reserve() == pytest.approx(BLOCK_COOLDOWN)
+
+
+def test_disabled_limiter_never_waits():
+    limiter = RateLimiter(rate=0)
+
+    assert limiter.reserve() == 0
+    limiter.observe(99.0, PAGE_BLOCKED)
+    assert limiter.current_rate() is None
+    assert format_rate_summary(limiter.current_rate(), limiter.stats) == []
+
+
+def test_page_state_uses_the_slower_of_elapsed_and_navigation_timing():
+    assert page_state(None, 1.5) == (1.5, PAGE_OK)
+    assert page_state({'state': 'blocked', 'load': 4000}, 1.5) == (4.0, PAGE_BLOCKED)
+
+
+def test_summary_lists_speedups_and_backoffs(clock):
+    limiter = RateLimiter(rate=1.0)
+    limiter.observe(1.0)
+    limiter.observe(1.0, PAGE_ERROR)
+
+    lines = format_rate_summary(limiter.current_rate(), limiter.stats)
+
+    assert lines[0].startswith(f"🚦 요청 속도: 현재 {(1.0 + SPEEDUP_STEP) / 2:.2f}회/초")
+    assert lines[1] == "   - 가속 1회 / 감속: 오류 페이지 1회"
+
+
+def test_shared_state_survives_unshare_and_a_dead_manager():
+    manager = multiprocessing.Manager()
+    limiter = RateLimiter(rate=1.0)
+    worker = RateLimiter(rate=1.0, shared=limiter.share(manager))
+    worker.observe(1.0, PAGE_ERROR)
+
+    limiter.unshare()
+    assert limiter.current_rate() == pytest.approx(0.5)
+
+    # Ctrl+C로 Manager가 먼저 끝난 경우
+    worker_after_interrupt = RateLimiter(rate=1.0, shared=RateLimiter(rate=1.0).share(manager))
+    manager.shutdown()
+    worker_after_interrupt.unshare()
+    assert worker_after_interrupt.current_rate() == 1.0
@@ -0,0 +1,51 @@
+from checkpoint_ledger import PHASE_PHOTOS, row_key
+
+ROW = {'지역': '서울', '지역상세': '강남', '매장명': '테스트점', '네이버지도링크': 'https://naver.me/abc'}
+
+
+def capture_tasks(tool):
+    seen = []
+
+    def download_tasks(tasks, progress_every=10, row=None, carried=()):
+        seen.append([task['url'] for task in tasks])
+        return len(tasks)
+
+    tool.download_tasks = download_tasks
+    return seen
+
+
+def test_retry_uses_only_failed_photos_from_the_last_download(tool):
+    tool.checkpoint.record_urls(ROW, ['a', 'b', 'c'])
+    tool.checkpoint.record_phase(ROW, PHASE_PHOTOS, 'partial', [{'url': 'b', 'name': '업체_002', 'class': 'http_5xx'}])
+    seen = capture_tasks(tool)
+
+    assert tool.retry_downloads([(0, ROW)]) == []
+    assert seen == [['b']]
+
+
+def test_new_url_list_replaces_the_stale_failed_list(tool):
+    tool.checkpoint.record_urls(ROW, ['a', 'b', 'c'])
+    tool.checkpoint.record_phase(ROW, PHASE_PHOTOS, 'partial', [{'url': 'b', 'name': '업체_002', 'class': 'http_5xx'}])
+    # 다음 실행에서 다시 추출 → 다운로드 결과를 남기기 전에 중단
+    tool.checkpoint.record_urls(ROW, ['x', 'y'])
+    seen = capture_tasks(tool)
+
+    tool.retry_downloads([(0, ROW)])
+
+    assert seen == [['x', 'y']]
+
+
+def test_permanent_photos_left_after_a_full_retry_mark_the_store_partial(tool):
+    tool.checkpoint.record_urls(ROW, ['a', 'b', 'c'])
+    tool.checkpoint.record_phase(ROW, PHASE_PHOTOS, 'partial',
+                                 [{'url': 'b', 'name': '업체_002', 'class': 'http_5xx'},
+                                  {'url': 'c', 'name': '업체_003', 'class': 'http_4xx'}])
+    seen = capture_tasks(tool)
+
+    tool.retry_downloads([(0, ROW)])
+
+    # 일시적 실패(b)는 다 받았지만 영구 실패(c)가 남음 → 'done'이 아니라 분류와 함께 'partial'
+    assert seen == [['b']]
+    assert tool.checkpoint._connect().execute("SELECT status, failure_class FROM stores").fetchall() == \
+        [('partial', 'http_4xx')]
+    assert row_key(ROW) in tool.checkpoint.completed()
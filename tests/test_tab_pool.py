@@ -0,0 +1,90 @@
+import pytest
+
+import rate_limiter
+from rate_limiter import RateLimiter, BURST
+from tab_pool import TabPool, format_tab_summary
+
+
+class _TabSwitch:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def new_window(self, kind):
+        self.driver.current_window_handle = f"tab{len(self.driver.tabs)}"
+        self.driver.tabs[self.driver.current_window_handle] = 'about:blank'
+
+    def window(self, handle):
+        self.driver.current_window_handle = handle
+
+    def default_content(self):
+        pass
+
+
+class TabDriver:
+    """탭(window handle)마다 주소만 기억하는 드라이버 대역"""
+
+    def __init__(self):
+        self.current_window_handle = 'tab0'
+        self.tabs = {'tab0': 'about:blank'}
+        self.switch_to = _TabSwitch(self)
+        self.requests = []
+        self.preloads = []
+
+    def get(self, url):
+        self.requests.append(url)
+        self.tabs[self.current_window_handle] = url
+
+    def execute_script(self, script, *args):
+        if 'location.assign' in script:
+            self.preloads.append(args[0])
+            self.get(args[0])
+            return None
+        if 'readyState' in script:
+            return 'complete'
+        return None
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(rate_limiter.time, 'time', lambda: now[0])
+    monkeypatch.setattr(rate_limiter.time, 'sleep', lambda seconds: now.__setitem__(0, now[0] + seconds))
+    return now
+
+
+def test_preloads_take_a_token_each_and_wait_when_none_is_left(clock):
+    driver = TabDriver()
+    limiter = RateLimiter(rate=1.0, max_rate=1.0)
+    pool = TabPool(driver, BURST + 2, limiter=limiter)
+    urls = [f"https://m.place.naver.com/{n}" for n in range(BURST + 2)]
+
+    pool.open(urls[0], urls[1:])
+
+    # 남는 탭은 BURST + 1개지만 토큰(BURST개)만큼만 미리 로드하고 나머지는 미룸
+    assert driver.preloads == urls[1:BURST + 1]
+    assert pool.stats['deferred'] == 1
+    assert not limiter.try_acquire()
+
+    # 1초 뒤 토큰 하나 → 미뤘던 매장을 미리 로드
+    clock[0] += 1
+    pool.open(urls[1], urls[2:])
+    assert driver.preloads == urls[1:]
+
+
+def test_switching_to_a_preloaded_tab_takes_no_second_token(clock):
+    driver = TabDriver()
+    limiter = RateLimiter(rate=1.0, max_rate=1.0)
+    pool = TabPool(driver, 2, limiter=limiter)
+    urls = ['https://m.place.naver.com/1', 'https://m.place.naver.com/2']
+    open_page = lambda url: limiter.navigate(driver, url, lambda target: pool.open(target, urls),
+                                             charged=pool.is_preloaded(url))
+
+    open_page(urls[0])
+    open_page(urls[1])
+
+    # driver.get 한 번 + 미리 로드 한 번 = 실제 요청 2번, 토큰 2개
+    assert sorted(driver.requests) == urls
+    assert driver.preloads == urls[1:]
+    assert limiter.state['tokens'] == pytest.approx(BURST - 2)
+    assert limiter.stats['navigations'] == 2
+    assert format_tab_summary(2, pool.stats)[0].startswith("🗂️  탭 2개: 미리 로드 1개, 미리 로드한 탭 사용 1개")
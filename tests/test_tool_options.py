@@ -0,0 +1,23 @@
+import pytest
+
+from tool_options import ToolOptions, merge_defaults
+
+
+def test_later_defaults_win_and_values_override():
+    defaults = merge_defaults({'rate': 1.0, 'block_preset': 'photo'}, {'block_preset': 'price'})
+    options = ToolOptions(defaults, {'rate': 0.5})
+
+    assert options.block_preset == 'price'
+    assert options.rate == 0.5
+
+
+def test_unknown_option_is_rejected_like_a_keyword_argument():
+    with pytest.raises(TypeError, match='pipline'):
+        ToolOptions({'pipeline': False}, {'pipline': True})
+
+
+def test_tool_constructor_rejects_options_it_does_not_support(tmp_path):
+    from capture_naver_place import NaverPlaceCapturer
+
+    with pytest.raises(TypeError, match='pipeline'):
+        NaverPlaceCapturer('stores.xlsx', pipeline=True, checkpoint=str(tmp_path / 'checkpoint.db'))
@@ -0,0 +1,63 @@
+from download_engine import PhotoDownloadEngine
+from worker_pool import merge_stats, run_parallel
+
+
+class DummyEngine:
+    def __init__(self):
+        self.parts = 1
+
+    def split_host_limits(self, parts):
+        self.parts = parts
+
+
+class DummyTool:
+    """worker_pool 도구 규약만 갖춘 가짜 도구 (spawn 워커에서 import되도록 모듈 최상위에 둠)"""
+
+    def __init__(self, excel_path, scale=1):
+        self.excel_path = excel_path
+        self.scale = scale
+        self.stats = {'total': 0, 'success': 0, 'photos': [], 'split': {}}
+        self.failed_stores = []
+        self.download_engine = DummyEngine()
+
+    def process_rows(self, rows):
+        parts = str(self.download_engine.parts)
+        self.stats['split'][parts] = self.stats['split'].get(parts, 0) + 1
+        for idx, row in rows:
+            self.stats['success'] += self.scale
+            self.stats['photos'].append(row['매장명'])
+            if row['매장명'] == 'bad':
+                self.failed_stores.append(row['매장명'])
+
+
+def test_merge_stats_sums_numbers_extends_lists_and_recurses():
+    target = {'total': 10, 'success': 1, 'bytes': 1.5, 'names': ['a'], 'nested': {'x': 1}, 'flag': True}
+    merge_stats(target, {'total': 5, 'success': 2, 'bytes': 0.5, 'names': ['b'],
+                         'nested': {'x': 2, 'y': 3}, 'new': {'z': 1}, 'flag': True})
+
+    assert target == {'total': 10, 'success': 3, 'bytes': 2.0, 'names': ['a', 'b'],
+                      'nested': {'x': 3, 'y': 3}, 'new': {'z': 1}, 'flag': True}
+
+
+def test_split_host_limits_divides_per_process():
+    engine = PhotoDownloadEngine(host_limits={'phinf.pstatic.net': 4, 'blogpfthumb': 2})
+    engine.split_host_limits(2)
+    assert engine.host_limits == {'phinf.pstatic.net': 2, 'blogpfthumb': 1}
+
+    engine.split_host_limits(8)
+    assert engine.host_limits == {'phinf.pstatic.net': 1, 'blogpfthumb': 1}
+
+
+def test_run_parallel_merges_worker_results():
+    tool = DummyTool('stores.xlsx')
+    tool.stats['total'] = 4
+    rows = [(i, {'매장명': name}) for i, name in enumerate(['a', 'b', 'bad', 'c'])]
+
+    results = run_parallel(tool, rows, 2, {'scale': 2})
+
+    assert len(results) == 2
+    assert tool.stats['success'] == 8
+    assert sorted(tool.stats['photos']) == ['a', 'b', 'bad', 'c']
+    assert tool.failed_stores == ['bad']
+    # 각 워커의 호스트별 제한은 워커 수로 나뉨
+    assert tool.stats['split'] == {'2': 2}
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+도구 생성자 옵션 묶음
+
+도구 생성자가 기능 모듈마다 키워드 인자를 따로 받아 인자가 40개 가까이 되었음.
+- 기능 모듈은 *_options_from_args와 같은 키로 기본값(*_DEFAULTS)을 제공
+- 도구는 필요한 모듈의 기본값을 merge_defaults로 합쳐 한 번만 정의
+- 생성자는 **options로 받아 ToolOptions로 감싸고 options.이름으로 읽음
+  (모르는 옵션은 기존 키워드 인자처럼 TypeError)
+
+사용 예:
+    V4_OPTIONS = merge_defaults(DOWNLOAD_DEFAULTS, RATE_DEFAULTS, {'pipeline': False})
+    options = ToolOptions(V4_OPTIONS, options)
+    self.pipeline = options.pipeline
+"""
+
+
+def merge_defaults(*groups):
+    """모듈별 기본값 합치기 (뒤에 오는 값이 우선 - 도구 전용 기본값은 마지막에)"""
+    merged = {}
+    for group in groups:
+        merged.update(group)
+    return merged
+
+
+class ToolOptions:
+    def __init__(self, defaults, values=None):
+        values = values or {}
+        unknown = sorted(set(values) - set(defaults))
+        if unknown:
+            raise TypeError(f"알 수 없는 옵션: {', '.join(unknown)}")
+        self.values = dict(defaults)
+        self.values.update(values)
+
+    def __getattr__(self, name):
+        try:
+            return self.__dict__['values'][name]
+        except KeyError:
+            raise AttributeError(name) from None
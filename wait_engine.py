@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+이벤트 기반 대기 엔진 (고정 time.sleep 대체)
+
+기능:
+- 구체적인 DOM 조건(iframe 존재, 사진 그리드 채워짐, 뷰어 이미지 src 변경 등)을 폴링
+- 조건별 타임아웃
+- 조건을 평가할 수 없는 경우에만 고정 대기(fallback)로 대체
+- 조건별 실제 대기 시간 기록 → 최종 통계에서 어디서 시간이 쓰였는지 확인
+
+조건은 모두 execute_script로 평가 (find_elements의 implicitly_wait 10초에 걸리지 않도록)
+
+사용 예:
+    self.waits = WaitEngine(self.stats.setdefault('waits', {}))
+    self.waits.attach(self.driver)
+    self.waits.wait_for('페이지 iframe', page_iframe_ready(), timeout=10, fallback=5)
+"""
+
+import time
+
+from dom_harvester import CDN_DOMAINS
+
+
+# ---------------------------------------------------------------------------
+# 조건 (driver -> 참/거짓 값)
+# ---------------------------------------------------------------------------
+
+def document_ready():
+    """document.readyState == complete"""
+    return lambda driver: driver.execute_script("return document.readyState === 'complete';")
+
+
+def element_present(css_selector):
+    """CSS 선택자에 해당하는 요소 존재"""
+    return lambda driver: driver.execute_script(
+        "return document.querySelector(arguments[0]) !== null;", css_selector)
+
+
+PAGE_IFRAME_READY_SCRIPT = """
+    if (document.querySelector('iframe#entryIframe')) return true;
+    return document.readyState === 'complete' && document.querySelectorAll('iframe').length > 0;
+"""
+
+
+def page_iframe_ready():
+    """네이버 지도 장소 iframe(entryIframe) 또는 로드 완료된 페이지의 iframe 존재"""
+    return lambda driver: driver.execute_script(PAGE_IFRAME_READY_SCRIPT)
+
+
+def text_present(text):
+    """현재 문서(프레임) 본문에 텍스트 존재"""
+    return lambda driver: driver.execute_script(
+        "return !!(document.body && document.body.innerText.indexOf(arguments[0]) !== -1);", text)
+
+
+# 사진 그리드 앞부분 이미지 src 묶음 (arguments[0]: CDN 도메인 목록)
+GRID_SIGNATURE_SCRIPT = """
+    var domains = arguments[0];
+    var srcs = [];
+    var imgs = document.images;
+    for (var i = 0; i < imgs.length && srcs.length < 5; i++) {
+        var src = imgs[i].currentSrc || imgs[i].src || '';
+        for (var j = 0; j < domains.length; j++) {
+            if (src.indexOf(domains[j]) !== -1) { srcs.push(src); break; }
+        }
+    }
+    return srcs.join('|');
+"""
+
+
+def photo_grid_signature(driver):
+    """사진 그리드의 앞부분 이미지 src 묶음 (그리드 변경 감지용)"""
+    try:
+        return driver.execute_script(GRID_SIGNATURE_SCRIPT, CDN_DOMAINS) or ''
+    except Exception:
+        return ''
+
+
+def photo_grid_populated():
+    """네이버 CDN 이미지가 하나 이상 로드됨"""
+    return lambda driver: driver.execute_script(GRID_SIGNATURE_SCRIPT, CDN_DOMAINS)
+
+
+def photo_grid_changed(previous_signature):
+    """사진 그리드 내용이 이전과 달라짐 (카테고리 전환 등)"""
+    def condition(driver):
+        signature = driver.execute_script(GRID_SIGNATURE_SCRIPT, CDN_DOMAINS)
+        return signature and signature != previous_signature
+    return condition
+
+
+def image_src_changed(css_selector, previous_src):
+    """이미지 요소의 src가 이전 값과 달라짐 (뷰어 다음 이미지 등)"""
+    return lambda driver: driver.execute_script("""
+        var img = document.querySelector(arguments[0]);
+        return !!(img && img.src && img.src !== arguments[1]);
+    """, css_selector, previous_src)
+
+
+def scroll_height_changed(previous_height):
+    """문서 높이가 이전 값과 달라짐 (무한 스크롤 추가 로드)"""
+    return lambda driver: driver.execute_script(
+        "return document.body.scrollHeight !== arguments[0];", previous_height)
+
+
+def url_changed(previous_url):
+    """현재 URL이 이전 값과 달라짐"""
+    return lambda driver: driver.current_url != previous_url
+
+
+def images_loaded(css_selector):
+    """영역 안의 이미지가 모두 로드 완료됨 (스크린샷용)"""
+    return lambda driver: driver.execute_script("""
+        var root = document.querySelector(arguments[0]);
+        if (!root) return false;
+        var imgs = root.querySelectorAll('img');
+        for (var i = 0; i < imgs.length; i++) {
+            if (!imgs[i].complete) return false;
+        }
+        return true;
+    """, css_selector)
+
+
+# ---------------------------------------------------------------------------
+# 대기 엔진
+# ---------------------------------------------------------------------------
+
+class WaitEngine:
+    def __init__(self, timings=None, poll_interval=0.2):
+        self.driver = None
+        self.poll_interval = poll_interval
+        # 조건 이름 -> {'count', 'seconds', 'timeouts', 'fallbacks'}
+        self.timings = timings if timings is not None else {}
+
+    def attach(self, driver):
+        """대기에 사용할 드라이버 연결 (드라이버 재시작 시 다시 호출)"""
+        self.driver = driver
+
+    def _record(self, name, elapsed, timed_out=False, fell_back=False):
+        entry = self.timings.setdefault(name, {'count': 0, 'seconds': 0.0, 'timeouts': 0, 'fallbacks': 0})
+        entry['count'] += 1
+        entry['seconds'] += elapsed
+        if timed_out:
+            entry['timeouts'] += 1
+        if fell_back:
+            entry['fallbacks'] += 1
+
+    def wait_for(self, name, condition, timeout=10, fallback=None):
+        """조건이 참이 될 때까지 대기 - 조건 결과(참) 또는 False 반환
+
+        조건 평가가 한 번도 성공하지 못하면(스크립트 오류 등) fallback 초만큼 고정 대기
+        """
+        start = time.time()
+        evaluated = False
+
+        while True:
+            try:
+                result = condition(self.driver)
+                evaluated = True
+                if result:
+                    self._record(name, time.time() - start)
+                    return result
+            except Exception:
+                pass
+
+            if time.time() - start >= timeout:
+                break
+            time.sleep(self.poll_interval)
+
+        fell_back = False
+        if not evaluated and fallback:
+            remaining = fallback - (time.time() - start)
+            if remaining > 0:
+                time.sleep(remaining)
+            fell_back = True
+
+        self._record(name, time.time() - start, timed_out=True, fell_back=fell_back)
+        return False
+
+
+def format_wait_summary(timings):
+    """최종 통계용 조건별 대기 시간 요약 (총 대기 시간이 긴 순서)"""
+    if not timings:
+        return []
+
+    lines = ["⏱️  조건별 대기 시간:"]
+    for name, entry in sorted(timings.items(), key=lambda item: -item[1]['seconds']):
+        count = entry['count'] or 1
+        line = f"   - {name}: {entry['count']}회, 총 {entry['seconds']:.1f}초 (평균 {entry['seconds'] / count:.2f}초)"
+        if entry['timeouts']:
+            line += f", 타임아웃 {entry['timeouts']}회"
+        if entry['fallbacks']:
+            line += f", 고정 대기 {entry['fallbacks']}회"
+        lines.append(line)
+    return lines
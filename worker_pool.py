@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+멀티 브라우저 워커 풀 (--workers N)
+
+기능:
+- N개의 프로세스가 각자 독립된 Chrome 드라이버를 띄움
+- 엑셀 행은 공유 작업 큐에서 하나씩 가져감 (빨리 끝난 워커가 더 많이 처리)
+- 각 워커는 자기 도구 인스턴스를 가지므로 iframe 캐시 등 상태가 섞이지 않음
+- 워커별 통계 / 실패 목록을 모아 하나의 요약으로 합침
+
+도구 클래스 규약:
+- 생성자: ToolClass(excel_path, **worker_options)
+- process_rows(rows): (행 번호, 행) 목록 처리 (드라이버 준비/정리 포함)
+- stats 딕셔너리, (선택) failed_stores 리스트, (선택) http_pool
+- (선택) download_engine: 호스트별 동시 접속 제한을 워커 수로 나눔 (실행 전체 합계 기준)
+- (선택) rate_limiter: 켜져 있으면 Manager 프로세스의 공유 상태를 생성자 rate_shared 옵션으로 넘겨
+  워커 전체가 같은 요청 속도 토큰 버킷을 씀
+"""
+
+import sys
+import time
+import queue
+import multiprocessing
+
+# Ctrl+C 후 워커가 지금까지의 결과를 보낼 때까지 기다리는 시간(초) - 넘으면 강제 종료
+INTERRUPT_GRACE_SECONDS = 15
+
+
+def add_worker_arguments(parser):
+    """워커 풀 관련 CLI 옵션 추가"""
+    parser.add_argument('--workers', type=int, default=1,
+                        help='동시에 실행할 Chrome 워커(프로세스) 수 (기본: 1)')
+
+
+class _PrefixedWriter:
+    """워커 출력 줄 앞에 [W1] 같은 접두어 추가"""
+
+    def __init__(self, stream, prefix):
+        self.stream = stream
+        self.prefix = prefix
+        self.at_line_start = True
+
+    def write(self, text):
+        for part in text.splitlines(keepends=True):
+            if self.at_line_start and part.strip('\n'):
+                self.stream.write(self.prefix)
+            self.stream.write(part)
+            self.at_line_start = part.endswith('\n')
+        return len(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+def _iter_work_queue(work_queue):
+    """공유 큐에서 행을 하나씩 꺼내는 제너레이터 (None = 종료 신호)"""
+    while True:
+        item = work_queue.get()
+        if item is None:
+            return
+        yield item
+
+
+def _worker_main(worker_id, workers, tool_class, excel_path, worker_options, total, work_queue, result_queue):
+    """워커 프로세스 진입점"""
+    sys.stdout = _PrefixedWriter(sys.stdout, f"[W{worker_id}] ")
+
+    result = {'worker_id': worker_id, 'stats': {}, 'failed_stores': [], 'http_stats': None, 'error': None}
+    try:
+        tool = tool_class(excel_path, **worker_options)
+        tool.stats['total'] = total
+        if getattr(tool, 'download_engine', None):
+            tool.download_engine.split_host_limits(workers)
+        try:
+            tool.process_rows(_iter_work_queue(work_queue))
+        finally:
+            result['stats'] = dict(tool.stats)
+            result['failed_stores'] = list(getattr(tool, 'failed_stores', []))
+            if getattr(tool, 'http_pool', None):
+                result['http_stats'] = tool.http_pool.connection_stats()
+    except Exception as e:
+        result['error'] = str(e)
+    finally:
+        result_queue.put(result)
+        sys.stdout.flush()
+
+
+def merge_stats(target, source):
+    """워커 통계를 합침 (total은 전체 행 수이므로 제외)
+
+    숫자는 더하고 리스트는 이어 붙이고 dict는 재귀로 합침 - 기능 모듈(속도 제한, 체크포인트,
+    요청 차단 등)이 생성자의 stats 인자로 도구의 self.stats 하위 dict를 받아 쓰는 것도
+    워커 결과가 이 함수 하나로 합쳐지도록 하기 위함
+    """
+    for key, value in source.items():
+        if key == 'total':
+            continue
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            target[key] = target.get(key, 0) + value
+        elif isinstance(value, list):
+            target.setdefault(key, []).extend(value)
+        elif isinstance(value, dict):
+            merge_stats(target.setdefault(key, {}), value)
+
+
+def run_parallel(tool, rows, workers, worker_options):
+    """행들을 N개의 워커 프로세스로 나눠 처리하고 결과를 tool에 합침"""
+    rows = list(rows)
+    workers = max(1, min(workers, len(rows)))
+
+    # Windows와 동일하게 spawn 사용 (Chrome/드라이버 상태가 부모에서 복사되지 않도록)
+    ctx = multiprocessing.get_context('spawn')
+    work_queue = ctx.Queue()
+    result_queue = ctx.Queue()
+
+    # 요청 속도 제한은 워커 전체가 하나의 버킷을 공유
+    manager = None
+    limiter = getattr(tool, 'rate_limiter', None)
+    if limiter is not None and limiter.enabled:
+        manager = ctx.Manager()
+        worker_options = dict(worker_options, rate_shared=limiter.share(manager))
+
+    for idx, row in rows:
+        work_queue.put((idx, dict(row)))
+    for _ in range(workers):
+        work_queue.put(None)
+
+    print(f"🧵 워커 {workers}개로 {len(rows)}개 행 병렬 처리 시작\n")
+
+    processes = []
+    for worker_id in range(1, workers + 1):
+        process = ctx.Process(
+            target=_worker_main,
+            args=(worker_id, workers, type(tool), tool.excel_path, worker_options,
+                  tool.stats['total'], work_queue, result_queue),
+            name=f"browser-worker-{worker_id}"
+        )
+        process.start()
+        processes.append(process)
+
+    # 결과 수집 (비정상 종료된 워커가 있어도 멈추지 않도록 타임아웃 루프)
+    results = []
+    interrupted = False
+    while len(results) < workers:
+        try:
+            results.append(result_queue.get(timeout=1))
+        except queue.Empty:
+            if not any(p.is_alive() for p in processes) and result_queue.empty():
+                break
+        except KeyboardInterrupt:
+            print("\n⚠️  중단 요청 - 워커를 멈추고 지금까지의 결과를 모읍니다...")
+            interrupted = True
+            break
+
+    if interrupted:
+        # 워커도 Ctrl+C를 받아 처리 중이던 매장까지의 결과를 보냄 - 정해진 시간 안에 온 결과만 모음
+        deadline = time.time() + INTERRUPT_GRACE_SECONDS
+        while len(results) < workers and time.time() < deadline:
+            try:
+                results.append(result_queue.get(timeout=0.5))
+            except queue.Empty:
+                if not any(p.is_alive() for p in processes) and result_queue.empty():
+                    break
+            except KeyboardInterrupt:
+                break
+
+    for process in processes:
+        process.join(timeout=1 if interrupted else 10)
+        if process.is_alive():
+            process.terminate()
+            process.join(timeout=5)
+
+    if manager is not None:
+        limiter.unshare()
+        manager.shutdown()
+
+    for result in results:
+        merge_stats(tool.stats, result['stats'])
+        if hasattr(tool, 'failed_stores'):
+            tool.failed_stores.extend(result['failed_stores'])
+        if result['http_stats'] and getattr(tool, 'http_pool', None):
+            tool.http_pool.absorb_stats(result['http_stats'])
+        if result['error']:
+            print(f"⚠️  워커 [W{result['worker_id']}] 오류: {result['error']}")
+
+    missing = workers - len(results)
+    if missing:
+        print(f"⚠️  결과를 보내지 못한 워커: {missing}개")
+
+    return results
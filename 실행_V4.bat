@@ -123,8 +123,13 @@ echo.
 echo ⏳ 처리 중... ^(Chrome 창에서 진행 상황 확인 가능^)
 echo.
 
+REM 상주 브라우저 데몬(python browser_daemon.py start)이 실행 중이면 연결해서 Chrome 시작 시간 절약
+set attach_opt=
+python browser_daemon.py status >nul 2>&1
+if %errorlevel% equ 0 set attach_opt=--attach
+
 REM V4 스크립트 실행
-python naver_map_bulk_downloader_v4.py "%excel_file%"
+python naver_map_bulk_downloader_v4.py "%excel_file%" %attach_opt%
 
 if %errorlevel% equ 0 (
     echo.